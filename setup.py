@@ -16,7 +16,7 @@ setup(
     include_package_data=True,
     install_requires=[
         'rich>=13.7.0',
-        'aiohttp>=3.9.1',
+        'aiohttp>=3.12.0',
         'beautifulsoup4>=4.12.2',
         'dnspython>=2.4.2',
         'aiodns>=3.0.0',
@@ -64,6 +64,11 @@ def print_usage():
         "Scan single domain",
         "subsurfer -t vulnweb.com"
     )
+    usage_table.add_row(
+        "subsurfer -l <file>",
+        "Scan multiple domains in one process",
+        "subsurfer -l targets.txt -o results/"
+    )
     usage_table.add_row(
         "subsurfer -t <domain> -o <file>",
         "Save results to file",
@@ -95,9 +100,13 @@ def print_usage():
     # 옵션 추가 (현재 구현된 옵션들만)
     options_table.add_row("-h, --help", "Show this help message")
     options_table.add_row("-t, --target", "Target domain (e.g. vulnweb.com)")
-    options_table.add_row("-o, --output", "Output file to save results")
+    options_table.add_row("-l, --list", "File with target domains, one per line (- for stdin)")
+    options_table.add_row("--batch-concurrency", "Maximum number of targets scanned at once (default: 4)")
+    options_table.add_row("-o, --output", "Output file to save results (directory in batch mode)")
     options_table.add_row("-v, --verbose", "Increase output verbosity (-v, -vv, -vvv)")
     options_table.add_row("-a, --active", "Enable active scanning (default: passive only)")
+    options_table.add_row("-w, --wordlist", "Wordlist for DNS brute force in active mode")
+    options_table.add_row("--dns-concurrency", "Maximum number of DNS queries in flight (default: 200)")
     options_table.add_row("-dp, --default-ports", "Scan default ports")
     options_table.add_row("-fp, --fast-ports", "Scan fast ports (common web ports only)")
     options_table.add_row("-p, --port", "Custom port range (e.g. 1-65535)")
@@ -106,7 +115,24 @@ def print_usage():
     options_table.add_row("-pipeact", "Output webserver + not webserver activate server results for pipeline")
     options_table.add_row("-pipewsub", "Output subdomain webserver host results for pipeline")
     options_table.add_row("-pipejson", "Output all results in JSON format for pipeline")
+    options_table.add_row("--stream", "Print pipeline results as soon as they are confirmed (JSON Lines with -pipejson)")
     options_table.add_row("-to, --takeover", "Subdomain takeover vulnerability detection")
+    options_table.add_row("--fingerprints", "Extra takeover fingerprint JSON file (repeatable)")
+    options_table.add_row("--sources", "Passive sources to use, comma separated (default: all)")
+    options_table.add_row("--exclude-sources", "Passive sources to skip, comma separated")
+    options_table.add_row("--list-sources", "List available passive sources and exit")
+    options_table.add_row("--source-concurrency", "Maximum number of passive sources queried at once (default: 16)")
+    options_table.add_row("--source-timeout", "Timeout in seconds for each passive source (default: 60)")
+    options_table.add_row("--deadline", "Overall passive collection deadline in seconds")
+    options_table.add_row("--analysis-workers", "Processes for Wappalyzer analysis (default: CPU count, 0 = in-process)")
+    options_table.add_row("--rate-limit", "Maximum requests per second to each passive source host (default: 5)")
+    options_table.add_row("--cache-dir", "Directory for cached passive results (default: ~/.cache/subsurfer)")
+    options_table.add_row("--no-cache", "Always query passive sources instead of using cached results")
+    options_table.add_row("--incremental", "Only probe new or expired assets and report changes since the last scan")
+    options_table.add_row("--state-dir", "Directory for the incremental asset store and WebArchive checkpoints (default: ~/.local/state/subsurfer)")
+    options_table.add_row("--probe-ttl", "Hours before an asset is probed again in incremental mode (default: 24)")
+    options_table.add_row("--resolvers", "DNS resolvers, comma separated or a file (default: system resolvers)")
+    options_table.add_row("--no-wildcard-filter", "Do not skip names that only resolve to wildcard DNS answers")
     
     # 출력
     console.print("\n[bold cyan]Description:[/]")
@@ -15,6 +15,13 @@ def create_parser():
     
     parser.add_argument('-t', '--target', 
                       help='Target domain (e.g. example.com)')
+    parser.add_argument('-l', '--list',
+                      help='File with target domains, one per line (use - for stdin)')
+    parser.add_argument('--batch-concurrency',
+                      dest='batch_concurrency',
+                      type=int,
+                      default=4,
+                      help='Maximum number of targets scanned at once in batch mode (default: 4)')
     parser.add_argument('-dp', '--default-ports',
                       dest='default_ports',
                       action='store_true',
@@ -33,8 +40,12 @@ def create_parser():
     parser.add_argument('-to', '--takeover',
                       action='store_true', 
                       help='Verify subdomain takeover')
+    parser.add_argument('--fingerprints',
+                      action='append',
+                      metavar='FILE',
+                      help='Extra takeover fingerprint JSON file, added to the built-in list (repeatable)')
     parser.add_argument('-o', '--output',
-                      help='Output file path')
+                      help='Output file path (output directory in batch mode)')
     parser.add_argument('-pipeweb', action='store_true',
                       help='Output web server results for pipeline')
     parser.add_argument('-pipesub', action='store_true',
@@ -45,9 +56,73 @@ def create_parser():
                       help='Output subdomain webserver host results for pipeline')
     parser.add_argument('-pipejson', action='store_true',
                       help='Output all results in JSON format for pipeline')
+    parser.add_argument('--stream', action='store_true',
+                      help='With a -pipe* option, print each result as soon as it is confirmed (JSON Lines for -pipejson)')
     parser.add_argument('-a', '--active',
                       action='store_true',
                       help='Enable active scanning (default: passive only)')
+    parser.add_argument('-w', '--wordlist',
+                      help='Wordlist for DNS brute force in active mode, one word per line')
+    parser.add_argument('--dns-concurrency',
+                      dest='dns_concurrency',
+                      type=int,
+                      default=200,
+                      help='Maximum number of DNS queries in flight (default: 200)')
+    parser.add_argument('--sources',
+                      help='Passive sources to use, comma separated (e.g. crtsh,webarchive; default: all)')
+    parser.add_argument('--exclude-sources',
+                      dest='exclude_sources',
+                      help='Passive sources to skip, comma separated')
+    parser.add_argument('--list-sources',
+                      dest='list_sources',
+                      action='store_true',
+                      help='List available passive sources and exit')
+    parser.add_argument('--source-concurrency',
+                      dest='source_concurrency',
+                      type=int,
+                      default=16,
+                      help='Maximum number of passive sources queried at once (default: 16)')
+    parser.add_argument('--source-timeout',
+                      dest='source_timeout',
+                      type=float,
+                      default=60.0,
+                      help='Timeout in seconds for each passive source (default: 60)')
+    parser.add_argument('--deadline',
+                      type=float,
+                      help='Overall passive collection deadline in seconds, partial results are kept')
+    parser.add_argument('--analysis-workers',
+                      dest='analysis_workers',
+                      type=int,
+                      help='Number of processes for Wappalyzer analysis (default: CPU count, 0 = analyze in the main process)')
+    parser.add_argument('--rate-limit',
+                      dest='rate_limit',
+                      type=float,
+                      default=5.0,
+                      help='Maximum requests per second to each passive source host (default: 5)')
+    parser.add_argument('--cache-dir',
+                      dest='cache_dir',
+                      help='Directory for cached passive results and fingerprints (default: ~/.cache/subsurfer)')
+    parser.add_argument('--no-cache',
+                      dest='no_cache',
+                      action='store_true',
+                      help='Always query passive sources instead of using cached results')
+    parser.add_argument('--incremental',
+                      action='store_true',
+                      help='Only probe new or expired assets and report changes since the last scan')
+    parser.add_argument('--state-dir',
+                      dest='state_dir',
+                      help='Directory for the incremental asset store and WebArchive checkpoints (default: ~/.local/state/subsurfer)')
+    parser.add_argument('--probe-ttl',
+                      dest='probe_ttl',
+                      type=float,
+                      default=24.0,
+                      help='Hours before an asset is probed again in incremental mode (default: 24)')
+    parser.add_argument('--resolvers',
+                      help='DNS resolvers to use, comma separated or a file with one per line (ip or ip:port)')
+    parser.add_argument('--no-wildcard-filter',
+                      dest='no_wildcard_filter',
+                      action='store_true',
+                      help='Probe names that only resolve to the wildcard DNS answer of their parent domain')
                       
     return parser
 
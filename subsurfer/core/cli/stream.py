@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+파이프라인 모드 스트리밍 출력 모듈
+"""
+
+import json
+import sys
+from typing import Dict, Optional
+
+class StreamPrinter:
+    """
+    파이프라인 모드 결과를 확인되는 즉시 한 줄씩 출력
+
+    전체 스캔이 끝날 때까지 기다리거나 결과를 정렬하지 않고 바로 표준 출력으로
+    내보냅니다. json 모드에서는 JSON Lines 형식을 사용합니다.
+    중복 제거는 파이프라인(컨트롤러의 서브도메인 중복 확인, 웹 스캐너의 호스트별 1회 출력)이
+    담당하므로 출력한 값을 저장하지 않아 메모리 사용량이 결과 수와 무관합니다.
+    """
+
+    def __init__(self, mode: str, target: Optional[str] = None, stream=None):
+        """
+        Args:
+            mode (str): 출력 모드 (web, sub, act, wsub, json)
+            target (str, optional): JSON Lines에 기록할 대상 도메인
+            stream: 출력 스트림 (기본값: sys.stdout)
+        """
+        self.mode = mode
+        self.target = target
+        self.stream = stream
+
+    def _emit(self, kind: str, value: str, extra: Optional[Dict] = None) -> None:
+        """값을 즉시 출력"""
+        if self.mode == "json":
+            record = {'type': kind, 'target': self.target, 'value': value}
+            if extra:
+                record.update(extra)
+            line = json.dumps(record)
+        else:
+            line = value
+        print(line, file=self.stream or sys.stdout, flush=True)
+
+    def subdomain(self, subdomain: str) -> None:
+        """새로 발견된 서브도메인"""
+        if self.mode in ("sub", "json"):
+            self._emit('subdomain', subdomain)
+
+    def web_server(self, subdomain: str) -> None:
+        """웹 서버로 확인된 서브도메인"""
+        if self.mode in ("wsub", "json"):
+            self._emit('web_server', subdomain)
+
+    def url(self, url: str, port: int) -> None:
+        """포트 스캔으로 확인된 웹 URL"""
+        if self.mode in ("web", "json"):
+            self._emit('url', f"{url}:{port}", {'port': port})
+
+    def enabled_service(self, subdomain: str) -> None:
+        """웹 서버는 아니지만 활성화된 서브도메인"""
+        if self.mode in ("act", "json"):
+            self._emit('enabled_service', subdomain)
+
+    def takeover(self, vuln: Dict) -> None:
+        """takeover 취약점이 확인된 서브도메인"""
+        if self.mode == "json":
+            self._emit('vulnerable_takeover', vuln['domain'], {
+                'service': vuln['service'],
+                'cname': vuln['cname']
+            })
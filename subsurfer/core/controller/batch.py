@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+여러 타겟을 하나의 프로세스에서 처리하는 배치 컨트롤러 모듈
+"""
+
+import asyncio
+import sys
+from typing import Any, Awaitable, Callable, Dict, List
+
+from subsurfer.core.cli.cli import console
+from subsurfer.core.controller.controller import SubSurferController
+from subsurfer.core.handler.web.analyzer import FingerprintAnalyzer
+from subsurfer.core.utils.session import SessionManager
+
+def load_targets(path: str) -> List[str]:
+    """
+    타겟 목록 파일 로드
+
+    Args:
+        path (str): 한 줄에 하나의 도메인이 적힌 파일 경로 ('-'이면 표준 입력)
+
+    Returns:
+        List[str]: 중복이 제거된 타겟 목록 (입력 순서 유지)
+    """
+    if path == '-':
+        lines = sys.stdin.read().splitlines()
+    else:
+        with open(path, 'r', encoding='utf-8') as f:
+            lines = f.read().splitlines()
+
+    targets = []
+    seen = set()
+    for line in lines:
+        target = line.strip().lower().rstrip('.')
+        if not target or target.startswith('#') or target in seen:
+            continue
+        seen.add(target)
+        targets.append(target)
+    return targets
+
+class BatchController:
+    """
+    여러 타겟을 공유 워커 풀 위에서 스케줄링하는 컨트롤러
+
+    모든 타겟이 하나의 HTTP 세션(요청 속도 제한과 서킷 브레이커 포함), 핑거프린트 분석
+    프로세스 풀과 전역 세마포어(패시브 소스, DNS, 웹 스캔)를 공유합니다. 타겟별 동시 실행 수도 따로 제한하므로 먼저 시작한
+    타겟이 전역 풀을 독점하지 않고 여러 타겟의 작업이 번갈아 실행됩니다.
+    """
+
+    def __init__(self, targets: List[str], verbose: int = 0, active: bool = False, silent: bool = False,
+                 concurrency: int = 4, source_limit: int = 32, dns_limit: int = 8, web_limit: int = 100,
+                 session_manager: SessionManager = None, **controller_options: Any):
+        """
+        Args:
+            targets (List[str]): 대상 도메인 목록
+            verbose (int): verbose 레벨
+            active (bool): 액티브 스캔 여부
+            silent (bool): 상태 메시지 출력 여부
+            concurrency (int): 동시에 처리할 최대 타겟 수
+            source_limit (int): 전체 타겟에 걸친 패시브 소스 동시 실행 수
+            dns_limit (int): 전체 타겟에 걸친 액티브 DNS 스캐너 동시 실행 수
+            web_limit (int): 전체 타겟에 걸친 웹 스캔 동시 실행 수
+            session_manager (SessionManager): 모든 타겟이 공유할 세션 관리자 (없으면 새로 생성)
+            **controller_options: SubSurferController에 그대로 전달할 옵션
+        """
+        self.targets = targets
+        self.verbose = verbose
+        self.active = active
+        self.silent = silent
+        self.concurrency = max(1, concurrency)
+        self.source_limit = source_limit
+        self.dns_limit = dns_limit
+        self.web_limit = web_limit
+        self.controller_options = controller_options
+        self.session_manager = session_manager or SessionManager()
+        self.source_semaphore = None
+        self.dns_semaphore = None
+        self.web_semaphore = None
+        self.analyzer = None
+
+    def create_controller(self, target: str) -> SubSurferController:
+        """공유 자원을 사용하는 타겟별 컨트롤러 생성"""
+        return SubSurferController(
+            target=target,
+            verbose=self.verbose,
+            active=self.active,
+            silent=self.silent,
+            session_manager=self.session_manager,
+            source_semaphore=self.source_semaphore,
+            dns_semaphore=self.dns_semaphore,
+            web_semaphore=self.web_semaphore,
+            analyzer=self.analyzer,
+            **self.controller_options
+        )
+
+    async def run(self, scan_target: Callable[[SubSurferController], Awaitable[Any]]) -> Dict[str, Any]:
+        """
+        모든 타겟 스캔 실행
+
+        Args:
+            scan_target: 컨트롤러 하나를 받아 타겟 스캔을 수행하는 코루틴 함수
+
+        Returns:
+            Dict[str, Any]: 타겟별 scan_target 반환값
+        """
+        # 이벤트 루프 안에서 공유 풀 생성
+        self.source_semaphore = asyncio.Semaphore(self.source_limit)
+        self.dns_semaphore = asyncio.Semaphore(self.dns_limit)
+        self.web_semaphore = asyncio.Semaphore(self.web_limit)
+        # 모든 타겟이 하나의 분석 프로세스 풀 사용
+        self.analyzer = FingerprintAnalyzer(workers=self.controller_options.get('analysis_workers'))
+
+        queue: asyncio.Queue = asyncio.Queue()
+        for target in self.targets:
+            queue.put_nowait(target)
+
+        results = {}
+
+        async def worker():
+            """큐에서 타겟을 하나씩 꺼내 처리"""
+            while True:
+                try:
+                    target = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                try:
+                    results[target] = await scan_target(self.create_controller(target))
+                except Exception as e:
+                    if not self.silent:
+                        console.print(f"[bold red][-][/] {target} Error during batch scan: {str(e)}")
+                    results[target] = None
+
+        # 세션을 배치 전체에 걸쳐 유지
+        try:
+            async with self.session_manager:
+                workers = [worker() for _ in range(min(self.concurrency, len(self.targets)))]
+                await asyncio.gather(*workers)
+        finally:
+            self.analyzer.close()
+
+        return results
@@ -9,33 +9,106 @@ import asyncio
 from typing import Set, Dict, Any, List
 from datetime import datetime
 import os
+import time
+from urllib.parse import urlsplit
 
 from subsurfer.core.cli.cli import console, print_status
 from subsurfer.core.handler.passive_handler import PassiveHandler
-from subsurfer.core.handler.active_handler import ActiveHandler
-from subsurfer.core.handler.web.web_scanner import WebScanner
-from subsurfer.core.handler.takeover.takeover_handler import TakeoverHandler
+from subsurfer.core.utils.session import SessionManager
+from subsurfer.core.handler.web.analyzer import FingerprintAnalyzer
+from subsurfer.core.utils.resolver import AsyncResolver
+from subsurfer.core.utils.result_cache import ResultCache
+from subsurfer.core.utils.asset_store import AssetStore
+from subsurfer.core.utils.subdomain_index import SubdomainIndex
 
 class SubSurferController:
     """SubSurfer 메인 컨트롤러"""
     
-    def __init__(self, target: str, verbose: int = 0, active: bool = False, silent: bool = False):
+    def __init__(self, target: str, verbose: int = 0, active: bool = False, silent: bool = False,
+                 source_concurrency: int = 16, source_timeout: float = 60.0, deadline: float = None,
+                 session_manager: SessionManager = None, source_semaphore: asyncio.Semaphore = None,
+                 dns_semaphore: asyncio.Semaphore = None, web_semaphore: asyncio.Semaphore = None,
+                 wappalyzer=None, resolver: AsyncResolver = None, resolvers: List[str] = None,
+                 analyzer: FingerprintAnalyzer = None, analysis_workers: int = None,
+                 result_cache: ResultCache = None, asset_store: AssetStore = None,
+                 filter_wildcards: bool = True, wordlist: str = None,
+                 sources: List[str] = None, exclude_sources: List[str] = None,
+                 fingerprint_files: List[str] = None):
         """
         Args:
             target (str): 대상 도메인 (예: example.com)
             verbose (int): verbose 레벨
             active (bool): 액티브 스캔 여부
             silent (bool): 상태 메시지 출력 여부
+            source_concurrency (int): 동시에 실행할 최대 패시브 소스 수
+            source_timeout (float): 패시브 소스별 제한 시간(초)
+            deadline (float): 패시브 수집 전체 제한 시간(초)
+            session_manager (SessionManager): 공유 HTTP 세션 관리자 (여러 컨트롤러 간 공유 가능)
+            source_semaphore (asyncio.Semaphore): 배치 모드 전역 패시브 소스 실행 제한
+            dns_semaphore (asyncio.Semaphore): 배치 모드 전역 액티브 DNS 스캐너 실행 제한
+            web_semaphore (asyncio.Semaphore): 배치 모드 전역 웹 스캔 실행 제한
+            wappalyzer (Wappalyzer): 공유 Wappalyzer 인스턴스 (없으면 첫 분석 시 캐시에서 로드)
+            resolver (AsyncResolver): 공유 비동기 DNS 리졸버
+            resolvers (List[str]): resolver가 없을 때 새로 만들 리졸버의 DNS 서버 목록
+            analyzer (FingerprintAnalyzer): 공유 핑거프린트 분석 프로세스 풀
+            analysis_workers (int): analyzer가 없을 때 웹 스캐너가 생성할 분석 프로세스 수
+            result_cache (ResultCache): 패시브 소스 결과 디스크 캐시 (없으면 캐시 사용 안 함)
+            asset_store (AssetStore): 증분 스캔용 자산 상태 저장소 (지정 시 증분 모드)
+            filter_wildcards (bool): 와일드카드 DNS 응답으로만 해석되는 이름을 웹 스캔에서 제외할지 여부
+            wordlist (str): 액티브 스캔의 DNS 브루트포스 워드리스트 경로
+            sources (List[str]): 사용할 패시브 소스 이름 (없으면 전체)
+            exclude_sources (List[str]): 제외할 패시브 소스 이름
+            fingerprint_files (List[str]): 내장 takeover fingerprint에 추가할 JSON 파일 목록
         """
-        self.target = target
+        self.target = target.lower().rstrip('.')  # 모든 핸들러에 정규화된 대상 도메인 전달
         self.verbose = verbose
         self.active = active
         self.silent = silent
-        self.passive_handler = PassiveHandler(target, silent=silent)
-        self.active_handler = ActiveHandler(target, silent=silent)
-        self.takeover_handler = TakeoverHandler(target, silent=silent)
+        self.session_manager = session_manager or SessionManager()
+        self.resolver = resolver or AsyncResolver(resolvers)
+        self.passive_handler = PassiveHandler(
+            target,
+            silent=silent,
+            concurrency=source_concurrency,
+            source_timeout=source_timeout,
+            deadline=deadline,
+            session_manager=self.session_manager,
+            semaphore=source_semaphore,
+            cache=result_cache,
+            sources=sources,
+            exclude_sources=exclude_sources
+        )
+        self.dns_semaphore = dns_semaphore
+        self.wordlist = wordlist
+        self.fingerprint_files = fingerprint_files
+        self._active_handler = None
+        self._takeover_handler = None
+        self.web_semaphore = web_semaphore
+        self.wappalyzer = wappalyzer
+        self.analyzer = analyzer
+        self.analysis_workers = analysis_workers
+        self.asset_store = asset_store
+        self.filter_wildcards = filter_wildcards
         self.ports = None
         
+    @property
+    def active_handler(self):
+        """액티브 스캔 핸들러 - 액티브 모드에서 처음 사용할 때 import 및 생성"""
+        if self._active_handler is None:
+            from subsurfer.core.handler.active_handler import ActiveHandler
+            self._active_handler = ActiveHandler(self.target, silent=self.silent, semaphore=self.dns_semaphore,
+                                                 resolver=self.resolver, wordlist=self.wordlist)
+        return self._active_handler
+        
+    @property
+    def takeover_handler(self):
+        """Takeover 검사 핸들러 - takeover 검사 시 처음 사용할 때 import 및 생성"""
+        if self._takeover_handler is None:
+            from subsurfer.core.handler.takeover.takeover_handler import TakeoverHandler
+            self._takeover_handler = TakeoverHandler(self.target, silent=self.silent, resolver=self.resolver,
+                                                     fingerprint_files=self.fingerprint_files)
+        return self._takeover_handler
+        
     def get_output_path(self, user_path: str = None) -> str:
         """결과 저장 경로 생성
         
@@ -68,7 +141,7 @@ class SubSurferController:
             with open(output_path, "w", encoding="utf-8") as f:
                 # 서브도메인 목록
                 f.write("SubSurfer - subdomain\n")
-                for subdomain in sorted(results['subdomains']):
+                for subdomain in SubdomainIndex(results['subdomains']):
                     f.write(f"{subdomain}\n")
                 f.write("\n")
                 
@@ -105,22 +178,198 @@ class SubSurferController:
                     f.write("SubSurfer - vulnerable-takeover\n")
                     for vuln in results['vulnerable_takeover']:
                         f.write(f"{vuln['domain']} -> {vuln['service']} (CNAME: {vuln['cname']})\n")
+                    f.write("\n")
+                
+                # 증분 스캔 - 이전 실행과의 차이 (+ 새로 발견, ~ 변경, - 미발견)
+                if results.get('delta'):
+                    f.write("SubSurfer - delta\n")
+                    for prefix, key in (('+', 'new'), ('~', 'changed'), ('-', 'removed')):
+                        for subdomain in results['delta'][key]:
+                            f.write(f"{prefix} {subdomain}\n")
                 
         except Exception as e:
             console.print(f"[bold red][-][/] Error occurred while saving results: {str(e)}")
         
-    async def collect_subdomains(self) -> Set[str]:
-        """서브도메인 수집 실행"""
+    async def collect_subdomains(self, queue: asyncio.Queue = None) -> Set[str]:
+        """
+        서브도메인 수집 실행
+        
+        Args:
+            queue (asyncio.Queue): 발견된 서브도메인을 즉시 넣을 큐 (스트리밍 파이프라인용)
+        """
         if self.active:
             # 액티브와 패시브 스캔 모두 실행
             results = await asyncio.gather(
-                self.passive_handler.collect(),
-                self.active_handler.collect()
+                self.passive_handler.collect(queue),
+                self.active_handler.collect(queue)
             )
             return results[0].union(results[1])
         else:
             # 패시브 스캔만 실행
-            return await self.passive_handler.collect()
+            return await self.passive_handler.collect(queue)
+            
+    async def run_pipeline(self, ports: List[int] = None, takeover: bool = False, printer=None) -> Dict[str, Any]:
+        """
+        수집 → 웹 스캔 → takeover 검사를 단계 구분 없이 스트리밍으로 실행
+        
+        새로 발견된 서브도메인은 수집이 끝나기를 기다리지 않고 바로 웹 스캔과
+        takeover 검사 큐로 전달됩니다. asset_store가 있으면 증분 모드로 실행되어
+        새로 발견되었거나 검사 결과가 만료된 서브도메인만 웹 스캔하고, 나머지는
+        저장된 결과를 사용하며 결과에 이전 실행과의 차이('delta')를 포함합니다.
+        
+        Args:
+            ports (List[int]): 스캔할 포트 목록
+            takeover (bool): takeover 검사 여부
+            printer (StreamPrinter): 결과를 확인 즉시 출력할 스트리밍 출력기
+            
+        Returns:
+            Dict[str, Any]: save_results / print_results 에 사용하는 결과 딕셔너리
+        """
+        discovered = asyncio.Queue()
+        web_queue = asyncio.Queue()
+        takeover_queue = asyncio.Queue() if takeover else None
+        seen = set()
+        
+        # 증분 모드 - 저장된 자산 상태
+        store = self.asset_store
+        known = store.load(self.target) if store else {}
+        ports_key = AssetStore.ports_key(ports)
+        started = time.time()
+        new_subdomains = set()
+        reused = {}  # 저장된 검사 결과를 그대로 사용하는 서브도메인
+        
+        async def produce() -> Set[str]:
+            """수집 후 종료 신호 전달"""
+            try:
+                return await self.collect_subdomains(discovered)
+            finally:
+                discovered.put_nowait(None)
+                
+        async def dispatch():
+            """중복 제거 후 각 단계 큐로 분배"""
+            while True:
+                subdomain = await discovered.get()
+                if subdomain is None:
+                    break
+                if subdomain in seen:
+                    continue
+                seen.add(subdomain)
+                if takeover_queue is not None:
+                    takeover_queue.put_nowait(subdomain)
+                if store:
+                    record = known.get(subdomain)
+                    if record is None:
+                        new_subdomains.add(subdomain)
+                    elif store.is_fresh(record, ports_key, started):
+                        reused[subdomain] = record
+                        continue
+                if printer and (not store or subdomain in new_subdomains):
+                    printer.subdomain(subdomain)
+                web_queue.put_nowait(subdomain)
+            web_queue.put_nowait(None)
+            if takeover_queue is not None:
+                takeover_queue.put_nowait(None)
+                
+        async def scan_web() -> Dict:
+            """웹 서비스 스트리밍 스캔"""
+            from subsurfer.core.handler.web.web_scanner import WebScanner
+            async with WebScanner(self.target, ports, self.verbose, self.silent,
+                                  semaphore=self.web_semaphore, wappalyzer=self.wappalyzer,
+                                  printer=printer, resolver=self.resolver, analyzer=self.analyzer,
+                                  analysis_workers=self.analysis_workers,
+                                  filter_wildcards=self.filter_wildcards) as scanner:
+                return await scanner.scan_stream(web_queue)
+                
+        async def scan_takeover() -> List[Dict]:
+            """takeover 스트리밍 검사"""
+            if takeover_queue is None:
+                return []
+            self.takeover_handler.printer = printer
+            return await self.takeover_handler.scan_stream(takeover_queue)
+            
+        all_subdomains, _, web_services, vulnerable_domains = await asyncio.gather(
+            produce(), dispatch(), scan_web(), scan_takeover()
+        )
+        
+        # 웹 스캔과 겹쳐 실행된 stale 캐시 갱신 마무리
+        await self.passive_handler.wait_refresh()
+        
+        results = {
+            'subdomains': all_subdomains,
+            'web_services': web_services.get('web_services', {}),
+            'web_servers': web_services.get('web_servers', set()),
+            'enabled_services': web_services.get('enabled_services', set()),
+            'all_urls': web_services.get('all_urls', {}),
+            'vulnerable_takeover': vulnerable_domains
+        }
+        if store:
+            self._apply_incremental(results, known, reused, new_subdomains, seen - set(reused), ports_key, started)
+        return results
+        
+    def _apply_incremental(self, results: Dict[str, Any], known: Dict[str, Dict], reused: Dict[str, Dict],
+                           new_subdomains: Set[str], probed: Set[str], ports_key: str, now: float) -> None:
+        """
+        증분 스캔 결과 저장 및 차이 계산
+        
+        다시 검사한 서브도메인의 결과를 저장하고, 저장된 결과를 사용한 서브도메인은
+        결과 딕셔너리에 합친 뒤 results['delta']에 새로 발견(new), 검사 결과 변경(changed),
+        이번 실행에서 발견되지 않음(removed) 목록을 기록합니다. removed는 이전 실행에서 발견되었던
+        서브도메인만 포함하므로 사라진 자산은 한 번만 보고됩니다.
+        """
+        # 이전 실행 시각 - 매 실행마다 발견된 모든 서브도메인의 last_seen이 실행 시각으로 갱신됨
+        previous = max((record['last_seen'] for record in known.values()), default=None)
+        last_run = {subdomain for subdomain, record in known.items() if record['last_seen'] >= previous}
+        
+        addresses = getattr(self.resolver, 'cache', {})
+        records = {
+            subdomain: AssetStore.build_record(subdomain, results, addresses.get(subdomain, []))
+            for subdomain in probed
+        }
+        changed = {
+            subdomain for subdomain, record in records.items()
+            if subdomain in known and known[subdomain].get('last_probed') is not None
+            and AssetStore.has_changed(known[subdomain], record)
+        }
+        self.asset_store.save(self.target, set(results['subdomains']) | probed, records, ports_key, now)
+        
+        # 저장된 검사 결과 합치기
+        for subdomain, record in reused.items():
+            if record['web']:
+                results['web_servers'].add(subdomain)
+            if record['enabled']:
+                results['enabled_services'].add(subdomain)
+            if record['urls']:
+                results['all_urls'][subdomain] = list(record['urls'])
+            results['web_services'].update(record['services'])
+            
+        results['delta'] = {
+            'new': sorted(new_subdomains),
+            'changed': sorted(changed),
+            'removed': sorted(last_run - set(results['subdomains']) - probed)
+        }
+        
+    def delta_view(self, results_dict: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        증분 스캔 결과에서 새로 발견되었거나 변경된 자산만 남긴 결과 딕셔너리
+        
+        파이프라인 모드에서 이전 실행과의 차이만 출력할 때 사용합니다.
+        """
+        delta = results_dict.get('delta')
+        if delta is None:
+            return results_dict
+        assets = set(delta['new']) | set(delta['changed'])
+        return {
+            'subdomains': set(delta['new']),
+            'web_services': {
+                url: analysis for url, analysis in results_dict['web_services'].items()
+                if urlsplit(url).hostname in assets
+            },
+            'web_servers': results_dict['web_servers'] & assets,
+            'enabled_services': results_dict['enabled_services'] & assets,
+            'all_urls': {k: v for k, v in results_dict['all_urls'].items() if k in assets},
+            'vulnerable_takeover': results_dict.get('vulnerable_takeover', []),
+            'delta': delta
+        }
         
     def print_results(self, results_dict: Dict, output_mode: str = None, output_path: str = None) -> None:
         """결과 출력"""
@@ -146,7 +395,7 @@ class SubSurferController:
                             
             elif output_mode == "sub":
                 # 서브도메인 결과만 출력
-                for subdomain in sorted(results_dict['subdomains']):
+                for subdomain in SubdomainIndex(results_dict['subdomains']):
                     print(subdomain)
                 
             elif output_mode == "act":
@@ -170,7 +419,7 @@ class SubSurferController:
         # 서브도메인 목록 출력
         if results_dict['subdomains']:
             print_status("Subdomains Discovered:", "info")
-            for subdomain in sorted(results_dict['subdomains']):
+            for subdomain in SubdomainIndex(results_dict['subdomains']):
                 console.print(f"[cyan]{subdomain}[/]")
         
         # 웹 서버 목록 출력
@@ -202,6 +451,21 @@ class SubSurferController:
             for service in sorted(results_dict['enabled_services']):
                 console.print(f"[cyan]{service}[/]")
         
+        # 증분 스캔 - 이전 실행과의 차이 출력
+        delta = results_dict.get('delta')
+        if delta:
+            print("")
+            print_status(
+                f"Changes since last scan: {len(delta['new'])} new, {len(delta['changed'])} changed, "
+                f"{len(delta['removed'])} not seen", "info"
+            )
+            for subdomain in delta['new']:
+                console.print(f"[green]+ {subdomain}[/]")
+            for subdomain in delta['changed']:
+                console.print(f"[yellow]~ {subdomain}[/]")
+            for subdomain in delta['removed']:
+                console.print(f"[red]- {subdomain}[/]")
+        
         if output_path:
             print("")
             print_status(f"Path where results are saved: {output_path}", "success")
@@ -216,7 +480,12 @@ class SubSurferController:
         
     async def scan_web_services(self, subdomains: Set[str], ports: List[int] = None) -> Dict:
         """웹 서비스 스캔"""
-        async with WebScanner(self.target, ports, self.verbose, self.silent) as scanner:
+        from subsurfer.core.handler.web.web_scanner import WebScanner
+        async with WebScanner(self.target, ports, self.verbose, self.silent,
+                              semaphore=self.web_semaphore, wappalyzer=self.wappalyzer,
+                              resolver=self.resolver, analyzer=self.analyzer,
+                              analysis_workers=self.analysis_workers,
+                              filter_wildcards=self.filter_wildcards) as scanner:
             return await scanner.scan(subdomains)
     
     async def scan_takeover(self, subdomains: Set[str]) -> List[Dict]:
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+DNS 브루트포스 스캐너 모듈 - 워드리스트 기반 서브도메인 수집
+"""
+
+import asyncio
+from typing import Iterator, Optional, Set
+from rich.console import Console
+from subsurfer.core.utils.hostname import normalize_hostname
+from subsurfer.core.utils.resolver import AsyncResolver
+from subsurfer.core.utils.wildcard import WildcardFilter
+
+console = Console()
+
+class BruteForceScanner:
+    """DNS 브루트포스 스캐너 클래스"""
+
+    def __init__(self, domain: str, silent: bool = False, resolver: AsyncResolver = None,
+                 wordlist: Optional[str] = None, window: Optional[int] = None,
+                 wildcard_filter: Optional[WildcardFilter] = None):
+        """
+        Args:
+            domain (str): 대상 도메인
+            silent (bool): 상태 메시지 출력 여부
+            resolver (AsyncResolver): 공유 비동기 DNS 리졸버 (리졸버 목록 순환, 타임아웃 재시도 포함)
+            wordlist (str, optional): 한 줄에 단어 하나씩 적힌 워드리스트 파일 경로
+            window (int, optional): 동시에 진행할 최대 질의 수 (기본값: 리졸버 동시 조회 수)
+            wildcard_filter (WildcardFilter, optional): 와일드카드 필터 (없으면 새로 생성)
+        """
+        self.domain = domain.lower().rstrip('.')  # 후보 이름과 같은 형식으로 비교
+        self.silent = silent
+        self.subdomains = set()
+        self.resolver = resolver or AsyncResolver()
+        self.wordlist = wordlist
+        self.window = max(1, window or self.resolver.concurrency)
+        self.wildcard_filter = wildcard_filter or WildcardFilter(self.resolver, domain)
+        self.queue: Optional[asyncio.Queue] = None  # 지정 시 발견 즉시 전달
+        self.attempted = 0
+        self.wildcard_skipped = 0
+
+    def _candidates(self) -> Iterator[str]:
+        """워드리스트를 한 줄씩 읽어 후보 이름 생성 (파일 전체를 메모리에 올리지 않음)"""
+        with open(self.wordlist, 'r', encoding='utf-8', errors='ignore') as f:
+            for line in f:
+                word = line.split('#', 1)[0].strip()
+                if not word:
+                    continue
+                name = normalize_hostname(f"{word}.{self.domain}", self.domain)
+                if name and name != self.domain:
+                    yield name
+
+    async def _check(self, name: str) -> None:
+        """후보 이름 하나 조회"""
+        addresses = await self.resolver.query(name, 'A')
+        if not addresses:
+            addresses = await self.resolver.query(name, 'AAAA')
+        if not addresses:
+            return
+        if await self.wildcard_filter.is_wildcard(name, addresses):
+            self.wildcard_skipped += 1
+            return
+        # 웹 스캔 단계가 같은 이름을 다시 조회하지 않도록 리졸버 캐시에 저장
+        self.resolver.remember(name, addresses)
+        self.subdomains.add(name)
+        if self.queue is not None:
+            self.queue.put_nowait(name)
+
+    async def scan(self) -> Set[str]:
+        """
+        브루트포스 스캔 수행
+
+        window개의 워커가 하나의 워드리스트 이터레이터를 공유하므로 진행 중인
+        질의 수와 메모리 사용량은 워드리스트 크기와 무관하게 일정합니다.
+
+        Returns:
+            Set[str]: 발견된 서브도메인 목록
+        """
+        if not self.wordlist:
+            return set()
+
+        try:
+            # 와일드카드 응답을 먼저 확인해 두면 워커들이 확인 결과를 기다리지 않음
+            await self.wildcard_filter.wildcard_answers(self.domain)
+            candidates = self._candidates()
+
+            async def worker():
+                """남은 후보를 차례로 조회"""
+                for name in candidates:
+                    self.attempted += 1
+                    await self._check(name)
+
+            await asyncio.gather(*(worker() for _ in range(self.window)))
+
+            if self.wildcard_skipped and not self.silent:
+                console.print(f"[bold yellow][!][/] Brute force: {self.wildcard_skipped} names matched wildcard DNS, skipped")
+            return self.subdomains
+
+        except Exception as e:
+            if not self.silent:
+                console.print(f"[bold red][-][/] Error in brute force scan: {str(e)}")
+            return set()
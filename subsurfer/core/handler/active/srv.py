@@ -6,24 +6,26 @@ SRV 스캐너 모듈 - SRV 레코드를 통한 서브도메인 수집
 """
 
 import asyncio
-import dns.resolver
 from typing import Set
 from rich.console import Console
+from subsurfer.core.utils.resolver import AsyncResolver
 
 console = Console()
 
 class SRVScanner:
     """SRV 스캐너 클래스"""
     
-    def __init__(self, domain: str, silent: bool = False):
+    def __init__(self, domain: str, silent: bool = False, resolver: AsyncResolver = None):
         """
         Args:
             domain (str): 대상 도메인
             silent (bool): 상태 메시지 출력 여부
+            resolver (AsyncResolver): 공유 비동기 DNS 리졸버 (없으면 새로 생성)
         """
         self.domain = domain
         self.silent = silent
         self.subdomains = set()
+        self.resolver = resolver or AsyncResolver()
         
         # SRV 레코드 목록
         self.srv_records = [
@@ -45,15 +47,16 @@ class SRVScanner:
             Set[str]: 발견된 서브도메인 목록
         """
         try:
-            for service in self.srv_records:
-                try:
-                    answers = dns.resolver.resolve(f"_{service}._tcp.{self.domain}", 'SRV')
-                    for rdata in answers:
-                        target = str(rdata.target).rstrip('.')
-                        if target.endswith(self.domain):
-                            self.subdomains.add(target)
-                except:
-                    continue
+            # 모든 서비스 레이블을 동시에 조회
+            answers = await asyncio.gather(
+                *(self.resolver.query(f"{service}.{self.domain}", 'SRV') for service in self.srv_records)
+            )
+            for records in answers:
+                for record in records:
+                    # "priority weight port target" 형식
+                    target = record.split()[-1].rstrip('.')
+                    if target == self.domain or target.endswith(f".{self.domain}"):
+                        self.subdomains.add(target)
             return self.subdomains
             
         except Exception as e:
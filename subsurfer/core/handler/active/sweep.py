@@ -6,25 +6,27 @@ Sweep 스캐너 모듈 - 리버스 DNS 스캔을 통한 서브도메인 수집
 """
 
 import asyncio
-import dns.resolver
-import ipaddress
+import dns.reversename
 from typing import Set
 from rich.console import Console
+from subsurfer.core.utils.resolver import AsyncResolver
 
 console = Console()
 
 class SweepScanner:
     """Sweep 스캐너 클래스"""
     
-    def __init__(self, domain: str, silent: bool = False):
+    def __init__(self, domain: str, silent: bool = False, resolver: AsyncResolver = None):
         """
         Args:
             domain (str): 대상 도메인
             silent (bool): 상태 메시지 출력 여부
+            resolver (AsyncResolver): 공유 비동기 DNS 리졸버 (없으면 새로 생성)
         """
         self.domain = domain
         self.silent = silent
         self.subdomains = set()
+        self.resolver = resolver or AsyncResolver()
 
     async def reverse_lookup(self, ip: str) -> Set[str]:
         """
@@ -37,10 +39,9 @@ class SweepScanner:
             Set[str]: 발견된 서브도메인 목록
         """
         try:
-            answers = dns.resolver.resolve_address(ip)
+            answers = await self.resolver.query(dns.reversename.from_address(ip).to_text(), 'PTR')
             domains = set()
-            for rdata in answers:
-                name = str(rdata.target).rstrip('.')
+            for name in answers:
                 if name.endswith(self.domain):
                     domains.add(name)
             return domains
@@ -55,21 +56,14 @@ class SweepScanner:
             Set[str]: IP 주소 목록
         """
         try:
+            # A / AAAA 레코드 동시 조회
+            answers = await asyncio.gather(
+                self.resolver.query(self.domain, 'A'),
+                self.resolver.query(self.domain, 'AAAA')
+            )
             ips = set()
-            # A 레코드 조회
-            try:
-                answers = dns.resolver.resolve(self.domain, 'A')
-                ips.update([str(rdata) for rdata in answers])
-            except:
-                pass
-                
-            # AAAA 레코드 조회
-            try:
-                answers = dns.resolver.resolve(self.domain, 'AAAA') 
-                ips.update([str(rdata) for rdata in answers])
-            except:
-                pass
-                
+            for records in answers:
+                ips.update(records)
             return ips
         except:
             return set()
@@ -84,13 +78,11 @@ class SweepScanner:
         try:
             # IP 범위 결정 및 리버스 DNS 조회
             ips = await self.get_domain_ips()
-            for ip in ips:
-                try:
-                    hostname = await self.reverse_lookup(ip)
-                    if hostname and hostname.endswith(f".{self.domain}"):
+            hostnames = await asyncio.gather(*(self.reverse_lookup(ip) for ip in ips))
+            for names in hostnames:
+                for hostname in names:
+                    if hostname.endswith(f".{self.domain}"):
                         self.subdomains.add(hostname)
-                except:
-                    continue
             return self.subdomains
             
         except Exception as e:
@@ -6,47 +6,45 @@ DNS 스캐너 모듈 - DNS 존 전송 및 워킹을 통한 서브도메인 수
 """
 
 import asyncio
-import dns.resolver
+import dns.asyncquery
 import dns.zone
 from typing import Set, List
 from rich.console import Console
+from subsurfer.core.utils.resolver import AsyncResolver
 
 console = Console()
 
 class ZoneScanner:
     """DNS 스캐너 클래스"""
     
-    def __init__(self, domain: str, silent: bool = False):
+    def __init__(self, domain: str, silent: bool = False, resolver: AsyncResolver = None, timeout: float = 10.0):
         """
         Args:
             domain (str): 대상 도메인
             silent (bool): 상태 메시지 출력 여부
+            resolver (AsyncResolver): 공유 비동기 DNS 리졸버 (없으면 새로 생성)
+            timeout (float): 네임서버별 존 전송 제한 시간(초)
         """
         self.domain = domain
         self.silent = silent
         self.subdomains = set()
+        self.resolver = resolver or AsyncResolver()
+        self.timeout = timeout
         
     async def get_nameservers(self) -> List[str]:
         """도메인의 네임서버 주소 조회"""
         try:
-            ns_records = dns.resolver.resolve(self.domain, 'NS')
-            nameservers = []
+            ns_records = await self.resolver.query(self.domain, 'NS')
             
-            for ns in ns_records:
-                # A 레코드로 IP 주소 조회
-                try:
-                    answers = dns.resolver.resolve(str(ns.target), 'A')
-                    nameservers.extend([str(rdata) for rdata in answers])
-                except:
-                    pass
-                    
-                # AAAA 레코드로 IPv6 주소 조회    
-                try:
-                    answers = dns.resolver.resolve(str(ns.target), 'AAAA')
-                    nameservers.extend([str(rdata) for rdata in answers])
-                except:
-                    pass
-                    
+            # 네임서버별 A / AAAA 레코드 동시 조회
+            answers = await asyncio.gather(*(
+                self.resolver.query(ns, rdtype)
+                for ns in ns_records
+                for rdtype in ('A', 'AAAA')
+            ))
+            nameservers = []
+            for records in answers:
+                nameservers.extend(records)
             return nameservers
             
         except Exception as e:
@@ -62,31 +60,25 @@ class ZoneScanner:
             nameserver (str): 네임서버 IP 주소
         """
         try:
-            zone = dns.zone.from_xfr(dns.query.xfr(nameserver, self.domain))
-            for name, node in zone.nodes.items():
-                subdomain = str(name) + '.' + self.domain
-                if subdomain.startswith('@'):
-                    subdomain = self.domain
-                self.subdomains.add(subdomain)
+            zone = dns.zone.Zone(self.domain)
+            await dns.asyncquery.inbound_xfr(nameserver, zone, timeout=self.timeout, lifetime=self.timeout)
+            for name in zone.nodes.keys():
+                subdomain = name.to_text()
+                if subdomain != '@':  # @ 레코드 제외
+                    self.subdomains.add(f"{subdomain.rstrip('.')}.{self.domain}")
         except:
             pass
             
     async def scan(self) -> Set[str]:
         """
-        DNS 스캔 수행 - 존 전송 및 워킹
+        DNS 스캔 수행 - 모든 네임서버에 존 전송 동시 시도
         
         Returns:
             Set[str]: 발견된 서브도메인 목록
         """
         try:
-            # Zone Transfer 시도
-            answers = dns.zone.from_xfr(dns.query.xfr(self.nameserver, self.domain))
-            for name, node in answers.nodes.items():
-                subdomain = str(name)
-                if subdomain != '@':  # @ 레코드 제외
-                    if subdomain.endswith('.'):
-                        subdomain = subdomain[:-1]
-                    self.subdomains.add(f"{subdomain}.{self.domain}")
+            nameservers = await self.get_nameservers()
+            await asyncio.gather(*(self.zone_transfer(ns) for ns in nameservers))
             return self.subdomains
             
         except Exception as e:
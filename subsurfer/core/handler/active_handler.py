@@ -17,49 +17,78 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(
 from subsurfer.core.handler.active.zone import ZoneScanner
 from subsurfer.core.handler.active.srv import SRVScanner 
 from subsurfer.core.handler.active.sweep import SweepScanner
+from subsurfer.core.handler.active.bruteforce import BruteForceScanner
+from subsurfer.core.utils.resolver import AsyncResolver
 
 console = Console()
 
 class ActiveHandler:
     """액티브 서브도메인 수집을 처리하는 핸들러 클래스"""
     
-    def __init__(self, target: str, silent: bool = False):
+    def __init__(self, target: str, silent: bool = False, semaphore: asyncio.Semaphore = None,
+                 resolver: AsyncResolver = None, wordlist: str = None):
         """
         Args:
             target (str): 대상 도메인 (예: example.com)
             silent (bool): 상태 메시지 출력 여부
+            semaphore (asyncio.Semaphore): 여러 핸들러가 공유하는 전역 DNS 스캐너 실행 제한
+            resolver (AsyncResolver): 스캐너들이 공유하는 비동기 DNS 리졸버
+            wordlist (str): DNS 브루트포스에 사용할 워드리스트 파일 경로 (없으면 브루트포스 생략)
         """
-        self.domain = target
+        self.domain = target.lower().rstrip('.')
         self.silent = silent
         self.subdomains = set()
+        self.shared_semaphore = semaphore
+        self.resolver = resolver or AsyncResolver()
+        self.wordlist = wordlist
         
-    async def collect(self) -> Set[str]:
-        """서브도메인 수집 실행"""
+    async def collect(self, queue: asyncio.Queue = None) -> Set[str]:
+        """
+        서브도메인 수집 실행
+        
+        Args:
+            queue (asyncio.Queue): 스캐너별 결과를 완료 즉시 넣을 큐
+        """
         try:
             # 모든 스캐너 초기화
             scanners = [
-                ('DNS Zone', ZoneScanner(self.domain, self.silent)),
-                ('SRV Record', SRVScanner(self.domain, self.silent)),
-                ('Reverse DNS Sweep', SweepScanner(self.domain, self.silent))
+                ('DNS Zone', ZoneScanner(self.domain, self.silent, resolver=self.resolver)),
+                ('SRV Record', SRVScanner(self.domain, self.silent, resolver=self.resolver)),
+                ('Reverse DNS Sweep', SweepScanner(self.domain, self.silent, resolver=self.resolver))
             ]
+            if self.wordlist:
+                brute_force = BruteForceScanner(self.domain, self.silent, resolver=self.resolver, wordlist=self.wordlist)
+                # 오래 걸리는 스캐너이므로 발견 즉시 다음 단계로 전달
+                brute_force.queue = queue
+                scanners.append(('DNS Brute Force', brute_force))
             
             # 동시 실행할 최대 작업 수 제한
             semaphore = asyncio.Semaphore(2)  # DNS 쿼리이므로 2개로 제한
             
+            async def run_scanner(name: str, scanner) -> Set[str]:
+                """스캐너 실행"""
+                try:
+                    if not self.silent:
+                        console.print(f"[bold blue][*][/] [white]{name} Start Scan...[/]")
+                    results = await scanner.scan()
+                    if not self.silent:
+                        console.print(f"[bold green][+][/] [white]{name} Scan completed: {len(results)} found[/]")
+                    if queue is not None and getattr(scanner, 'queue', None) is None:
+                        for subdomain in results:
+                            queue.put_nowait(subdomain)
+                    return results
+                except Exception as e:
+                    if not self.silent:
+                        console.print(f"[bold red][-][/] [white]{name} An error occurred while scanning: {str(e)}[/]")
+                    return set()
+            
             async def run_scanner_with_semaphore(name: str, scanner) -> Set[str]:
                 """semaphore thread handle"""
                 async with semaphore:
-                    try:
-                        if not self.silent:
-                            console.print(f"[bold blue][*][/] [white]{name} Start Scan...[/]")
-                        results = await scanner.scan()
-                        if not self.silent:
-                            console.print(f"[bold green][+][/] [white]{name} Scan completed: {len(results)} found[/]")
-                        return results
-                    except Exception as e:
-                        if not self.silent:
-                            console.print(f"[bold red][-][/] [white]{name} An error occurred while scanning: {str(e)}[/]")
-                        return set()
+                    if self.shared_semaphore is None:
+                        return await run_scanner(name, scanner)
+                    async with self.shared_semaphore:
+                        return await run_scanner(name, scanner)
 
             # 모든 스캐너 동시 실행
             tasks = [run_scanner_with_semaphore(name, scanner) for name, scanner in scanners]
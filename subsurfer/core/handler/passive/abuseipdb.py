@@ -1,9 +1,9 @@
 import requests
 from bs4 import BeautifulSoup
 import re
-import aiohttp
 from typing import Set
 from rich.console import Console
+from subsurfer.core.utils.session import borrow_session
 
 console = Console()
 
@@ -15,13 +15,14 @@ class AbuseIPDBScanner:
             'user-agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
         }
         self.silent = silent
+        self.session = None
 
     async def scan(self) -> Set[str]:
         """서브도메인 스캔"""
         try:
             url = f'https://www.abuseipdb.com/whois/{self.domain}'
             
-            async with aiohttp.ClientSession() as session:
+            async with borrow_session(self.session) as session:
                 async with session.get(url, headers=self.headers, ssl=False) as response:
                     text = await response.text()
                     
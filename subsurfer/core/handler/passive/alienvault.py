@@ -5,9 +5,9 @@
 AlienVault API를 사용하여 서브도메인을 수집하는 스캐너 모듈
 """
 
-import aiohttp
 from typing import Set
 from rich.console import Console
+from subsurfer.core.utils.session import borrow_session
 
 console = Console()
 
@@ -24,6 +24,7 @@ class AlienVaultScanner:
         self.base_url = "https://otx.alienvault.com/api/v1/indicators/domain"
         self.subdomains = set()
         self.silent = silent
+        self.session = None
         
     async def scan(self) -> Set[str]:
         """
@@ -35,7 +36,7 @@ class AlienVaultScanner:
         try:
             url = f"{self.base_url}/{self.domain}/passive_dns"
             
-            async with aiohttp.ClientSession() as session:
+            async with borrow_session(self.session) as session:
                 async with session.get(url, ssl=False) as response:
                     if response.status != 200:
                         return set()
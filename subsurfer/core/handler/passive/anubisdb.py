@@ -5,8 +5,8 @@
 AnubisDB API를 사용하여 서브도메인을 수집하는 스캐너 모듈
 """
 
-import aiohttp
 from typing import Set
+from subsurfer.core.utils.session import borrow_session
 
 class AnubisDBScanner:
     """AnubisDB API를 통한 서브도메인 스캐너"""
@@ -20,10 +20,11 @@ class AnubisDBScanner:
         self.base_url = "https://jonlu.ca/anubis/subdomains"
         self.subdomains = set()
         self.silent = silent
+        self.session = None
         
     async def request(self, url: str) -> dict:
         """비동기 HTTP 요청 수행"""
-        async with aiohttp.ClientSession() as session:
+        async with borrow_session(self.session) as session:
             async with session.get(url, ssl=False) as response:
                 if response.status == 200:
                     return await response.json()
@@ -1,11 +1,11 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
-import aiohttp
 from typing import Set
 import os
 import yaml
 import json
+from subsurfer.core.utils.session import borrow_session
 
 class BufferOverScanner:
     """BufferOver API를 사용한 서브도메인 스캐너"""
@@ -16,6 +16,7 @@ class BufferOverScanner:
         self.subdomains = set()
         self.api_key = self._load_api_key()
         self.silent = silent
+        self.session = None
         
     def _load_api_key(self) -> str:
         """config.yaml에서 API 키 로드"""
@@ -34,7 +35,7 @@ class BufferOverScanner:
             'x-api-key': self.api_key
         }
         
-        async with aiohttp.ClientSession() as session:
+        async with borrow_session(self.session) as session:
             async with session.get(url, headers=headers) as response:
                 response_text = await response.text()
                 
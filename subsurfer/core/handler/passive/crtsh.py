@@ -1,43 +1,44 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
-import aiohttp
-from typing import Set
+from typing import AsyncIterator, Set
+from subsurfer.core.utils.hostname import normalize_hostname, split_names
+from subsurfer.core.utils.session import borrow_session
+from subsurfer.core.utils.stream_parse import CHUNK_SIZE, iter_json_array
 
 class CrtshScanner:
     """Certificate Transparency logs scanner using crt.sh"""
     
     def __init__(self, domain: str, silent: bool = False):
-        self.domain = domain
+        # 결과 이름은 소문자로 정규화되므로 도메인도 소문자로 비교
+        self.domain = domain.lower().rstrip('.')
         self.base_url = "https://crt.sh"
         self.subdomains = set()
         self.silent = silent
+        self.session = None
         
-    async def request(self, url: str) -> dict:
-        """비동기 HTTP 요청 수행"""
-        async with aiohttp.ClientSession() as session:
+    async def request(self, url: str) -> AsyncIterator[dict]:
+        """비동기 HTTP 요청 수행 - 응답 배열의 항목을 도착하는 대로 반환"""
+        async with borrow_session(self.session) as session:
             async with session.get(url) as response:
-                if response.status == 200:
-                    return await response.json()
-                return {}
+                if response.status != 200:
+                    return
+                async for entry in iter_json_array(response.content.iter_chunked(CHUNK_SIZE)):
+                    yield entry
         
     async def scan(self) -> Set[str]:
         """Scan crt.sh for subdomains"""
         try:
             url = f"{self.base_url}/?q=%.{self.domain}&output=json"
             
-            data = await self.request(url)
-            if not data:
-                return set()
-                
-            for entry in data:
+            async for entry in self.request(url):
                 try:
-                    name = entry.get('name_value', '')
-                    # Handle wildcard certs
-                    if '*' in name:
-                        continue
-                    if name.endswith(f".{self.domain}"):
-                        self.subdomains.add(name.lower())
+                    # name_value에는 인증서의 모든 SAN이 한 줄에 하나씩 들어 있음
+                    # (와일드카드 이름은 기본 이름으로 저장)
+                    for name in split_names(entry.get('name_value', '')):
+                        hostname = normalize_hostname(name, self.domain)
+                        if hostname and hostname != self.domain:
+                            self.subdomains.add(hostname)
                 except:
                     continue
                     
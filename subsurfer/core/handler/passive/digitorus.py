@@ -5,10 +5,10 @@
 Digitorus API를 사용하여 서브도메인을 수집하는 스캐너 모듈
 """
 
-import aiohttp
 from typing import Set
 from bs4 import BeautifulSoup
 from rich.console import Console
+from subsurfer.core.utils.session import borrow_session
 
 console = Console()
 
@@ -24,10 +24,11 @@ class DigitorusScanner:
         self.base_url = "https://certificatedetails.com"
         self.subdomains = set()
         self.silent = silent
+        self.session = None
         
     async def request(self, url: str) -> str:
         """비동기 HTTP 요청 수행"""
-        async with aiohttp.ClientSession() as session:
+        async with borrow_session(self.session) as session:
             async with session.get(url, ssl=False) as response:
                 if response.status == 200:
                     return await response.text()
@@ -5,11 +5,11 @@
 DNS Archive를 사용하여 서브도메인을 수집하는 스캐너 모듈
 """
 
-import aiohttp
 from typing import Set
 from rich.console import Console
 from bs4 import BeautifulSoup
 import re
+from subsurfer.core.utils.session import borrow_session
 
 console = Console()
 
@@ -25,6 +25,7 @@ class DNSArchiveScanner:
         self.base_url = "https://dnsarchive.net/search"
         self.subdomains = set()
         self.silent = silent
+        self.session = None
         
     async def scan(self) -> Set[str]:
         """
@@ -38,7 +39,7 @@ class DNSArchiveScanner:
                 'q': self.domain
             }
             
-            async with aiohttp.ClientSession() as session:
+            async with borrow_session(self.session) as session:
                 async with session.get(self.base_url, params=params, ssl=False) as response:
                     if response.status != 200:
                         return set()
@@ -5,10 +5,10 @@
 FreecampDev API를 사용하여 서브도메인을 수집하는 스캐너 모듈
 """
 
-import aiohttp
 import json
 from typing import Set
 from rich.console import Console
+from subsurfer.core.utils.session import borrow_session
 
 console = Console()
 
@@ -25,6 +25,7 @@ class FreecampDevScanner:
         self.base_url = "https://freecamp.dev/api/tools/network/subdomains/"
         self.subdomains = set()
         self.silent = silent
+        self.session = None
         
     async def scan(self) -> Set[str]:
         """
@@ -37,7 +38,7 @@ class FreecampDevScanner:
             # POST 요청 데이터
             data = {"domain": self.domain}
             
-            async with aiohttp.ClientSession() as session:
+            async with borrow_session(self.session) as session:
                 async with session.post(self.base_url, data=data, ssl=False) as response:
                     if response.status != 200:
                         if not self.silent:
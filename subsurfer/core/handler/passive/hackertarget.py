@@ -5,9 +5,9 @@
 HackerTarget API를 사용하여 서브도메인을 수집하는 스캐너 모듈
 """
 
-import aiohttp
 from typing import Set
 from rich.console import Console
+from subsurfer.core.utils.session import borrow_session
 
 console = Console()
 
@@ -23,6 +23,7 @@ class HackerTargetScanner:
         self.base_url = "https://api.hackertarget.com/hostsearch"
         self.subdomains = set()
         self.silent = silent
+        self.session = None
         
     async def scan(self) -> Set[str]:
         """
@@ -34,7 +35,7 @@ class HackerTargetScanner:
         try:
             params = {'q': self.domain}
             
-            async with aiohttp.ClientSession() as session:
+            async with borrow_session(self.session) as session:
                 async with session.get(self.base_url, params=params, ssl=False) as response:
                     if response.status != 200:
                         return set()
@@ -1,9 +1,9 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
-import aiohttp
 from typing import Set
 from rich.console import Console
+from subsurfer.core.utils.session import borrow_session
 
 console = Console()
 
@@ -15,6 +15,7 @@ class MerkleMapScanner:
         self.base_url = "https://api.merklemap.com/v1-webui/search-noauth"
         self.subdomains = set()
         self.silent = silent
+        self.session = None
         
     async def scan(self) -> Set[str]:
         try:
@@ -30,7 +31,7 @@ class MerkleMapScanner:
                 "Referer": "https://www.merklemap.com/"
             }
             
-            async with aiohttp.ClientSession() as session:
+            async with borrow_session(self.session) as session:
                 async with session.get(self.base_url, params=params, headers=headers, ssl=False) as response:
                     if response.status != 200:
                         return set()
@@ -5,10 +5,10 @@
 MySSL API를 사용하여 서브도메인을 수집하는 스캐너 모듈
 """
 
-import aiohttp
 import random
 from typing import Set
 from rich.console import Console
+from subsurfer.core.utils.session import borrow_session
 
 console = Console()
 
@@ -37,6 +37,7 @@ class MySSLScanner:
         self.base_url = "https://myssl.com/api/v1/discover_sub_domain"
         self.subdomains = set()
         self.silent = silent
+        self.session = None
         
     def get_random_user_agent(self) -> str:
         """랜덤 User-Agent 반환"""
@@ -55,7 +56,7 @@ class MySSLScanner:
                 "User-Agent": self.get_random_user_agent()
             }
             
-            async with aiohttp.ClientSession() as session:
+            async with borrow_session(self.session) as session:
                 async with session.get(self.base_url, params=params, headers=headers, ssl=False) as response:
                     if response.status != 200:
                         return set()
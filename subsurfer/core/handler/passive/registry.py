@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+패시브 소스 레지스트리 모듈 - 소스 목록 선언 및 지연 로딩
+"""
+
+import importlib
+import re
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# 내장 소스 목록 (이름 → "모듈:클래스"), 선택된 소스의 모듈만 import
+SOURCES: Dict[str, str] = {
+    'crt.sh': 'subsurfer.core.handler.passive.crtsh:CrtshScanner',
+    'AbuseIPDB': 'subsurfer.core.handler.passive.abuseipdb:AbuseIPDBScanner',
+    'AnubisDB': 'subsurfer.core.handler.passive.anubisdb:AnubisDBScanner',
+    'Digitorus': 'subsurfer.core.handler.passive.digitorus:DigitorusScanner',
+    'BufferOver': 'subsurfer.core.handler.passive.bufferover:BufferOverScanner',
+    'Urlscan': 'subsurfer.core.handler.passive.urlscan:UrlscanScanner',
+    'AlienVault': 'subsurfer.core.handler.passive.alienvault:AlienVaultScanner',
+    'HackerTarget': 'subsurfer.core.handler.passive.hackertarget:HackerTargetScanner',
+    'MySSL': 'subsurfer.core.handler.passive.myssl:MySSLScanner',
+    'ShrewdEye': 'subsurfer.core.handler.passive.shrewdeye:ShrewdEyeScanner',
+    'SubdomainCenter': 'subsurfer.core.handler.passive.subdomaincenter:SubdomainCenterScanner',
+    'WebArchive': 'subsurfer.core.handler.passive.webarchive:WebArchiveScanner',
+    'DNS Archive': 'subsurfer.core.handler.passive.dnsarchive:DNSArchiveScanner',
+    'SubdomainFinder': 'subsurfer.core.handler.passive.subdomainfinder:SubdomainFinderScanner',
+    'FreecampDev': 'subsurfer.core.handler.passive.freecampdev:FreecampDevScanner',
+    'MerkleMap': 'subsurfer.core.handler.passive.merklemap:MerkleMapScanner',
+}
+
+# 외부 패키지가 소스를 추가할 때 사용하는 entry point 그룹
+# 예: entry_points={'subsurfer.passive_sources': ['MySource = mypkg.scanner:MyScanner']}
+ENTRY_POINT_GROUP = 'subsurfer.passive_sources'
+
+_available: Optional[Dict[str, str]] = None
+
+def source_key(name: str) -> str:
+    """비교용 소스 이름 (대소문자, 공백, 구두점 무시 - 'crt.sh' == 'crtsh', 'DNS Archive' == 'dnsarchive')"""
+    return re.sub(r'[^a-z0-9]', '', name.lower())
+
+def _entry_point_sources() -> Dict[str, str]:
+    """설치된 패키지가 entry point로 등록한 소스 (이름 → "모듈:클래스")"""
+    try:
+        from importlib.metadata import entry_points
+    except ImportError:
+        return {}
+    try:
+        found = entry_points(group=ENTRY_POINT_GROUP)
+    except TypeError:
+        # Python 3.9: 그룹별 딕셔너리 반환
+        found = entry_points().get(ENTRY_POINT_GROUP, [])
+    return {ep.name: ep.value for ep in found}
+
+def available_sources() -> Dict[str, str]:
+    """
+    사용 가능한 모든 소스 (내장 소스 + entry point 소스)
+
+    Returns:
+        Dict[str, str]: 소스 이름 → "모듈:클래스" (내장 소스와 이름이 같은 entry point는 무시)
+    """
+    global _available
+    if _available is None:
+        sources = dict(SOURCES)
+        keys = {source_key(name) for name in sources}
+        for name, target in _entry_point_sources().items():
+            if source_key(name) not in keys:
+                sources[name] = target
+                keys.add(source_key(name))
+        _available = sources
+    return _available
+
+def parse_source_list(value: Optional[str]) -> List[str]:
+    """쉼표로 구분된 소스 목록 파싱 (예: "crtsh, WebArchive")"""
+    if not value:
+        return []
+    return [name.strip() for name in value.split(',') if name.strip()]
+
+def select_sources(include: Optional[Iterable[str]] = None,
+                   exclude: Optional[Iterable[str]] = None) -> List[str]:
+    """
+    사용할 소스 이름 목록
+
+    Args:
+        include (Iterable[str], optional): 사용할 소스 (없으면 전체)
+        exclude (Iterable[str], optional): 제외할 소스
+
+    Returns:
+        List[str]: 선택된 소스 이름 (레지스트리 순서)
+
+    Raises:
+        ValueError: 알 수 없는 소스 이름이 포함된 경우
+    """
+    sources = available_sources()
+    by_key = {source_key(name): name for name in sources}
+
+    def resolve(names: Iterable[str]) -> set:
+        resolved = set()
+        unknown = []
+        for name in names:
+            key = source_key(name)
+            if key in by_key:
+                resolved.add(by_key[key])
+            else:
+                unknown.append(name)
+        if unknown:
+            raise ValueError(f"Unknown passive source: {', '.join(unknown)} "
+                             f"(available: {', '.join(sources)})")
+        return resolved
+
+    include = list(include or [])
+    selected = resolve(include) if include else set(sources)
+    selected -= resolve(exclude or [])
+    return [name for name in sources if name in selected]
+
+def load_scanner_class(name: str):
+    """소스의 스캐너 클래스 import (처음 사용할 때만 모듈 로드)"""
+    module_name, _, class_name = available_sources()[name].partition(':')
+    return getattr(importlib.import_module(module_name), class_name)
+
+def create_scanners(domain: str, silent: bool = False,
+                    include: Optional[Iterable[str]] = None,
+                    exclude: Optional[Iterable[str]] = None) -> List[Tuple[str, object]]:
+    """
+    선택된 소스의 스캐너 생성
+
+    Args:
+        domain (str): 대상 도메인
+        silent (bool): 상태 메시지 출력 여부
+        include (Iterable[str], optional): 사용할 소스 (없으면 전체)
+        exclude (Iterable[str], optional): 제외할 소스
+
+    Returns:
+        List[Tuple[str, object]]: (소스 이름, 스캐너) 목록
+    """
+    return [(name, load_scanner_class(name)(domain, silent))
+            for name in select_sources(include, exclude)]
@@ -5,7 +5,6 @@
 SubdomainFinder API를 사용하여 서브도메인을 수집하는 스캐너 모듈
 """
 
-import aiohttp
 import random
 import re
 from typing import Set
@@ -14,6 +13,7 @@ from rich.console import Console
 from urllib.parse import urljoin
 import hashlib
 import time
+from subsurfer.core.utils.session import borrow_session
 
 console = Console()
 
@@ -30,6 +30,7 @@ class SubdomainFinderScanner:
         self.base_url = "https://subdomainfinder.c99.nl"
         self.subdomains = set()
         self.silent = silent
+        self.session = None
         
     def _generate_csrf_token(self) -> str:
         """CSRF 토큰 생성"""
@@ -80,7 +81,7 @@ class SubdomainFinderScanner:
                 "scan_subdomains": ""
             }
             
-            async with aiohttp.ClientSession() as session:
+            async with borrow_session(self.session) as session:
                 # post request - scan
                 async with session.post(self.base_url, headers=headers, data=form_data, allow_redirects=False, ssl=False) as response:
                     if response.status != 302:
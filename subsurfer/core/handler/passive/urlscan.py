@@ -5,9 +5,9 @@
 Urlscan.io API를 사용하여 서브도메인을 수집하는 스캐너 모듈
 """
 
-import aiohttp
 from typing import Set
 from rich.console import Console
+from subsurfer.core.utils.session import borrow_session
 
 console = Console()
 
@@ -23,6 +23,7 @@ class UrlscanScanner:
         self.base_url = "https://urlscan.io/api/v1/search"
         self.subdomains = set()
         self.silent = silent
+        self.session = None
         
     async def scan(self) -> Set[str]:
         """
@@ -37,7 +38,7 @@ class UrlscanScanner:
                 'size': 10000
             }
             
-            async with aiohttp.ClientSession() as session:
+            async with borrow_session(self.session) as session:
                 async with session.get(self.base_url, params=params, ssl=False) as response:
                     if response.status != 200:
                         return set()
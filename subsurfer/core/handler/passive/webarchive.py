@@ -5,61 +5,201 @@
 Web Archive API를 사용하여 서브도메인을 수집하는 스캐너 모듈
 """
 
+import asyncio
+import json
+import os
+import time
+from typing import List, Optional, Set
 import aiohttp
-from typing import Set
 from rich.console import Console
+from subsurfer.core.utils.paths import get_state_dir
+from subsurfer.core.utils.session import borrow_session
+from subsurfer.core.utils.stream_parse import CHUNK_SIZE, iter_lines
 
 console = Console()
 
+# 이 시간이 지난 체크포인트는 버리고 처음부터 수집
+CHECKPOINT_TTL = 7 * 24 * 3600
+
 class WebArchiveScanner:
     """Web Archive API를 통한 서브도메인 스캐너"""
     
-    def __init__(self, domain: str, silent: bool = False):
+    def __init__(self, domain: str, silent: bool = False, concurrency: int = 4,
+                 checkpoint_dir: Optional[str] = None):
         """
         Args:
             domain (str): 대상 도메인 (예: example.com)
+            silent (bool): 상태 메시지 출력 여부
+            concurrency (int): 동시에 가져올 CDX 페이지 수 (요청 속도는 세션의 속도 제한을 따름)
+            checkpoint_dir (str, optional): 페이지 체크포인트 디렉토리 (기본값: get_state_dir()/webarchive)
         """
-        self.domain = domain
+        self.domain = domain.lower().rstrip('.')  # 추출한 호스트(소문자)와 같은 형식으로 비교
         self.base_url = "https://web.archive.org/cdx/search/cdx"
         self.subdomains = set()
         self.silent = silent
+        self.session = None
+        self.concurrency = max(1, concurrency)
+        self.checkpoint_dir = checkpoint_dir or os.path.join(get_state_dir(), 'webarchive')
+        self.complete = True  # 모든 페이지를 가져왔는지 여부 (실패한 페이지가 있으면 False)
+        
+    @property
+    def checkpoint_path(self) -> str:
+        """도메인별 체크포인트 파일 경로"""
+        return os.path.join(self.checkpoint_dir, f"{self.domain}.jsonl")
+        
+    def _params(self, **extra) -> dict:
+        """CDX 요청 파라미터 (텍스트 출력, 한 줄에 URL 하나)"""
+        params = {
+            'matchType': 'domain',
+            'fl': 'original',
+            'collapse': 'urlkey',
+            'url': self.domain
+        }
+        params.update(extra)
+        return params
+        
+    def _extract(self, url: str) -> Optional[str]:
+        """CDX 줄(URL)에서 대상 도메인의 서브도메인 추출"""
+        try:
+            domain = url.split('/')[2].split(':')[0].lower()
+        except IndexError:
+            return None
+        return domain if domain.endswith(f".{self.domain}") else None
+        
+    async def _fetch(self, session, params: dict) -> Optional[Set[str]]:
+        """
+        CDX 요청 하나를 스트리밍으로 처리
+        
+        Returns:
+            Optional[Set[str]]: 이 요청에서 새로 발견한 서브도메인, 실패 시 None
+        """
+        found = set()
+        async with session.get(self.base_url, params=params, ssl=False) as response:
+            if response.status != 200:
+                return None
+            # 텍스트 CDX 출력(한 줄에 URL 하나)을 스트림에서 바로 처리
+            async for url in iter_lines(response.content.iter_chunked(CHUNK_SIZE)):
+                domain = self._extract(url)
+                if domain and domain not in self.subdomains:
+                    self.subdomains.add(domain)
+                    found.add(domain)
+        return found
+        
+    async def _num_pages(self, session) -> Optional[int]:
+        """CDX 페이지 수 조회, 페이지 API를 사용할 수 없으면 None"""
+        try:
+            async with session.get(self.base_url, params=self._params(showNumPages='true'), ssl=False) as response:
+                if response.status != 200:
+                    return None
+                return max(0, int((await response.text()).strip()))
+        except (ValueError, asyncio.TimeoutError):
+            return None
+            
+    def _load_checkpoint(self, num_pages: int) -> Set[int]:
+        """
+        체크포인트에서 완료된 페이지와 그 결과 복원
+        
+        페이지 수가 바뀌었거나(인덱스 갱신) 오래된 체크포인트는 무시합니다.
+        
+        Returns:
+            Set[int]: 이미 완료된 페이지 번호
+        """
+        done = set()
+        try:
+            with open(self.checkpoint_path, encoding='utf-8') as f:
+                header = json.loads(f.readline())
+                if header.get('pages') != num_pages or time.time() - header.get('started', 0) > CHECKPOINT_TTL:
+                    return set()
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        break  # 중단 시 마지막 줄이 잘렸을 수 있음
+                    done.add(record['page'])
+                    self.subdomains.update(record['subdomains'])
+        except (OSError, ValueError, KeyError, AttributeError):
+            return set()
+        return done
+        
+    def _start_checkpoint(self, num_pages: int) -> None:
+        """새 체크포인트 파일 생성"""
+        os.makedirs(self.checkpoint_dir, exist_ok=True)
+        with open(self.checkpoint_path, 'w', encoding='utf-8') as f:
+            f.write(json.dumps({'pages': num_pages, 'started': time.time()}) + "\n")
+            
+    def _save_page(self, page: int, found: Set[str]) -> None:
+        """완료된 페이지를 체크포인트에 추가 (페이지에서 새로 발견한 서브도메인만 기록)"""
+        with open(self.checkpoint_path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps({'page': page, 'subdomains': sorted(found)}) + "\n")
+            
+    def _clear_checkpoint(self) -> None:
+        """수집 완료 후 체크포인트 삭제"""
+        try:
+            os.remove(self.checkpoint_path)
+        except OSError:
+            pass
+            
+    async def _scan_pages(self, session, num_pages: int) -> None:
+        """
+        CDX 페이지를 동시에 가져오며 완료된 페이지를 체크포인트에 기록
+        
+        중단되면(시간 초과, 취소 포함) 다음 실행은 완료되지 않은 페이지부터 이어서 수집합니다.
+        """
+        done = self._load_checkpoint(num_pages)
+        if done:
+            if not self.silent:
+                console.print(f"[blue][*][/] Web Archive: resuming from checkpoint ({len(done)}/{num_pages} pages)")
+        else:
+            self._start_checkpoint(num_pages)
+            
+        pending: List[int] = [page for page in range(num_pages) if page not in done]
+        pages = iter(pending)
+        failed = []
+        
+        async def worker():
+            # 모든 워커가 하나의 페이지 이터레이터를 공유
+            for page in pages:
+                try:
+                    found = await self._fetch(session, self._params(page=page))
+                except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+                    found = None
+                    if not self.silent:
+                        console.print(f"[yellow][!][/] Web Archive page {page} failed: {str(e)}")
+                if found is None:
+                    failed.append(page)
+                    continue
+                self._save_page(page, found)
+                
+        await asyncio.gather(*(worker() for _ in range(min(self.concurrency, len(pending)))))
+        
+        if failed:
+            # 실패한 페이지는 체크포인트에 남겨 다음 실행에서 다시 시도
+            self.complete = False
+            if not self.silent:
+                console.print(f"[yellow][!][/] Web Archive: {len(failed)} of {num_pages} pages failed, will resume next run")
+        else:
+            self._clear_checkpoint()
         
     async def scan(self) -> Set[str]:
         """
         Web Archive API를 통해 서브도메인 스캔 수행
         
+        CDX 페이지 API로 페이지 수를 확인한 뒤 페이지 단위로 나눠 수집하고,
+        페이지 API를 사용할 수 없으면 한 번의 요청으로 수집합니다.
+        
         Returns:
             Set[str]: 수집된 고유한 서브도메인 목록
         """
+        self.complete = True
         try:
-            params = {
-                'matchType': 'domain',
-                'fl': 'original',
-                'output': 'json',
-                'collapse': 'urlkey',
-                'url': self.domain
-            }
-            
-            async with aiohttp.ClientSession() as session:
-                async with session.get(self.base_url, params=params, ssl=False) as response:
-                    if response.status != 200:
+            async with borrow_session(self.session) as session:
+                num_pages = await self._num_pages(session)
+                if num_pages is None:
+                    if await self._fetch(session, self._params()) is None:
                         return set()
-                        
-                    data = await response.json()
+                elif num_pages > 0:
+                    await self._scan_pages(session, num_pages)
                     
-                    if not data or len(data) < 2:  # 첫 번째 행은 컬럼명
-                        return set()
-                        
-                    for entry in data[1:]:  # 첫 번째 행 제외
-                        try:
-                            url = entry[0]  # original URL
-                            # URL에서 도메인 추출
-                            domain = url.split('/')[2].split(':')[0].lower()
-                            if domain.endswith(f".{self.domain}"):
-                                self.subdomains.add(domain)
-                        except:
-                            continue
-                            
             return self.subdomains
             
         except Exception as e:
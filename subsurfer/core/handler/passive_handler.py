@@ -6,7 +6,7 @@
 """
 
 import asyncio
-from typing import Set
+from typing import Iterable, List, Set, Optional, Tuple
 import sys
 import os
 from rich.console import Console
@@ -14,73 +14,203 @@ from rich.console import Console
 # 상위 디렉토리를 모듈 검색 경로에 추가
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
 
-from subsurfer.core.handler.passive.crtsh import CrtshScanner
-from subsurfer.core.handler.passive.abuseipdb import AbuseIPDBScanner
-from subsurfer.core.handler.passive.anubisdb import AnubisDBScanner
-from subsurfer.core.handler.passive.digitorus import DigitorusScanner
-from subsurfer.core.handler.passive.bufferover import BufferOverScanner
-from subsurfer.core.handler.passive.urlscan import UrlscanScanner
-from subsurfer.core.handler.passive.alienvault import AlienVaultScanner
-from subsurfer.core.handler.passive.hackertarget import HackerTargetScanner
-from subsurfer.core.handler.passive.myssl import MySSLScanner
-from subsurfer.core.handler.passive.shrewdeye import ShrewdEyeScanner
-from subsurfer.core.handler.passive.subdomaincenter import SubdomainCenterScanner
-from subsurfer.core.handler.passive.webarchive import WebArchiveScanner
-from subsurfer.core.handler.passive.dnsarchive import DNSArchiveScanner
-from subsurfer.core.handler.passive.subdomainfinder import SubdomainFinderScanner
-from subsurfer.core.handler.passive.freecampdev import FreecampDevScanner
-from subsurfer.core.handler.passive.merklemap import MerkleMapScanner
+from subsurfer.core.handler.passive.registry import create_scanners
+from subsurfer.core.utils.session import SessionManager
+from subsurfer.core.utils.hostname import normalize_hostnames
+from subsurfer.core.utils.result_cache import ResultCache, STALE
+from subsurfer.core.utils.rate_limit import current_source
 
 console = Console()
 
 class PassiveHandler:
     """패시브 서브도메인 수집을 처리하는 핸들러 클래스"""
     
-    def __init__(self, target: str, silent: bool = False):
+    def __init__(self, target: str, silent: bool = False, concurrency: int = 16,
+                 source_timeout: float = 60.0, deadline: Optional[float] = None,
+                 session_manager: Optional[SessionManager] = None,
+                 semaphore: Optional[asyncio.Semaphore] = None,
+                 cache: Optional[ResultCache] = None,
+                 sources: Optional[Iterable[str]] = None,
+                 exclude_sources: Optional[Iterable[str]] = None):
         """
         Args:
             target (str): 대상 도메인 (예: example.com)
             silent (bool): 상태 메시지 출력 여부
+            concurrency (int): 동시에 실행할 최대 소스 수
+            source_timeout (float): 소스별 제한 시간(초)
+            deadline (float, optional): 전체 수집 제한 시간(초), 초과 시 그때까지의 결과 반환
+            session_manager (SessionManager, optional): 공유 세션 관리자 (없으면 자체 생성)
+            semaphore (asyncio.Semaphore, optional): 여러 핸들러가 공유하는 전역 소스 실행 제한
+            cache (ResultCache, optional): 소스별 결과 디스크 캐시 (없으면 항상 새로 수집)
+            sources (Iterable[str], optional): 사용할 소스 이름 (없으면 전체)
+            exclude_sources (Iterable[str], optional): 제외할 소스 이름
         """
-        self.target = target
+        self.target = target.lower().rstrip('.')  # 스캐너 결과는 소문자 이름으로 정규화되므로 대상도 같은 형식으로 맞춤
         self.silent = silent
+        self.concurrency = max(1, concurrency)
+        self.source_timeout = source_timeout
+        self.deadline = deadline
+        self.session_manager = session_manager or SessionManager()
+        self.shared_semaphore = semaphore
+        self.cache = cache
+        self.refresh_tasks = []  # stale 캐시 결과의 백그라운드 갱신 작업
         self.subdomains: Set[str] = set()
-        self.scanners = [
-            ('crt.sh', CrtshScanner(self.target, self.silent)),
-            ('AbuseIPDB', AbuseIPDBScanner(self.target, self.silent)),
-            ('AnubisDB', AnubisDBScanner(self.target, self.silent)),
-            ('Digitorus', DigitorusScanner(self.target, self.silent)),
-            ('BufferOver', BufferOverScanner(self.target, self.silent)),
-            ('Urlscan', UrlscanScanner(self.target, self.silent)),
-            ('AlienVault', AlienVaultScanner(self.target, self.silent)),
-            ('HackerTarget', HackerTargetScanner(self.target, self.silent)),
-            ('MySSL', MySSLScanner(self.target, self.silent)),
-            ('ShrewdEye', ShrewdEyeScanner(self.target, self.silent)),
-            ('SubdomainCenter', SubdomainCenterScanner(self.target, self.silent)),
-            ('WebArchive', WebArchiveScanner(self.target, self.silent)),
-            ('DNS Archive', DNSArchiveScanner(self.target, self.silent)),
-            ('SubdomainFinder', SubdomainFinderScanner(self.target, self.silent)),
-            ('FreecampDev', FreecampDevScanner(self.target, self.silent)),
-            ('MerkleMap', MerkleMapScanner(self.target, self.silent)),
-        ]
+        self.sources = sources
+        self.exclude_sources = exclude_sources
+        self._scanners: Optional[List[Tuple[str, object]]] = None
+        
+    @property
+    def scanners(self) -> List[Tuple[str, object]]:
+        """(소스 이름, 스캐너) 목록 - 처음 사용할 때 선택된 소스의 모듈만 import해 생성"""
+        if self._scanners is None:
+            self._scanners = create_scanners(self.target, self.silent, self.sources, self.exclude_sources)
+        return self._scanners
+        
+    @scanners.setter
+    def scanners(self, scanners: List[Tuple[str, object]]) -> None:
+        self._scanners = scanners
+        
+    async def _scan_source(self, name: str, scanner) -> Tuple[Set[str], bool]:
+        """
+        소스 하나를 제한 시간 내에서 실행
+        
+        Returns:
+            Tuple[Set[str], bool]: (수집 결과, 정상 완료 여부 - 시간 초과/오류 시 False)
+        """
+        # 서킷이 열린 소스(배치 내 연속 실패)는 건너뜀
+        rate_limiter = getattr(self.session_manager, 'rate_limiter', None)
+        if rate_limiter is not None and rate_limiter.is_open(name):
+            if not self.silent:
+                console.print(f"[yellow][!][/] {name} Skipped: too many failures")
+            return set(), False
+            
+        if not self.silent:
+            console.print(f"[blue][*][/] {name} Start Scan...")
+        # 요청 미들웨어가 소스별 서킷 브레이커를 사용하도록 소스 이름 전달
+        token = current_source.set(name)
+        try:
+            subdomains = await asyncio.wait_for(scanner.scan(), timeout=self.source_timeout)
+            if not self.silent:
+                console.print(f"[green][+][/] {name} Scan completed: {len(subdomains)} found")
+            # 일부 페이지를 가져오지 못한 스캐너(예: WebArchive)는 부분 결과로 취급
+            return subdomains, getattr(scanner, 'complete', True)
+        except asyncio.TimeoutError:
+            # 시간 초과 시에도 스캐너가 그때까지 모은 결과는 사용
+            subdomains = set(getattr(scanner, 'subdomains', set()))
+            if not self.silent:
+                console.print(f"[yellow][!][/] {name} Timed out after {self.source_timeout}s: {len(subdomains)} found")
+            return subdomains, False
+        except Exception as e:
+            if not self.silent:
+                console.print(f"[red][-][/] {name} Error: {str(e)}")
+            return set(), False
+        finally:
+            current_source.reset(token)
+            
+    async def _fetch_source(self, name: str, scanner, semaphore: asyncio.Semaphore) -> Set[str]:
+        """핸들러별 제한과 전역 제한을 모두 획득한 뒤 소스 실행, 정상 완료된 결과는 캐시에 저장"""
+        async with semaphore:
+            if self.shared_semaphore is None:
+                subdomains, complete = await self._scan_source(name, scanner)
+            else:
+                async with self.shared_semaphore:
+                    subdomains, complete = await self._scan_source(name, scanner)
+                    
+        # 소스마다 다른 형식(대소문자, 와일드카드, 끝의 점 등)을 수집 단계에서 통일
+        subdomains = normalize_hostnames(subdomains, self.target)
+        # 부분 결과(시간 초과, 오류)는 캐시하지 않음
+        # 대부분의 스캐너는 오류/비정상 응답(429 등)에도 빈 집합을 반환하므로 빈 결과도 캐시하지 않음
+        # (실패한 소스가 TTL 동안 숨겨지는 것보다 결과가 없는 소스를 다시 조회하는 편이 안전)
+        if complete and subdomains and self.cache is not None:
+            self.cache.put(name, self.target, subdomains)
+        return subdomains
+        
+    async def _refresh_source(self, name: str, scanner, semaphore: asyncio.Semaphore) -> None:
+        """stale 캐시 결과를 백그라운드에서 갱신"""
+        async with self.session_manager as session:
+            scanner.session = session
+            await self._fetch_source(name, scanner, semaphore)
+            
+    async def _run_scanner(self, name: str, scanner, semaphore: asyncio.Semaphore,
+                           queue: Optional[asyncio.Queue] = None) -> Set[str]:
+        """캐시된 결과가 있으면 사용하고, 없으면 소스 실행"""
+        cached = self.cache.get(name, self.target) if self.cache is not None else None
+        # 이전 버전이 저장한 빈 결과는 실패였을 수 있으므로 다시 조회
+        if cached is not None and not cached[0]:
+            cached = None
+        if cached is not None:
+            subdomains, state = cached
+            subdomains = normalize_hostnames(subdomains, self.target)
+            if state == STALE:
+                # 기존 결과를 먼저 사용하고 다음 실행을 위해 백그라운드에서 갱신
+                self.refresh_tasks.append(asyncio.ensure_future(self._refresh_source(name, scanner, semaphore)))
+            if not self.silent:
+                note = " (stale, refreshing)" if state == STALE else ""
+                console.print(f"[green][+][/] {name} Loaded from cache: {len(subdomains)} found{note}")
+        else:
+            subdomains = await self._fetch_source(name, scanner, semaphore)
+                    
+        # 소스가 끝나는 즉시 다음 단계로 전달
+        if queue is not None:
+            for subdomain in subdomains:
+                queue.put_nowait(subdomain)
+        return subdomains
+        
+    async def collect(self, queue: Optional[asyncio.Queue] = None) -> Set[str]:
+        """
+        서브도메인 수집 - 모든 소스를 동시에 실행
+        
+        Args:
+            queue (asyncio.Queue, optional): 소스별 결과를 완료 즉시 넣을 큐
+        """
+        async with self.session_manager as session:
+            # 모든 스캐너가 하나의 커넥션 풀을 공유
+            for name, scanner in self.scanners:
+                scanner.session = session
+                
+            semaphore = asyncio.Semaphore(self.concurrency)
+            tasks = {
+                asyncio.ensure_future(self._run_scanner(name, scanner, semaphore, queue)): (name, scanner)
+                for name, scanner in self.scanners
+            }
+            
+            done, pending = await asyncio.wait(tasks, timeout=self.deadline)
+            
+            # 전체 제한 시간 초과 - 남은 소스는 취소
+            if pending:
+                for task in pending:
+                    task.cancel()
+                await asyncio.gather(*pending, return_exceptions=True)
         
-    async def collect(self) -> Set[str]:
-        """서브도메인 수집"""
         results = set()
-        for name, scanner in self.scanners:
-            try:
-                if not self.silent:
-                    console.print(f"[blue][*][/] {name} Start Scan...")
-                subdomains = await scanner.scan()
-                results.update(subdomains)
-                if not self.silent:
-                    console.print(f"[green][+][/] {name} Scan completed: {len(subdomains)} found")
-            except Exception as e:
-                if not self.silent:
-                    console.print(f"[red][-][/] {name} Error: {str(e)}")
+        for task in done:
+            results.update(task.result())
+            
+        # 취소된 소스가 그때까지 모은 부분 결과 취합
+        if pending:
+            for task in pending:
+                name, scanner = tasks[task]
+                partial = normalize_hostnames(getattr(scanner, 'subdomains', set()), self.target)
+                results.update(partial)
+                if queue is not None:
+                    for subdomain in partial:
+                        queue.put_nowait(subdomain)
+            if not self.silent:
+                names = ', '.join(tasks[task][0] for task in pending)
+                console.print(f"[yellow][!][/] Deadline of {self.deadline}s reached, cancelled: {names}")
                 
         self.subdomains.update(results)
         return self.subdomains
+        
+    async def wait_refresh(self) -> None:
+        """
+        stale 캐시 결과의 백그라운드 갱신 완료 대기
+        
+        갱신 결과는 캐시에만 반영되어 다음 실행부터 사용됩니다.
+        """
+        if self.refresh_tasks:
+            await asyncio.gather(*self.refresh_tasks, return_exceptions=True)
+            self.refresh_tasks.clear()
 
 async def main():
     """테스트용 메인 함수"""
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Takeover fingerprint 매칭 모듈 - CNAME 접미사 인덱스로 후보를 좁힌 뒤 본문 매칭
+"""
+
+import json
+from typing import Dict, Iterable, List, Optional, Set
+
+def _as_list(value) -> list:
+    """단일 값 또는 목록을 목록으로 변환 (None은 빈 목록)"""
+    if value is None:
+        return []
+    return list(value) if isinstance(value, (list, tuple)) else [value]
+
+def normalize_fingerprint(fp: Dict) -> Optional[Dict]:
+    """
+    fingerprint 항목 정규화
+
+    fingerprints.json 형식과 커뮤니티 목록(can-i-take-over-xyz) 형식을 모두 받습니다.
+    문자열 하나로 된 fingerprint/http_status는 목록으로 바꾸고, CNAME이나 본문 패턴이
+    없거나 vulnerable이 false인 항목은 제외합니다. http_status가 비어 있으면 모든 상태 코드와 일치합니다.
+
+    Returns:
+        Optional[Dict]: 정규화된 항목 (사용할 수 없으면 None)
+    """
+    if not isinstance(fp, dict) or fp.get('vulnerable') is False:
+        return None
+    cnames = [cname.lower().strip().strip('.') for cname in _as_list(fp.get('cname')) if isinstance(cname, str)]
+    patterns = [pattern for pattern in _as_list(fp.get('fingerprint'))
+                if isinstance(pattern, str) and pattern and pattern != 'NXDOMAIN']
+    cnames = [cname for cname in cnames if cname]
+    if not cnames or not patterns:
+        return None
+    normalized = dict(fp)
+    normalized['service'] = fp.get('service') or cnames[0]
+    normalized['cname'] = cnames
+    normalized['fingerprint'] = patterns
+    normalized['http_status'] = [int(status) for status in _as_list(fp.get('http_status'))]
+    return normalized
+
+def load_fingerprint_file(path: str) -> List[Dict]:
+    """
+    fingerprint JSON 파일 로드
+
+    Args:
+        path (str): fingerprint 목록(JSON 배열) 파일 경로
+
+    Returns:
+        List[Dict]: 정규화된 fingerprint 목록
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        entries = json.load(f)
+    if not isinstance(entries, list):
+        raise ValueError(f"{path}: expected a JSON array of fingerprints")
+    return [fp for fp in map(normalize_fingerprint, entries) if fp is not None]
+
+class FingerprintMatcher:
+    """
+    미리 컴파일된 takeover fingerprint 매처
+
+    - CNAME 접미사 인덱스: CNAME의 레이블 접미사(a.b.github.io → b.github.io → github.io → io)만
+      조회하므로 후보 fingerprint 검색 비용이 fingerprint 수와 무관합니다.
+    - 본문 매칭: CNAME으로 좁혀진 후보(대개 한 개)의 패턴만 문자열 포함 검사(`in`, C 구현)로 확인합니다.
+    """
+
+    def __init__(self, fingerprints: Iterable[Dict]):
+        """
+        Args:
+            fingerprints (Iterable[Dict]): 정규화된 fingerprint 목록 (앞에 있을수록 우선)
+        """
+        self.fingerprints = list(fingerprints)
+        self.suffixes: Dict[str, List[int]] = {}
+
+        for index, fp in enumerate(self.fingerprints):
+            for cname in fp['cname']:
+                owners = self.suffixes.setdefault(cname, [])
+                if index not in owners:
+                    owners.append(index)
+
+    def __len__(self) -> int:
+        return len(self.fingerprints)
+
+    def _candidate_indexes(self, cname: str) -> List[int]:
+        """CNAME 접미사가 일치하는 fingerprint 번호 (우선순위 순)"""
+        if not cname:
+            return []
+        labels = cname.lower().rstrip('.').split('.')
+        indexes: Set[int] = set()
+        for i in range(len(labels)):
+            owners = self.suffixes.get('.'.join(labels[i:]))
+            if owners:
+                indexes.update(owners)
+        return sorted(indexes)
+
+    def candidates(self, cname: str) -> List[Dict]:
+        """
+        CNAME이 가리키는 서비스의 fingerprint 목록
+
+        Args:
+            cname (str): CNAME 레코드 값 (예: octocat.github.io)
+
+        Returns:
+            List[Dict]: 일치하는 fingerprint (없으면 HTTP 확인 불필요)
+        """
+        return [self.fingerprints[index] for index in self._candidate_indexes(cname)]
+
+    def match(self, cname: str, status: int, body: str) -> Optional[Dict]:
+        """
+        CNAME, 상태 코드, 본문이 모두 일치하는 fingerprint
+
+        Returns:
+            Optional[Dict]: 첫 번째로 일치하는 fingerprint (없으면 None)
+        """
+        if not body:
+            return None
+        for index in self._candidate_indexes(cname):
+            fp = self.fingerprints[index]
+            if fp['http_status'] and status not in fp['http_status']:
+                continue
+            if any(pattern in body for pattern in fp['fingerprint']):
+                return fp
+        return None
@@ -3,109 +3,120 @@
 
 import asyncio
 import aiohttp
-import json
 import os
-import warnings
-from typing import Set, List, Dict
+from typing import Iterable, Set, List, Dict, Optional, Tuple
 from rich.console import Console
-
-# aiodns 경고 메시지 억제
-warnings.filterwarnings('ignore', message='.*Failed to create DNS resolver.*')
-warnings.filterwarnings('ignore', message='.*Failed to initialize c-ares.*')
+from subsurfer.core.handler.takeover.matcher import FingerprintMatcher, load_fingerprint_file
+from subsurfer.core.utils.resolver import AsyncResolver, AiohttpResolver
 
 console = Console()
 
+# 응답 본문은 fingerprint 확인에 필요한 만큼만 읽음
+MAX_BODY_SIZE = 512 * 1024
+
+# 내장 fingerprint 목록
+FINGERPRINTS_PATH = os.path.join(os.path.dirname(__file__), 'fingerprints.json')
+
+# 파일 목록별로 한 번만 컴파일한 매처 (배치 모드에서 여러 타겟이 공유)
+_matchers: Dict[Tuple[str, ...], FingerprintMatcher] = {}
+
 class TakeoverHandler:
     """서브도메인 Takeover 취약점 탐지 핸들러"""
     
-    def __init__(self, target: str, silent: bool = False):
-        self.target = target
+    def __init__(self, target: str, silent: bool = False, resolver: Optional[AsyncResolver] = None,
+                 concurrency: int = 50, timeout: float = 10.0,
+                 fingerprint_files: Optional[Iterable[str]] = None):
+        """
+        Args:
+            target (str): 대상 도메인
+            silent (bool): 상태 메시지 출력 여부
+            resolver (AsyncResolver, optional): 공유 비동기 DNS 리졸버 (CNAME 조회 및 HTTP 연결에 사용)
+            concurrency (int): 동시에 검사할 최대 서브도메인 수 (워커 수)
+            timeout (float): 호스트별 HTTP 확인 제한 시간(초)
+            fingerprint_files (Iterable[str], optional): 내장 목록에 추가할 fingerprint JSON 파일
+        """
+        self.target = target.lower().rstrip('.')
         self.silent = silent
-        self.fingerprints = self._load_fingerprints()
+        self.printer = None  # 스트리밍 출력기 (StreamPrinter)
+        self.resolver = resolver or AsyncResolver()
+        self.concurrency = max(1, concurrency)
+        self.timeout = timeout
+        self.session: Optional[aiohttp.ClientSession] = None  # 스캔 동안 공유하는 세션
+        self.fingerprint_files = tuple(fingerprint_files or ())
+        self.matcher = self._load_matcher()
+        self.fingerprints = self.matcher.fingerprints
         self.vulnerable_domains = []
         
-    def _load_fingerprints(self) -> List[Dict]:
-        """fingerprints.json 파일 로드"""
-        try:
-            fingerprints_path = os.path.join(
-                os.path.dirname(__file__),
-                'fingerprints.json'
-            )
-            with open(fingerprints_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except Exception as e:
-            if not self.silent:
-                console.print(f"[red][-][/] Error loading fingerprints: {str(e)}")
-            return []
+    def _load_matcher(self) -> FingerprintMatcher:
+        """내장 fingerprints.json과 사용자 파일을 로드해 매처 컴파일 (같은 파일 목록은 재사용)"""
+        key = (FINGERPRINTS_PATH,) + self.fingerprint_files
+        if key not in _matchers:
+            fingerprints = []
+            for path in key:
+                try:
+                    fingerprints.extend(load_fingerprint_file(path))
+                except (OSError, ValueError, TypeError) as e:
+                    if not self.silent:
+                        console.print(f"[red][-][/] Error loading fingerprints from {path}: {str(e)}")
+            _matchers[key] = FingerprintMatcher(fingerprints)
+        return _matchers[key]
+    
+    def _create_session(self) -> aiohttp.ClientSession:
+        """커넥션 풀을 공유하는 세션 생성 (리졸버 캐시를 사용해 같은 이름을 다시 조회하지 않음)"""
+        connector = aiohttp.TCPConnector(ssl=False, limit=self.concurrency,
+                                         resolver=AiohttpResolver(self.resolver))
+        # 응답 없는 https 포트가 호스트별 제한 시간을 모두 쓰지 않도록 연결 시간은 절반으로 제한
+        timeout = aiohttp.ClientTimeout(total=self.timeout, connect=self.timeout / 2)
+        return aiohttp.ClientSession(connector=connector, timeout=timeout)
     
-    async def check_cname(self, domain: str) -> str:
+    async def check_cname(self, domain: str) -> Optional[str]:
         """DNS CNAME 레코드 조회"""
-        try:
-            import aiodns
-            import sys
-            import io
-            
-            # stderr를 임시로 리다이렉트하여 c-ares 경고 메시지 억제
-            old_stderr = sys.stderr
-            sys.stderr = io.StringIO()
-            
+        cnames = await self.resolver.query(domain, 'CNAME')
+        return cnames[0].lower() if cnames else None
+    
+    def candidate_fingerprints(self, cname: str) -> List[Dict]:
+        """CNAME이 일치하는 fingerprint 목록 (없으면 HTTP 확인 불필요)"""
+        return self.matcher.candidates(cname)
+    
+    async def _fetch(self, session: aiohttp.ClientSession, domain: str) -> Tuple[Optional[int], Optional[str]]:
+        """https, http 순서로 요청해 첫 응답의 (상태 코드, 본문) 반환"""
+        for scheme in ['https', 'http']:
             try:
-                resolver = aiodns.DNSResolver()
-                result = await resolver.query(domain, 'CNAME')
-                return result.cname if result else None
-            finally:
-                # stderr 복원
-                sys.stderr = old_stderr
-        except:
-            return None
+                url = f"{scheme}://{domain}"
+                async with session.get(url, allow_redirects=True) as response:
+                    body = await response.content.read(MAX_BODY_SIZE)
+                    return response.status, body.decode(response.charset or 'utf-8', errors='ignore')
+            except (aiohttp.ClientError, asyncio.TimeoutError, OSError, LookupError):
+                continue
+        return None, None
     
     async def check_http_response(self, domain: str) -> tuple:
-        """HTTP 응답 확인"""
-        try:
-            timeout = aiohttp.ClientTimeout(total=10)
-            async with aiohttp.ClientSession(timeout=timeout) as session:
-                for scheme in ['https', 'http']:
-                    try:
-                        url = f"{scheme}://{domain}"
-                        async with session.get(url, ssl=False, allow_redirects=True) as response:
-                            body = await response.text()
-                            return response.status, body
-                    except:
-                        continue
-            return None, None
-        except:
-            return None, None
+        """HTTP 응답 확인 (스캔 중에는 공유 세션 사용)"""
+        if self.session is not None:
+            return await self._fetch(self.session, domain)
+        async with self._create_session() as session:
+            return await self._fetch(session, domain)
     
     def match_fingerprint(self, cname: str, status: int, body: str) -> Dict:
-        """fingerprint 매칭 확인"""
+        """fingerprint 매칭 확인 (CNAME 접미사 인덱스 조회 후 본문을 한 번만 검색)"""
         if not cname or not body:
             return None
-            
-        for fp in self.fingerprints:
-            cname_match = any(cn in cname for cn in fp.get('cname', []))
-            
-            if cname_match:
-                status_match = status in fp.get('http_status', [])
-                
-                fingerprint_match = any(
-                    pattern in body 
-                    for pattern in fp.get('fingerprint', [])
-                )
-                
-                if status_match and fingerprint_match:
-                    return fp
-        
-        return None
+        return self.matcher.match(cname, status, body)
     
     async def check_domain(self, domain: str) -> Dict:
         """개별 도메인 takeover 취약점 확인"""
         try:
             cname = await self.check_cname(domain)
             
-            if not cname:
+            # CNAME이 알려진 서비스를 가리키는 경우에만 HTTP 확인
+            if not cname or not self.candidate_fingerprints(cname):
                 return None
             
-            status, body = await self.check_http_response(domain)
+            try:
+                # https/http 시도 전체에 호스트별 제한 시간 적용
+                status, body = await asyncio.wait_for(self.check_http_response(domain), timeout=self.timeout)
+            except asyncio.TimeoutError:
+                return None
             
             if status is None:
                 return None
@@ -126,31 +137,75 @@ class TakeoverHandler:
         except Exception as e:
             return None
     
-    async def scan(self, subdomains: Set[str]) -> List[Dict]:
-        """모든 서브도메인 takeover 스캔"""
-        if not self.silent:
-            console.print(f"[blue][*][/] Starting Takeover Detection Scan for {len(subdomains)} subdomains...")
-        
-        tasks = []
-        for subdomain in subdomains:
-            tasks.append(self.check_domain(subdomain))
-        
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+    def _report(self, result) -> bool:
+        """취약 결과 확인 및 출력"""
+        if result and isinstance(result, dict) and result.get('vulnerable'):
+            if self.printer:
+                self.printer.takeover(result)
+            if not self.silent:
+                console.print(
+                    f"[red][!][/] VULNERABLE: {result['domain']} "
+                    f"-> {result['service']} (CNAME: {result['cname']})"
+                )
+            return True
+        return False
+    
+    async def _run(self, queue: asyncio.Queue) -> List[Dict]:
+        """
+        concurrency개의 워커가 큐의 서브도메인을 검사
         
+        검사 대상 수와 관계없이 동시에 진행되는 DNS/HTTP 요청 수는 워커 수로 제한되고,
+        모든 워커가 하나의 세션(커넥션 풀)을 공유합니다.
+        """
         vulnerable = []
-        for result in results:
-            if result and isinstance(result, dict) and result.get('vulnerable'):
-                vulnerable.append(result)
-                if not self.silent:
-                    console.print(
-                        f"[red][!][/] VULNERABLE: {result['domain']} "
-                        f"-> {result['service']} (CNAME: {result['cname']})"
-                    )
         
+        async def worker():
+            """종료 신호(None)를 받을 때까지 검사"""
+            while True:
+                subdomain = await queue.get()
+                if subdomain is None:
+                    # 다른 워커도 종료하도록 신호를 다시 넣음
+                    queue.put_nowait(None)
+                    return
+                try:
+                    result = await self.check_domain(subdomain)
+                except Exception:
+                    continue
+                if self._report(result):
+                    vulnerable.append(result)
+                    
+        async with self._create_session() as session:
+            self.session = session
+            try:
+                await asyncio.gather(*(worker() for _ in range(self.concurrency)))
+            finally:
+                self.session = None
+                
         self.vulnerable_domains = vulnerable
         
         if not self.silent:
             console.print(f"[green][+][/] Takeover Scan completed: {len(vulnerable)} vulnerable domains found")
         
         return vulnerable
-
+    
+    async def scan_stream(self, queue: asyncio.Queue) -> List[Dict]:
+        """
+        큐로 들어오는 서브도메인을 도착하는 즉시 takeover 검사
+        
+        Args:
+            queue (asyncio.Queue): 검사할 서브도메인 큐 (None을 넣으면 종료)
+        """
+        if not self.silent:
+            console.print("[blue][*][/] Starting Takeover Detection Scan...")
+        return await self._run(queue)
+    
+    async def scan(self, subdomains: Set[str]) -> List[Dict]:
+        """모든 서브도메인 takeover 스캔"""
+        if not self.silent:
+            console.print(f"[blue][*][/] Starting Takeover Detection Scan for {len(subdomains)} subdomains...")
+        
+        queue = asyncio.Queue()
+        for subdomain in subdomains:
+            queue.put_nowait(subdomain)
+        queue.put_nowait(None)
+        return await self._run(queue)
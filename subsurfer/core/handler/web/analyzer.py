@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Wappalyzer 핑거프린트 분석 프로세스 풀 모듈
+"""
+import asyncio
+import multiprocessing
+import os
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+from multidict import CIMultiDict
+
+def _init_worker() -> None:
+    """워커 프로세스 초기화 - 룰셋을 미리 로드"""
+    from subsurfer.core.utils.wappalyzer_cache import load_wappalyzer
+
+    warnings.filterwarnings('ignore', module='Wappalyzer')
+    load_wappalyzer()
+
+def analyze_page(url: str, html: str, headers: List[Tuple[str, str]], wappalyzer=None) -> Dict:
+    """
+    응답 원문으로 WebPage를 만들어 기술 스택 분석
+
+    HTML 파싱(BeautifulSoup)과 정규식 매칭을 모두 포함하므로 워커 프로세스에서
+    실행됩니다.
+
+    Args:
+        url (str): 최종 응답 URL
+        html (str): 응답 본문
+        headers (List[Tuple[str, str]]): 응답 헤더
+        wappalyzer (Wappalyzer, optional): 사용할 인스턴스 (없으면 프로세스 공유 인스턴스)
+
+    Returns:
+        Dict: analyze_with_versions_and_categories 결과
+    """
+    # Wappalyzer는 첫 분석 시점에 import (분석 워커를 쓰면 메인 프로세스에서는 로드하지 않음)
+    from Wappalyzer import WebPage
+    from subsurfer.core.utils.wappalyzer_cache import load_wappalyzer
+
+    webpage = WebPage(url, html, CIMultiDict(headers))
+    return (wappalyzer or load_wappalyzer()).analyze_with_versions_and_categories(webpage)
+
+def _pool_context():
+    """
+    분석 프로세스 풀의 시작 방식
+
+    풀은 파이프라인 도중(aiohttp DNS 스레드 등이 동작 중일 때) 처음 생성되므로 fork로
+    멀티스레드 프로세스를 복제하면 워커가 교착될 수 있습니다. 가능하면 forkserver,
+    아니면 spawn을 사용합니다.
+    """
+    methods = multiprocessing.get_all_start_methods()
+    return multiprocessing.get_context('forkserver' if 'forkserver' in methods else 'spawn')
+
+class FingerprintAnalyzer:
+    """
+    이벤트 루프 밖에서 Wappalyzer 분석을 실행하는 분석기
+
+    분석 요청은 최대 max_pending개까지만 풀에 쌓이고, 그 이상은 자리가 날 때까지
+    대기하므로 네트워크 검사 속도가 분석 속도를 크게 앞지르지 않습니다.
+    workers가 0이면 분석을 현재 프로세스에서 바로 실행합니다.
+    """
+
+    def __init__(self, workers: Optional[int] = None, max_pending: Optional[int] = None, wappalyzer=None):
+        """
+        Args:
+            workers (int, optional): 분석 프로세스 수 (기본값: CPU 코어 수, 0이면 현재 프로세스에서 분석)
+            max_pending (int, optional): 풀에 동시에 넣을 최대 분석 요청 수 (기본값: workers x 4)
+            wappalyzer (Wappalyzer, optional): 현재 프로세스에서 분석할 때 사용할 인스턴스
+        """
+        self.workers = (os.cpu_count() or 1) if workers is None else max(0, workers)
+        self.max_pending = max_pending or max(1, self.workers) * 4
+        self.wappalyzer = wappalyzer
+        self.mp_context = _pool_context()
+        self.executor: Optional[ProcessPoolExecutor] = None
+        self.pending = asyncio.Semaphore(self.max_pending)
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        """첫 분석 요청 시 프로세스 풀 생성"""
+        if self.executor is None:
+            self.executor = ProcessPoolExecutor(max_workers=self.workers, mp_context=self.mp_context,
+                                                initializer=_init_worker)
+        return self.executor
+
+    async def analyze(self, url: str, html: str, headers: List[Tuple[str, str]]) -> Optional[Dict]:
+        """
+        페이지 하나 분석
+
+        Returns:
+            Optional[Dict]: 분석 결과 (실패 시 None)
+        """
+        async with self.pending:
+            try:
+                if self.workers == 0:
+                    return analyze_page(url, html, headers, self.wappalyzer)
+                loop = asyncio.get_running_loop()
+                return await loop.run_in_executor(self._get_executor(), analyze_page, url, html, headers)
+            except Exception:
+                return None
+
+    def close(self) -> None:
+        """프로세스 풀 종료"""
+        if self.executor is not None:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+            self.executor = None
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+TCP connect 포트 스캐너 모듈
+"""
+import asyncio
+import socket
+from typing import List, Optional
+
+class PortScanner:
+    """
+    HTTP 검사 전에 열린 포트만 걸러내는 asyncio TCP connect 스캐너
+
+    호스트 이름은 한 번만 해석하고 이후에는 IP로 직접 연결하며, 연결이 성립하면
+    데이터를 보내지 않고 바로 닫습니다.
+    """
+
+    def __init__(self, timeout: float = 1.0, concurrency: int = 500, host_concurrency: int = 100):
+        """
+        Args:
+            timeout (float): 포트별 연결 제한 시간(초)
+            concurrency (int): 전체에서 동시에 시도할 최대 연결 수
+            host_concurrency (int): 호스트 하나에 동시에 시도할 최대 연결 수
+        """
+        self.timeout = timeout
+        self.host_concurrency = max(1, host_concurrency)
+        self.semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def resolve(self, host: str) -> Optional[str]:
+        """호스트의 첫 번째 주소 조회 (실패 시 None)"""
+        try:
+            infos = await asyncio.get_event_loop().getaddrinfo(host, None, type=socket.SOCK_STREAM)
+        except (socket.gaierror, UnicodeError):
+            return None
+        return infos[0][4][0] if infos else None
+
+    async def is_open(self, address: str, port: int) -> bool:
+        """TCP 연결 성공 여부 확인"""
+        async with self.semaphore:
+            try:
+                _, writer = await asyncio.wait_for(
+                    asyncio.open_connection(address, port),
+                    timeout=self.timeout
+                )
+            except (OSError, asyncio.TimeoutError):
+                return False
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except OSError:
+                pass
+            return True
+
+    async def scan(self, host: str, ports: List[int], address: Optional[str] = None) -> List[int]:
+        """
+        열린 포트 목록 반환
+
+        Args:
+            host (str): 대상 호스트
+            ports (List[int]): 검사할 포트 목록
+            address (str, optional): 이미 해석된 IP 주소
+
+        Returns:
+            List[int]: 열린 포트 (입력 순서 유지)
+        """
+        address = address or await self.resolve(host)
+        if not address:
+            return []
+        open_ports = set()
+        remaining = iter(ports)
+        
+        async def worker():
+            """남은 포트를 차례로 연결 시도"""
+            for port in remaining:
+                if await self.is_open(address, port):
+                    open_ports.add(port)
+                    
+        await asyncio.gather(*(worker() for _ in range(min(self.host_concurrency, len(ports)))))
+        return [port for port in ports if port in open_ports]
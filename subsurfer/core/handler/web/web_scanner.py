@@ -5,32 +5,69 @@
 """
 import asyncio
 import aiohttp
-from typing import Dict, Set, List, Tuple, Optional
-from Wappalyzer import Wappalyzer, WebPage
+from typing import TYPE_CHECKING, Dict, Set, List, Tuple, Optional
 import random
 from rich.console import Console
+from subsurfer.core.handler.web.port_scanner import PortScanner
+from subsurfer.core.utils.resolver import AsyncResolver, AiohttpResolver
+from subsurfer.core.utils.wildcard import WildcardFilter
+from subsurfer.core.handler.web.analyzer import FingerprintAnalyzer
 import warnings
-import socket
+# Wappalyzer(룰셋 로드에 pkg_resources 포함)는 분석 시점에 analyzer에서 import
+if TYPE_CHECKING:
+    from Wappalyzer import Wappalyzer
 # Wappalyzer 경고 무시
 warnings.filterwarnings('ignore', module='Wappalyzer')
 console = Console()
 class WebScanner:
     """웹 서비스 스캐너"""
     
-    def __init__(self, domain: str, ports: List[int] = None, verbose: int = 0, silent: bool = False):
+    def __init__(self, domain: str, ports: List[int] = None, verbose: int = 0, silent: bool = False,
+                 semaphore: Optional[asyncio.Semaphore] = None, wappalyzer: Optional['Wappalyzer'] = None,
+                 printer=None, probe_concurrency: int = 200, host_concurrency: int = 16,
+                 resolver: Optional[AsyncResolver] = None, analyzer: Optional[FingerprintAnalyzer] = None,
+                 analysis_workers: Optional[int] = None, filter_wildcards: bool = True):
         """
         Args:
             domain (str): 대상 도메인
             ports (List[int]): 스캔할 포트 목록
             verbose (int): verbose 레벨
             silent (bool): 상태 메시지 출력 여부
+            semaphore (asyncio.Semaphore, optional): 여러 스캐너가 공유하는 전역 스캔 제한
+            wappalyzer (Wappalyzer, optional): 현재 프로세스에서 분석할 때 사용할 Wappalyzer 인스턴스
+            printer (StreamPrinter, optional): 결과를 확인 즉시 출력할 스트리밍 출력기
+            probe_concurrency (int): 동시에 진행할 최대 (호스트, 포트, 프로토콜) 요청 수
+            host_concurrency (int): 호스트 하나에 대해 동시에 검사할 최대 포트 수
+            resolver (AsyncResolver, optional): 공유 비동기 DNS 리졸버 (없으면 새로 생성)
+            analyzer (FingerprintAnalyzer, optional): 공유 핑거프린트 분석 프로세스 풀
+            analysis_workers (int, optional): analyzer가 없을 때 생성할 분석 프로세스 수
+                                              (기본값: CPU 코어 수, wappalyzer 지정 시 0)
+            filter_wildcards (bool): 와일드카드 DNS 응답으로만 해석되는 이름을 스캔에서 제외할지 여부
         """
         self.domain = domain
         self.ports = ports  # 포트가 지정된 경우 그대로 사용
         self.default_ports = [80, 443]  # 기본 포트는 별도 저장
         self.verbose = verbose  # verbose 저장
         self.silent = silent  # silent 모드 저장
-        self.wappalyzer = Wappalyzer.latest()
+        self.wappalyzer = wappalyzer
+        self.shared_semaphore = semaphore
+        self.concurrency = 50  # 동시에 50개까지 실행
+        self.printer = printer
+        self.probe_concurrency = max(1, probe_concurrency)
+        self.host_concurrency = max(1, host_concurrency)
+        self.probe_semaphore = asyncio.Semaphore(self.probe_concurrency)  # 전체 요청 예산
+        self.port_scanner = PortScanner()  # HTTP 검사 전 TCP 연결 사전 스캔
+        self.resolver = resolver or AsyncResolver()  # 이벤트 루프를 막지 않는 DNS 조회
+        self.wildcard_filter = WildcardFilter(self.resolver, domain) if filter_wildcards else None
+        self.wildcard_skipped = 0  # 와일드카드로 판단되어 제외된 이름 수
+        self._owns_analyzer = analyzer is None
+        if analyzer is None:
+            # Wappalyzer 인스턴스를 직접 받은 경우 현재 프로세스에서 분석
+            analyzer = FingerprintAnalyzer(
+                workers=0 if wappalyzer is not None else analysis_workers,
+                wappalyzer=wappalyzer
+            )
+        self.analyzer = analyzer
         self.user_agents = [
             'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
             'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36',
@@ -43,7 +80,9 @@ class WebScanner:
         
     async def __aenter__(self):
         """비동기 컨텍스트 매니저 진입"""
-        connector = aiohttp.TCPConnector(ssl=False)  # SSL 검증 비활성화
+        # SSL 검증 비활성화, 이름 해석은 사전 조회 단계의 리졸버 캐시 사용
+        connector = aiohttp.TCPConnector(ssl=False, limit=self.probe_concurrency,
+                                         resolver=AiohttpResolver(self.resolver))
         self.session = aiohttp.ClientSession(connector=connector)
         return self
         
@@ -51,96 +90,207 @@ class WebScanner:
         """비동기 컨텍스트 매니저 종료"""
         if self.session:
             await self.session.close()
+        if self._owns_analyzer:
+            self.analyzer.close()
             
     def _get_random_user_agent(self) -> str:
         """랜덤 User-Agent 반환"""
         return random.choice(self.user_agents)
         
+    async def _fetch(self, url: str) -> Optional[Tuple[str, str, List[Tuple[str, str]]]]:
+        """
+        전역 요청 예산 안에서 URL 하나 요청
+        
+        HTML 파싱과 분석은 분석 프로세스에서 수행하므로 응답 원문만 반환합니다.
+        
+        Returns:
+            Optional[Tuple]: (최종 URL, 본문, 헤더 목록), 실패 시 None
+        """
+        async with self.probe_semaphore:
+            try:
+                async with self.session.get(url, timeout=aiohttp.ClientTimeout(total=2)) as response:
+                    html = await response.text()
+                    return str(response.url), html, list(response.headers.items())
+            except:
+                return None
+        
     async def check_web_server(self, subdomain: str, port: int = None) -> Tuple[bool, str, Dict]:
-        """웹 서버 여부 확인"""
-        headers = {'User-Agent': self._get_random_user_agent()}
+        """웹 서버 여부 확인 - https와 http를 동시에 시도하고 https 결과를 우선 사용"""
         protocols = ['https', 'http']
-        
+        urls = []
         for protocol in protocols:
             url = f"{protocol}://{subdomain}"
             if port and port not in [80, 443]:
                 url = f"{url}:{port}"
-                
-            try:
-                webpage = await WebPage.new_from_url_async(
-                    url, 
-                    verify=False, 
-                    timeout=2,
-                    aiohttp_client_session=self.session
-                )
-                analysis = self.wappalyzer.analyze_with_versions_and_categories(webpage)
+            urls.append(url)
+            
+        tasks = [asyncio.ensure_future(self._fetch(url)) for url in urls]
+        try:
+            for url, task in zip(urls, tasks):
+                page = await task
+                if page is None:
+                    continue
+                # 분석은 프로세스 풀에서 실행되어 네트워크 검사를 막지 않음
+                analysis = await self.analyzer.analyze(*page)
+                if analysis is None:
+                    continue
                 if port:  # 포트 스캔 결과 저장
                     self.all_urls[subdomain] = self.all_urls.get(subdomain, [])
                     self.all_urls[subdomain].append((url, port))
+                    if self.printer:
+                        self.printer.url(url, port)
                 return True, url, analysis
-            except:
-                continue
+        finally:
+            # https가 성공하면 진행 중인 http 요청은 취소
+            for task in tasks:
+                task.cancel()
                 
         return False, "", {}
         
-    def _is_host_active(self, subdomain: str) -> bool:
-        """호스트 활성화 여부 확인"""
-        try:
-            socket.gethostbyname(subdomain)
-            return True
-        except socket.gaierror:
-            return False
+    async def _is_host_active(self, subdomain: str) -> bool:
+        """호스트 활성화 여부 확인 (사전 조회 결과 캐시 사용)"""
+        return await self.resolver.is_alive(subdomain)
             
-    async def scan_subdomain(self, subdomain: str) -> Dict[str, Dict]:
-        """서브도메인의 모든 포트에 대한 스캔"""
+    async def scan_subdomain(self, subdomain: str, addresses: Optional[List[str]] = None) -> Dict[str, Dict]:
+        """
+        서브도메인의 모든 포트에 대한 스캔
+        
+        Args:
+            subdomain (str): 대상 서브도메인
+            addresses (List[str], optional): 사전 조회 단계에서 해석된 IP 주소
+        """
         web_services = {}
         scan_ports = self.ports if self.ports else self.default_ports
         
+        if addresses is None:
+            addresses = await self.resolver.resolve(subdomain)
+        if not addresses:
+            return web_services
+        
         if self.verbose and not self.silent:
             console.print(f"[bold blue][*][/] Scanning ports for {subdomain}: {scan_ports}")
         
-        for port in scan_ports:
-            is_web, url, analysis = await self.check_web_server(subdomain, port)
-            if is_web:
-                self.web_servers.add(subdomain)
-                web_services[url] = analysis
+        # 열린 포트만 HTTP/Wappalyzer 단계로 전달
+        open_ports = await self.port_scanner.scan(subdomain, scan_ports, address=addresses[0])
+        if self.verbose and not self.silent:
+            console.print(f"[bold blue][*][/] Open ports for {subdomain}: {open_ports}")
+        
+        ports = iter(open_ports)
+        
+        async def probe_ports():
+            """호스트별 동시 실행 제한 안에서 남은 포트를 차례로 검사"""
+            for port in ports:
+                is_web, url, analysis = await self.check_web_server(subdomain, port)
+                if is_web:
+                    # 웹 포트가 여러 개여도 호스트는 한 번만 출력
+                    first = subdomain not in self.web_servers
+                    self.web_servers.add(subdomain)
+                    web_services[url] = analysis
+                    if self.printer and first:
+                        self.printer.web_server(subdomain)
+                        
+        workers = min(self.host_concurrency, len(open_ports))
+        await asyncio.gather(*(probe_ports() for _ in range(workers)))
+        
+        # 포트 순서대로 정렬 (동시 실행으로 발견 순서가 섞임)
+        if subdomain in self.all_urls:
+            self.all_urls[subdomain].sort(key=lambda item: item[1])
                 
-        if not web_services and self._is_host_active(subdomain):
+        if not web_services and await self._is_host_active(subdomain):
             self.enabled_services.add(subdomain)
+            if self.printer:
+                self.printer.enabled_service(subdomain)
             
         return web_services
         
-    async def scan(self, subdomains: Set[str]) -> Dict[str, Dict]:
-        """모든 서브도메인 스캔"""
+    async def _scan_one(self, subdomain: str, addresses: Optional[List[str]] = None) -> Dict[str, Dict]:
+        """서브도메인 하나 스캔 (전역 제한 적용)"""
+        try:
+            if self.shared_semaphore is not None:
+                async with self.shared_semaphore:
+                    return await self._scan_subdomain_logged(subdomain, addresses)
+            return await self._scan_subdomain_logged(subdomain, addresses)
+        except Exception as e:
+            if not self.silent:
+                console.print(f"[bold red][-][/] [white]{subdomain} Error during scanning: {str(e)}[/]")
+            return {}
+            
+    async def _scan_subdomain_logged(self, subdomain: str, addresses: Optional[List[str]] = None) -> Dict[str, Dict]:
+        """진행 상황 출력과 함께 서브도메인 스캔"""
+        if not self.silent:
+            console.print(f"[bold blue][*][/] [white]Scanning: {subdomain}[/]")
+        return await self.scan_subdomain(subdomain, addresses)
+        
+    async def scan_stream(self, queue: asyncio.Queue) -> Dict[str, Dict]:
+        """
+        큐로 들어오는 서브도메인을 도착하는 즉시 스캔
+        
+        먼저 비동기 DNS 조회 단계를 거쳐 해석되지 않는 이름과 와일드카드 DNS 응답으로만
+        해석되는 이름은 HTTP 검사 전에 제외하고, 나머지 이름만 주소와 함께 스캔 워커로 전달합니다.
+        
+        Args:
+            queue (asyncio.Queue): 스캔할 서브도메인 큐 (None을 넣으면 종료)
+            
+        Returns:
+            Dict[str, Dict]: scan()과 동일한 형식의 결과
+        """
         web_services = {}
+        resolved = asyncio.Queue(maxsize=self.concurrency * 4)
+        
+        async def resolve_worker():
+            """큐에서 서브도메인을 꺼내 DNS 조회 후 해석된 이름만 전달"""
+            while True:
+                subdomain = await queue.get()
+                if subdomain is None:
+                    # 다른 워커도 종료할 수 있도록 종료 신호를 되돌려 놓음
+                    queue.put_nowait(None)
+                    return
+                addresses = await self.resolver.resolve(subdomain)
+                if not addresses:
+                    if self.verbose and not self.silent:
+                        console.print(f"[bold yellow][!][/] [white]{subdomain} does not resolve, skipped[/]")
+                elif self.wildcard_filter and await self.wildcard_filter.is_wildcard(subdomain, addresses):
+                    self.wildcard_skipped += 1
+                    if self.verbose and not self.silent:
+                        console.print(f"[bold yellow][!][/] [white]{subdomain} matches wildcard DNS, skipped[/]")
+                else:
+                    await resolved.put((subdomain, addresses))
+                    
+        async def resolve_stage():
+            """조회 워커 실행 후 스캔 워커에 종료 신호 전달"""
+            try:
+                await asyncio.gather(*(resolve_worker() for _ in range(self.resolver.concurrency)))
+            finally:
+                await resolved.put(None)
         
+        async def worker():
+            """해석된 서브도메인을 꺼내 스캔"""
+            while True:
+                item = await resolved.get()
+                if item is None:
+                    resolved.put_nowait(None)
+                    return
+                result = await self._scan_one(*item)
+                if result:
+                    web_services.update(result)
+                    
         # 동시 실행할 최대 작업 수 제한
-        semaphore = asyncio.Semaphore(50)  # 동시에 50개까지 실행
-        
-        async def scan_with_semaphore(subdomain: str):
-            """세마포어를 사용한 스캔"""
-            async with semaphore:
-                try:
-                    if not self.silent:
-                        console.print(f"[bold blue][*][/] [white]Scanning: {subdomain}[/]")
-                    return await self.scan_subdomain(subdomain)
-                except Exception as e:
-                    if not self.silent:
-                        console.print(f"[bold red][-][/] [white]{subdomain} Error during scanning: {str(e)}[/]")
-                    return {}
-        
-        # 모든 서브도메인에 대해 동시에 스캔 실행
-        tasks = [scan_with_semaphore(subdomain) for subdomain in subdomains]
-        results = await asyncio.gather(*tasks)
-        
-        # 결과 취합
-        for result in results:
-            if result:
-                web_services.update(result)
+        await asyncio.gather(resolve_stage(), *(worker() for _ in range(self.concurrency)))
+        
+        if self.wildcard_skipped and not self.silent:
+            console.print(f"[bold yellow][!][/] [white]{self.wildcard_skipped} subdomains skipped: wildcard DNS[/]")
                 
         return {
             'web_services': web_services,
             'web_servers': self.web_servers,
             'enabled_services': self.enabled_services,
             'all_urls': self.all_urls  # 포트 스캔 결과 포함
-        } 
\ No newline at end of file
+        }
+        
+    async def scan(self, subdomains: Set[str]) -> Dict[str, Dict]:
+        """모든 서브도메인 스캔"""
+        queue = asyncio.Queue()
+        for subdomain in subdomains:
+            queue.put_nowait(subdomain)
+        queue.put_nowait(None)
+        return await self.scan_stream(queue)
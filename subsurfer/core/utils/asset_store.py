@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+타겟별 자산 상태 저장소 모듈 (증분 스캔용)
+"""
+
+import json
+import os
+import sqlite3
+import time
+from typing import Any, Dict, Iterable, List, Optional
+from urllib.parse import urlsplit
+
+from subsurfer.core.utils.paths import get_state_dir
+
+STATE_FILENAME = "assets.sqlite3"
+
+# 이 시간이 지난 자산만 다시 검사
+DEFAULT_PROBE_TTL = 24 * 3600
+
+class AssetStore:
+    """
+    타겟별 서브도메인 자산 상태 저장소
+
+    서브도메인마다 처음/마지막 발견 시각, 마지막 검사 시각, 해석된 IP, 열린 웹 포트,
+    핑거프린트를 SQLite에 저장합니다. 증분 스캔은 이 정보를 기준으로 새로 발견되었거나
+    검사 결과가 만료된 자산만 다시 검사하고 이전 실행과의 차이를 계산합니다.
+    """
+
+    def __init__(self, state_dir: Optional[str] = None, probe_ttl: float = DEFAULT_PROBE_TTL):
+        """
+        Args:
+            state_dir (str, optional): 상태 저장 디렉토리 (기본값: get_state_dir())
+            probe_ttl (float): 검사 결과 유지 시간(초), 지나면 다시 검사
+        """
+        self.state_dir = state_dir or get_state_dir()
+        self.probe_ttl = probe_ttl
+        self.path = os.path.join(self.state_dir, STATE_FILENAME)
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def _connect(self) -> sqlite3.Connection:
+        """첫 사용 시 데이터베이스 연결 및 테이블 생성"""
+        if self._conn is None:
+            os.makedirs(self.state_dir, exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=10)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS assets ("
+                "target TEXT NOT NULL, subdomain TEXT NOT NULL, "
+                "first_seen REAL NOT NULL, last_seen REAL NOT NULL, last_probed REAL, "
+                "ports_key TEXT, addresses TEXT, web INTEGER DEFAULT 0, enabled INTEGER DEFAULT 0, "
+                "urls TEXT, services TEXT, PRIMARY KEY (target, subdomain))"
+            )
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    @staticmethod
+    def ports_key(ports: Optional[List[int]]) -> str:
+        """검사 포트 목록 식별자 (포트 목록이 바뀌면 이전 검사 결과는 만료로 취급)"""
+        if not ports:
+            return "default"
+        return ",".join(str(port) for port in sorted(set(ports)))
+
+    def load(self, target: str) -> Dict[str, Dict[str, Any]]:
+        """
+        타겟의 저장된 자산 로드
+
+        Returns:
+            Dict[str, Dict[str, Any]]: 서브도메인별 자산 레코드
+        """
+        rows = self._connect().execute(
+            "SELECT subdomain, first_seen, last_seen, last_probed, ports_key, addresses, web, enabled, "
+            "urls, services FROM assets WHERE target = ?",
+            (target,)
+        ).fetchall()
+
+        records = {}
+        for row in rows:
+            records[row[0]] = {
+                'first_seen': row[1],
+                'last_seen': row[2],
+                'last_probed': row[3],
+                'ports_key': row[4],
+                'addresses': json.loads(row[5] or '[]'),
+                'web': bool(row[6]),
+                'enabled': bool(row[7]),
+                'urls': [tuple(item) for item in json.loads(row[8] or '[]')],
+                'services': json.loads(row[9] or '{}'),
+            }
+        return records
+
+    def is_fresh(self, record: Dict[str, Any], ports_key: str, now: Optional[float] = None) -> bool:
+        """같은 포트 목록으로 검사한 결과가 아직 유효한지 여부"""
+        if record.get('last_probed') is None or record.get('ports_key') != ports_key:
+            return False
+        return (now or time.time()) - record['last_probed'] < self.probe_ttl
+
+    @staticmethod
+    def build_record(subdomain: str, results: Dict[str, Any], addresses: Iterable[str]) -> Dict[str, Any]:
+        """
+        웹 스캔 결과에서 서브도메인 하나의 자산 레코드 생성
+
+        Args:
+            subdomain (str): 서브도메인
+            results (Dict[str, Any]): run_pipeline 결과 딕셔너리
+            addresses (Iterable[str]): 해석된 IP 주소
+        """
+        return {
+            'addresses': sorted(addresses),
+            'web': subdomain in results['web_servers'],
+            'enabled': subdomain in results['enabled_services'],
+            'urls': sorted(results['all_urls'].get(subdomain, []), key=lambda item: item[1]),
+            'services': {
+                url: analysis for url, analysis in results['web_services'].items()
+                if urlsplit(url).hostname == subdomain
+            },
+        }
+
+    @staticmethod
+    def has_changed(previous: Dict[str, Any], current: Dict[str, Any]) -> bool:
+        """웹 서버 여부, 활성 여부, 열린 URL, 핑거프린트 중 하나라도 바뀌었는지 여부"""
+        return any(previous.get(key) != current.get(key) for key in ('web', 'enabled', 'urls', 'services'))
+
+    def save(self, target: str, subdomains: Iterable[str], probed: Dict[str, Dict[str, Any]],
+             ports_key: str, now: Optional[float] = None) -> None:
+        """
+        이번 실행 결과 저장
+
+        Args:
+            target (str): 대상 도메인
+            subdomains (Iterable[str]): 이번 실행에서 발견된 모든 서브도메인
+            probed (Dict[str, Dict[str, Any]]): 이번 실행에서 다시 검사한 서브도메인의 자산 레코드
+            ports_key (str): 검사 포트 목록 식별자
+            now (float, optional): 기준 시각
+        """
+        now = now or time.time()
+        conn = self._connect()
+        conn.executemany(
+            "INSERT INTO assets (target, subdomain, first_seen, last_seen) VALUES (?, ?, ?, ?) "
+            "ON CONFLICT (target, subdomain) DO UPDATE SET last_seen = excluded.last_seen",
+            [(target, subdomain, now, now) for subdomain in subdomains]
+        )
+        conn.executemany(
+            "UPDATE assets SET last_probed = ?, ports_key = ?, addresses = ?, web = ?, enabled = ?, "
+            "urls = ?, services = ? WHERE target = ? AND subdomain = ?",
+            [
+                (now, ports_key, json.dumps(record['addresses']), int(record['web']), int(record['enabled']),
+                 json.dumps(record['urls']), json.dumps(record['services']), target, subdomain)
+                for subdomain, record in probed.items()
+            ]
+        )
+        conn.commit()
+
+    def close(self) -> None:
+        """데이터베이스 연결 종료"""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
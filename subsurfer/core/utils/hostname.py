@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+호스트명 정규화 모듈
+"""
+
+import re
+import sys
+from functools import lru_cache
+from typing import Iterable, Optional, Set
+
+# DNS 레이블 (밑줄은 실제 레코드에서 쓰이므로 허용)
+LABEL_PATTERN = re.compile(r'^[a-z0-9_](?:[a-z0-9_-]{0,61}[a-z0-9_])?$')
+
+MAX_HOSTNAME_LENGTH = 253
+
+@lru_cache(maxsize=65536)
+def normalize_hostname(name: str, domain: str) -> Optional[str]:
+    """
+    소스가 반환한 이름 하나를 정규화
+
+    소문자 변환, 와일드카드(*.)와 앞뒤 점 제거, IDNA 인코딩 후 레이블 형식과
+    대상 도메인 접미사를 검사합니다. 결과 문자열은 intern되어 여러 소스와
+    단계에서 같은 객체를 공유합니다.
+
+    Args:
+        name (str): 원본 이름 (예: "*.WWW.Example.com.")
+        domain (str): 대상 도메인 (예: example.com)
+
+    Returns:
+        Optional[str]: 정규화된 호스트명, 형식이 잘못되었거나 대상 도메인 밖이면 None
+    """
+    name = name.strip().lower().rstrip('.')
+    while name.startswith('*.'):
+        name = name[2:]
+    name = name.lstrip('.')
+    if not name:
+        return None
+
+    if not name.isascii():
+        try:
+            name = name.encode('idna').decode('ascii')
+        except UnicodeError:
+            return None
+
+    if len(name) > MAX_HOSTNAME_LENGTH:
+        return None
+    if name != domain and not name.endswith(f".{domain}"):
+        return None
+    if not all(LABEL_PATTERN.match(label) for label in name.split('.')):
+        return None
+    return sys.intern(name)
+
+def split_names(value: str) -> Iterable[str]:
+    """한 필드에 여러 이름이 들어 있는 값(예: crt.sh name_value) 분리"""
+    return value.split()
+
+def normalize_hostnames(names: Iterable[str], domain: str) -> Set[str]:
+    """
+    여러 이름을 정규화하고 중복 제거
+
+    Args:
+        names (Iterable[str]): 원본 이름 목록 (한 값에 공백/줄바꿈으로 구분된 여러 이름 허용)
+        domain (str): 대상 도메인
+
+    Returns:
+        Set[str]: 정규화된 호스트명 집합
+    """
+    domain = domain.strip().lower().rstrip('.')
+    results = set()
+    for value in names:
+        if not isinstance(value, str):
+            continue
+        for name in split_names(value):
+            hostname = normalize_hostname(name, domain)
+            if hostname is not None:
+                results.add(hostname)
+    return results
@@ -0,0 +1,22 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+SubSurfer 로컬 데이터 경로 모듈
+"""
+
+import os
+
+def get_cache_dir() -> str:
+    """기본 캐시 디렉토리 (SUBSURFER_CACHE_DIR 또는 XDG_CACHE_HOME/subsurfer)"""
+    if os.environ.get('SUBSURFER_CACHE_DIR'):
+        return os.environ['SUBSURFER_CACHE_DIR']
+    base = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(base, 'subsurfer')
+
+def get_state_dir() -> str:
+    """기본 상태 저장 디렉토리 (SUBSURFER_STATE_DIR 또는 XDG_STATE_HOME/subsurfer)"""
+    if os.environ.get('SUBSURFER_STATE_DIR'):
+        return os.environ['SUBSURFER_STATE_DIR']
+    base = os.environ.get('XDG_STATE_HOME') or os.path.join(os.path.expanduser('~'), '.local', 'state')
+    return os.path.join(base, 'subsurfer')
@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+호스트별 요청 속도 제한, 재시도 및 서킷 브레이커 모듈
+"""
+
+import asyncio
+import contextvars
+import random
+import time
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional
+
+import aiohttp
+
+# 현재 요청을 보내는 패시브 소스 이름 (서킷 브레이커를 소스 단위로 관리하기 위해 사용)
+current_source: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar('current_source', default=None)
+
+# 기본값보다 엄격한 제한이 필요한 호스트 (초당 요청 수, 버스트)
+HOST_RATES: Dict[str, tuple] = {
+    'crt.sh': (1.0, 2),
+    'web.archive.org': (1.0, 3),
+    'api.hackertarget.com': (0.5, 1),
+    'urlscan.io': (1.0, 2),
+}
+
+# 재시도할 응답 코드
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+class CircuitOpenError(aiohttp.ClientError):
+    """서킷 브레이커가 열려 요청을 보내지 않음"""
+
+class TokenBucket:
+    """초당 rate개씩 채워지고 최대 burst개까지 쌓이는 토큰 버킷"""
+
+    def __init__(self, rate: float, burst: int):
+        """
+        Args:
+            rate (float): 초당 토큰 보충 수
+            burst (int): 최대 토큰 수
+        """
+        self.rate = rate
+        self.capacity = max(1, burst)
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """토큰 하나를 얻을 때까지 대기"""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+class CircuitBreaker:
+    """연속 실패가 threshold번 이상이면 열리고, 열린 뒤에는 reset 전까지 요청을 차단"""
+
+    def __init__(self, threshold: int = 5):
+        """
+        Args:
+            threshold (int): 서킷을 여는 연속 실패 횟수
+        """
+        self.threshold = max(1, threshold)
+        self.failures = 0
+
+    @property
+    def is_open(self) -> bool:
+        """서킷이 열렸는지 여부"""
+        return self.failures >= self.threshold
+
+    def record_success(self) -> None:
+        """성공 시 연속 실패 횟수 초기화"""
+        if not self.is_open:
+            self.failures = 0
+
+    def record_failure(self) -> None:
+        """실패 횟수 증가"""
+        self.failures += 1
+
+    def reset(self) -> None:
+        """서킷 닫기"""
+        self.failures = 0
+
+class RateLimiter:
+    """
+    aiohttp 클라이언트 미들웨어로 동작하는 요청 제어기
+
+    - 호스트별 토큰 버킷으로 요청 속도 제한
+    - 429/5xx 및 연결 오류 시 지터를 더한 지수 백오프로 재시도 (Retry-After 우선)
+    - 재시도 후에도 실패한 요청이 연속으로 쌓이면 해당 소스(소스 정보가 없으면 호스트)의
+      서킷을 열어 이후 요청을 즉시 실패 처리
+    """
+
+    def __init__(self, rate: float = 5.0, burst: int = 10, retries: int = 3, backoff_base: float = 1.0,
+                 backoff_max: float = 30.0, failure_threshold: int = 5,
+                 host_rates: Optional[Dict[str, tuple]] = None):
+        """
+        Args:
+            rate (float): 호스트별 기본 초당 요청 수
+            burst (int): 호스트별 기본 버스트 크기
+            retries (int): 요청별 최대 재시도 횟수
+            backoff_base (float): 백오프 기본 대기 시간(초)
+            backoff_max (float): 백오프 및 Retry-After 최대 대기 시간(초)
+            failure_threshold (int): 서킷을 여는 연속 실패 요청 수
+            host_rates (Dict[str, tuple], optional): 호스트별 (초당 요청 수, 버스트) 재정의
+        """
+        self.rate = rate
+        self.burst = burst
+        self.retries = max(0, retries)
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.failure_threshold = failure_threshold
+        self.host_rates = dict(HOST_RATES, **(host_rates or {}))
+        self.buckets: Dict[str, TokenBucket] = {}
+        self.breakers: Dict[str, CircuitBreaker] = {}
+
+    def bucket(self, host: str) -> TokenBucket:
+        """호스트의 토큰 버킷"""
+        if host not in self.buckets:
+            rate, burst = self.host_rates.get(host, (self.rate, self.burst))
+            self.buckets[host] = TokenBucket(rate, burst)
+        return self.buckets[host]
+
+    def breaker(self, key: str) -> CircuitBreaker:
+        """소스 또는 호스트의 서킷 브레이커"""
+        if key not in self.breakers:
+            self.breakers[key] = CircuitBreaker(self.failure_threshold)
+        return self.breakers[key]
+
+    def is_open(self, key: str) -> bool:
+        """소스 또는 호스트의 서킷이 열렸는지 여부"""
+        return key in self.breakers and self.breakers[key].is_open
+
+    def backoff(self, attempt: int) -> float:
+        """지터를 더한 지수 백오프 대기 시간 (full jitter)"""
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** attempt)))
+
+    def retry_after(self, response: aiohttp.ClientResponse) -> Optional[float]:
+        """Retry-After 헤더 값(초), 없거나 잘못된 값이면 None"""
+        value = response.headers.get('Retry-After')
+        if not value:
+            return None
+        try:
+            delay = float(value)
+        except ValueError:
+            try:
+                delay = parsedate_to_datetime(value).timestamp() - time.time()
+            except (TypeError, ValueError):
+                return None
+        return min(self.backoff_max, max(0.0, delay))
+
+    async def middleware(self, request: aiohttp.ClientRequest, handler) -> aiohttp.ClientResponse:
+        """aiohttp 클라이언트 미들웨어"""
+        host = request.url.host or ''
+        breaker = self.breaker(current_source.get() or host)
+        attempt = 0
+        while True:
+            if breaker.is_open:
+                raise CircuitOpenError(f"Circuit open for {current_source.get() or host}")
+            await self.bucket(host).acquire()
+
+            try:
+                response = await handler(request)
+            except aiohttp.ClientConnectorDNSError:
+                # 이름 해석 실패는 재시도해도 결과가 같음
+                breaker.record_failure()
+                raise
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+                if attempt >= self.retries:
+                    breaker.record_failure()
+                    raise
+                await asyncio.sleep(self.backoff(attempt))
+                attempt += 1
+                continue
+
+            if response.status not in RETRY_STATUSES:
+                breaker.record_success()
+                return response
+            if attempt >= self.retries:
+                breaker.record_failure()
+                return response
+
+            delay = self.retry_after(response)
+            response.release()
+            await asyncio.sleep(self.backoff(attempt) if delay is None else delay)
+            attempt += 1
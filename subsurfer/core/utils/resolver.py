@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+비동기 대량 DNS 조회 모듈
+"""
+
+import asyncio
+import ipaddress
+import os
+import socket
+from typing import Dict, List, Optional
+
+import dns.asyncresolver
+import dns.exception
+import dns.resolver
+from aiohttp.abc import AbstractResolver
+
+# 시스템 설정(/etc/resolv.conf)을 읽을 수 없을 때 사용할 공개 리졸버
+FALLBACK_NAMESERVERS = ['1.1.1.1', '8.8.8.8', '9.9.9.9']
+
+def load_resolvers(value: str) -> List[str]:
+    """
+    리졸버 목록 파싱
+
+    Args:
+        value (str): 쉼표로 구분한 리졸버 목록 또는 한 줄에 하나씩 적힌 파일 경로
+                     (각 항목은 ip 또는 ip:port 형식)
+
+    Returns:
+        List[str]: 리졸버 목록
+    """
+    if os.path.isfile(value):
+        with open(value, 'r', encoding='utf-8') as f:
+            entries = [line.split('#', 1)[0] for line in f.read().splitlines()]
+    else:
+        entries = value.split(',')
+    return [entry.strip() for entry in entries if entry.strip()]
+
+class AsyncResolver:
+    """
+    이벤트 루프를 막지 않는 DNS 리졸버
+
+    dnspython의 비동기 리졸버 위에 동시 조회 수 제한, 타임아웃 재시도와 결과 캐시를
+    더한 것으로, 같은 이름을 여러 단계에서 조회해도 실제 질의는 한 번만 나갑니다.
+    """
+
+    def __init__(self, nameservers: Optional[List[str]] = None, timeout: float = 2.0,
+                 retries: int = 2, concurrency: int = 200):
+        """
+        Args:
+            nameservers (List[str], optional): 사용할 리졸버 목록 (ip 또는 ip:port, 없으면 시스템 설정)
+            timeout (float): 질의 1회 제한 시간(초)
+            retries (int): 타임아웃/SERVFAIL 시 재시도 횟수
+            concurrency (int): 동시에 진행할 최대 질의 수
+        """
+        self.timeout = timeout
+        self.retries = max(0, retries)
+        self.concurrency = max(1, concurrency)
+        self.semaphore = asyncio.Semaphore(self.concurrency)
+        self.resolver = self._create_resolver(nameservers)
+        self.cache: Dict[str, List[str]] = {}
+        self._pending: Dict[str, asyncio.Future] = {}
+
+    def _create_resolver(self, nameservers: Optional[List[str]]) -> dns.asyncresolver.Resolver:
+        """dnspython 리졸버 생성"""
+        if not nameservers:
+            try:
+                resolver = dns.asyncresolver.Resolver()
+            except dns.resolver.NoResolverConfiguration:
+                resolver = dns.asyncresolver.Resolver(configure=False)
+                resolver.nameservers = list(FALLBACK_NAMESERVERS)
+        else:
+            resolver = dns.asyncresolver.Resolver(configure=False)
+            addresses = []
+            ports = {}
+            for entry in nameservers:
+                address, port = entry, 53
+                # ip:port 형식 (IPv6 주소는 [addr]:port)
+                if entry.startswith('['):
+                    address, _, rest = entry[1:].partition(']')
+                    if rest.startswith(':'):
+                        port = int(rest[1:])
+                elif entry.count(':') == 1:
+                    address, port = entry.split(':')
+                    port = int(port)
+                addresses.append(address)
+                ports[address] = port
+            resolver.nameservers = addresses
+            resolver.nameserver_ports = ports
+            resolver.rotate = len(addresses) > 1
+        resolver.timeout = self.timeout
+        resolver.lifetime = self.timeout
+        return resolver
+
+    async def query(self, name: str, rdtype: str = 'A') -> List[str]:
+        """
+        레코드 조회
+
+        Args:
+            name (str): 조회할 이름
+            rdtype (str): 레코드 타입
+
+        Returns:
+            List[str]: 응답 레코드 (없거나 조회 실패 시 빈 목록)
+        """
+        for attempt in range(self.retries + 1):
+            try:
+                async with self.semaphore:
+                    answer = await self.resolver.resolve(name, rdtype, search=False)
+                return [record.to_text().rstrip('.') for record in answer]
+            except (dns.resolver.NXDOMAIN, dns.resolver.NoAnswer, dns.resolver.YXDOMAIN):
+                return []
+            except (dns.exception.Timeout, dns.resolver.NoNameservers):
+                continue
+            except (dns.exception.DNSException, ValueError, UnicodeError):
+                return []
+        return []
+
+    async def _resolve(self, name: str) -> List[str]:
+        """A 레코드 조회, 없으면 AAAA 레코드 조회"""
+        addresses = await self.query(name, 'A')
+        if not addresses:
+            addresses = await self.query(name, 'AAAA')
+        return addresses
+
+    async def resolve(self, name: str) -> List[str]:
+        """
+        이름의 IP 주소 조회 (캐시 사용)
+
+        Args:
+            name (str): 조회할 이름
+
+        Returns:
+            List[str]: IP 주소 목록 (해석되지 않으면 빈 목록)
+        """
+        if name in self.cache:
+            return self.cache[name]
+        # IP 주소는 조회 없이 그대로 사용
+        try:
+            return [str(ipaddress.ip_address(name))]
+        except ValueError:
+            pass
+        # 같은 이름에 대한 동시 조회는 하나의 질의를 공유
+        if name in self._pending:
+            return await asyncio.shield(self._pending[name])
+
+        future = asyncio.ensure_future(self._resolve(name))
+        self._pending[name] = future
+        try:
+            addresses = await asyncio.shield(future)
+        finally:
+            self._pending.pop(name, None)
+        self.cache[name] = addresses
+        return addresses
+
+    def remember(self, name: str, addresses: List[str]) -> None:
+        """
+        다른 경로로 조회한 결과를 캐시에 저장 (이후 resolve()는 다시 질의하지 않음)
+
+        Args:
+            name (str): 조회한 이름
+            addresses (List[str]): IP 주소 목록
+        """
+        self.cache[name] = list(addresses)
+
+    async def is_alive(self, name: str) -> bool:
+        """이름이 해석되는지 여부"""
+        return bool(await self.resolve(name))
+
+class AiohttpResolver(AbstractResolver):
+    """
+    aiohttp 연결이 AsyncResolver의 조회 결과를 사용하도록 하는 어댑터
+
+    사전 조회 단계에서 캐시된 주소를 그대로 사용하므로 HTTP 요청마다 시스템
+    리졸버(getaddrinfo 스레드)로 같은 이름을 다시 조회하지 않습니다.
+    """
+
+    def __init__(self, resolver: AsyncResolver):
+        """
+        Args:
+            resolver (AsyncResolver): 공유 비동기 DNS 리졸버
+        """
+        self.resolver = resolver
+
+    async def resolve(self, host: str, port: int = 0, family: socket.AddressFamily = socket.AF_INET) -> List[Dict]:
+        """aiohttp ResolveResult 목록 반환 (해석되지 않으면 OSError)"""
+        results = []
+        for address in await self.resolver.resolve(host):
+            try:
+                version = ipaddress.ip_address(address).version
+            except ValueError:
+                continue
+            results.append({
+                'hostname': host,
+                'host': address,
+                'port': port,
+                'family': socket.AF_INET6 if version == 6 else socket.AF_INET,
+                'proto': 0,
+                'flags': socket.AI_NUMERICHOST,
+            })
+        if not results:
+            raise OSError(f"Could not resolve {host}")
+        return results
+
+    async def close(self) -> None:
+        """공유 리졸버이므로 닫지 않음"""
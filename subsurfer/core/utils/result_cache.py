@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+패시브 소스 결과 디스크 캐시 모듈
+"""
+
+import os
+import sqlite3
+import time
+from typing import Dict, Optional, Set, Tuple
+
+from subsurfer.core.utils.paths import get_cache_dir
+
+CACHE_FILENAME = "passive.sqlite3"
+
+# 소스별 캐시 유지 시간(초) - 갱신 주기가 길거나 응답이 느린 아카이브는 길게 유지
+DEFAULT_TTL = 24 * 3600
+SOURCE_TTLS: Dict[str, int] = {
+    'crt.sh': 12 * 3600,
+    'MerkleMap': 12 * 3600,
+    'Urlscan': 12 * 3600,
+    'WebArchive': 7 * 24 * 3600,
+    'DNS Archive': 3 * 24 * 3600,
+}
+
+# TTL이 지난 뒤에도 이 시간까지는 기존 결과를 먼저 사용하고 백그라운드에서 갱신
+DEFAULT_STALE_TTL = 7 * 24 * 3600
+
+FRESH = 'fresh'
+STALE = 'stale'
+
+class ResultCache:
+    """
+    (소스, 도메인) 단위 패시브 수집 결과 캐시
+
+    SQLite 파일 하나에 소스별 결과와 수집 시각을 저장합니다. TTL 이내의 결과는
+    그대로 사용하고(fresh), TTL이 지났지만 stale_ttl 이내인 결과는 먼저 사용한 뒤
+    갱신합니다(stale-while-revalidate).
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None, ttls: Optional[Dict[str, int]] = None,
+                 default_ttl: int = DEFAULT_TTL, stale_ttl: int = DEFAULT_STALE_TTL):
+        """
+        Args:
+            cache_dir (str, optional): 캐시 디렉토리 (기본값: get_cache_dir())
+            ttls (Dict[str, int], optional): 소스별 TTL(초) 재정의
+            default_ttl (int): ttls에 없는 소스의 TTL(초)
+            stale_ttl (int): TTL 이후 stale 결과를 사용할 수 있는 추가 시간(초)
+        """
+        self.cache_dir = cache_dir or get_cache_dir()
+        self.ttls = dict(SOURCE_TTLS, **(ttls or {}))
+        self.default_ttl = default_ttl
+        self.stale_ttl = stale_ttl
+        self.path = os.path.join(self.cache_dir, CACHE_FILENAME)
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def _connect(self) -> sqlite3.Connection:
+        """첫 사용 시 데이터베이스 연결 및 테이블 생성"""
+        if self._conn is None:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=10)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS results ("
+                "source TEXT NOT NULL, domain TEXT NOT NULL, fetched_at REAL NOT NULL, "
+                "subdomains TEXT NOT NULL, PRIMARY KEY (source, domain))"
+            )
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    def ttl_for(self, source: str) -> int:
+        """소스의 TTL(초)"""
+        return self.ttls.get(source, self.default_ttl)
+
+    def get(self, source: str, domain: str) -> Optional[Tuple[Set[str], str]]:
+        """
+        캐시된 결과 조회
+
+        Args:
+            source (str): 소스 이름
+            domain (str): 대상 도메인
+
+        Returns:
+            Optional[Tuple[Set[str], str]]: (서브도메인, FRESH 또는 STALE), 없거나 만료되면 None
+        """
+        try:
+            row = self._connect().execute(
+                "SELECT fetched_at, subdomains FROM results WHERE source = ? AND domain = ?",
+                (source, domain)
+            ).fetchone()
+        except sqlite3.Error:
+            return None
+        if row is None:
+            return None
+
+        fetched_at, data = row
+        age = time.time() - fetched_at
+        ttl = self.ttl_for(source)
+        if age > ttl + self.stale_ttl:
+            return None
+        subdomains = set(data.split('\n')) if data else set()
+        return subdomains, FRESH if age <= ttl else STALE
+
+    def put(self, source: str, domain: str, subdomains: Set[str]) -> None:
+        """
+        소스 결과 저장
+
+        Args:
+            source (str): 소스 이름
+            domain (str): 대상 도메인
+            subdomains (Set[str]): 수집된 서브도메인
+        """
+        try:
+            conn = self._connect()
+            conn.execute(
+                "INSERT OR REPLACE INTO results (source, domain, fetched_at, subdomains) VALUES (?, ?, ?, ?)",
+                (source, domain, time.time(), '\n'.join(sorted(subdomains)))
+            )
+            conn.commit()
+        except sqlite3.Error:
+            pass
+
+    def close(self) -> None:
+        """데이터베이스 연결 종료"""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
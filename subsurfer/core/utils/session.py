@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+공유 aiohttp 세션 및 커넥션 풀 관리 모듈
+"""
+
+import asyncio
+import aiohttp
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional
+
+from subsurfer.core.utils.rate_limit import RateLimiter
+
+class SessionManager:
+    """
+    여러 스캐너가 함께 사용하는 keep-alive 세션 관리자
+
+    `async with manager as session:` 블록이 하나 이상 열려 있는 동안 같은 세션을
+    공유하며, 마지막 블록이 닫힐 때 세션과 커넥터를 정리합니다.
+    """
+
+    def __init__(self, limit: int = 100, limit_per_host: int = 8, ttl_dns_cache: int = 300,
+                 keepalive_timeout: float = 30.0, rate_limiter: Optional[RateLimiter] = None):
+        """
+        Args:
+            limit (int): 전체 동시 연결 수 제한
+            limit_per_host (int): 호스트별 동시 연결 수 제한
+            ttl_dns_cache (int): DNS 캐시 유지 시간(초)
+            keepalive_timeout (float): 유휴 연결 유지 시간(초)
+            rate_limiter (RateLimiter, optional): 요청 속도 제한/재시도/서킷 브레이커 (없으면 기본값으로 생성)
+        """
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.ttl_dns_cache = ttl_dns_cache
+        self.keepalive_timeout = keepalive_timeout
+        self.rate_limiter = rate_limiter or RateLimiter()
+        self.session: Optional[aiohttp.ClientSession] = None
+        self._users = 0
+        self._lock = asyncio.Lock()
+
+    def _create_session(self) -> aiohttp.ClientSession:
+        """풀링된 커넥터로 세션 생성"""
+        connector = aiohttp.TCPConnector(
+            limit=self.limit,
+            limit_per_host=self.limit_per_host,
+            ttl_dns_cache=self.ttl_dns_cache,
+            use_dns_cache=True,
+            keepalive_timeout=self.keepalive_timeout
+        )
+        return aiohttp.ClientSession(connector=connector, middlewares=(self.rate_limiter.middleware,))
+
+    async def __aenter__(self) -> aiohttp.ClientSession:
+        """세션 획득 (필요 시 생성)"""
+        async with self._lock:
+            if self.session is None or self.session.closed:
+                self.session = self._create_session()
+            self._users += 1
+            return self.session
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """세션 반환 (마지막 사용자일 때 종료)"""
+        async with self._lock:
+            self._users -= 1
+            if self._users <= 0:
+                self._users = 0
+                await self.close()
+
+    async def close(self) -> None:
+        """세션 및 커넥터 종료"""
+        if self.session and not self.session.closed:
+            await self.session.close()
+        self.session = None
+
+@asynccontextmanager
+async def borrow_session(session: Optional[aiohttp.ClientSession] = None, **kwargs) -> AsyncIterator[aiohttp.ClientSession]:
+    """
+    공유 세션이 있으면 그대로 사용하고, 없으면 임시 세션을 생성
+
+    Args:
+        session (aiohttp.ClientSession, optional): 주입된 공유 세션
+        **kwargs: 임시 세션 생성 시 전달할 인자
+    """
+    if session is not None and not session.closed:
+        yield session
+    else:
+        async with aiohttp.ClientSession(**kwargs) as own_session:
+            yield own_session
@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+대용량 응답 스트리밍 파싱 모듈
+"""
+
+import codecs
+import json
+import re
+from typing import Any, AsyncIterable, AsyncIterator
+
+# 응답 본문을 읽는 단위
+CHUNK_SIZE = 64 * 1024
+
+# 한 줄 / JSON 요소 하나의 최대 크기 (넘으면 잘못된 응답으로 보고 중단)
+MAX_ITEM_SIZE = 16 * 1024 * 1024
+
+# JSON 요소 경계 확인용 - 문자열 밖의 구조 문자, 문자열 안의 끝/이스케이프 문자
+_STRUCTURAL = re.compile(r'["\[\]{},]')
+_STRING_SPECIAL = re.compile(r'["\\]')
+
+async def iter_lines(chunks: AsyncIterable[bytes], encoding: str = 'utf-8') -> AsyncIterator[str]:
+    """
+    바이트 청크 스트림을 줄 단위로 분리
+
+    청크 경계에서 잘린 줄은 다음 청크와 이어 붙이므로 메모리에는 현재 청크와
+    미완성 줄 하나만 유지됩니다.
+
+    Args:
+        chunks (AsyncIterable[bytes]): 응답 본문 청크 (예: response.content.iter_chunked())
+        encoding (str): 본문 인코딩
+    """
+    pending = b''
+    async for chunk in chunks:
+        pending += chunk
+        *lines, pending = pending.split(b'\n')
+        for line in lines:
+            yield line.decode(encoding, errors='replace').rstrip('\r')
+        if len(pending) > MAX_ITEM_SIZE:
+            raise ValueError("Line exceeds maximum size")
+    if pending:
+        yield pending.decode(encoding, errors='replace').rstrip('\r')
+
+async def iter_json_array(chunks: AsyncIterable[bytes], encoding: str = 'utf-8') -> AsyncIterator[Any]:
+    """
+    최상위 JSON 배열의 요소를 하나씩 파싱
+
+    전체 본문을 메모리에 올리지 않고 완성된 요소부터 바로 반환합니다. 요소는 최상위의
+    ',' 또는 ']'가 뒤따를 때(또는 본문 끝에서)만 반환하므로 청크 경계에서 잘린 숫자를
+    반환하지 않습니다. 여러 청크에 걸친 요소는 확인한 위치를 청크 사이에 유지하며
+    경계만 찾은 뒤 한 번 파싱하므로 큰 요소도 처음부터 다시 파싱하지 않습니다.
+    배열이 아닌 값(예: 오류 객체)이면 본문 끝에서 그 값 하나만 반환합니다.
+
+    Args:
+        chunks (AsyncIterable[bytes]): 응답 본문 청크
+        encoding (str): 본문 인코딩
+    """
+    decoder = json.JSONDecoder()
+    text_decoder = codecs.getincrementaldecoder(encoding)(errors='replace')
+    buffer = ''
+    position = 0  # 현재 요소의 시작 (요소 사이라면 다음에 확인할 위치)
+    scan = 0  # 현재 요소에서 이미 확인한 위치
+    depth = 0  # 현재 요소 안의 중첩 깊이
+    in_string = False
+    in_element = False
+    started = False  # '[' 를 읽었는지 여부
+    eof = False
+    iterator = chunks.__aiter__()
+
+    while True:
+        if not started:
+            stripped = buffer.lstrip()
+            if stripped.startswith('['):
+                started = True
+                position = len(buffer) - len(stripped) + 1
+            elif eof:
+                # 배열이 아닌 단일 값
+                try:
+                    if stripped:
+                        yield json.loads(stripped)
+                except ValueError:
+                    pass
+                return
+            elif len(buffer) > MAX_ITEM_SIZE:
+                raise ValueError("JSON value exceeds maximum size")
+
+        while started:
+            if not in_element:
+                # 공백과 구분자 건너뛰기
+                while position < len(buffer) and buffer[position] in ' \t\r\n,':
+                    position += 1
+                if position == len(buffer):
+                    break
+                if buffer[position] == ']':
+                    return
+                # 버퍼 안에서 완성되고 뒤에 구분자가 온 요소는 바로 파싱
+                try:
+                    value, end = decoder.raw_decode(buffer, position)
+                except json.JSONDecodeError:
+                    end = None
+                if end is not None:
+                    while end < len(buffer) and buffer[end] in ' \t\r\n':
+                        end += 1
+                    if end < len(buffer):
+                        if buffer[end] not in ',]':
+                            return
+                        yield value
+                        position = end
+                        continue
+                # 요소가 아직 다 도착하지 않음 - 이후 청크는 요소 경계만 이어서 확인
+                in_element, scan, depth, in_string = True, position, 0, False
+
+            if in_string:
+                match = _STRING_SPECIAL.search(buffer, scan)
+                if match is None:
+                    scan = len(buffer)
+                    break
+                if match.group() == '\\':
+                    if match.end() == len(buffer):
+                        # 이스케이프된 문자가 아직 도착하지 않음
+                        scan = match.start()
+                        break
+                    scan = match.end() + 1
+                    continue
+                in_string = False
+                scan = match.end()
+                continue
+
+            match = _STRUCTURAL.search(buffer, scan)
+            if match is None:
+                scan = len(buffer)
+                break
+            char = match.group()
+            scan = match.end()
+            if char == '"':
+                in_string = True
+            elif char in '[{':
+                depth += 1
+            elif char in ']}' and depth:
+                depth -= 1
+            elif depth == 0:
+                # 최상위 ',' 또는 ']' - 요소 완성
+                try:
+                    value = json.loads(buffer[position:match.start()])
+                except ValueError:
+                    return
+                yield value
+                in_element = False
+                position = match.start()
+
+        if eof:
+            # 본문 끝 - 닫히지 않은 배열의 마지막 요소는 완전한 값일 때만 반환
+            if in_element and not in_string and depth == 0:
+                try:
+                    value = json.loads(buffer[position:])
+                except ValueError:
+                    return
+                yield value
+            return
+        if in_element and scan - position > MAX_ITEM_SIZE:
+            raise ValueError("JSON element exceeds maximum size")
+
+        # 처리한 앞부분을 버리고 다음 청크 읽기
+        if started and position:
+            buffer = buffer[position:]
+            scan -= position
+            position = 0
+        try:
+            buffer += text_decoder.decode(await iterator.__anext__())
+        except StopAsyncIteration:
+            buffer += text_decoder.decode(b'', final=True)
+            eof = True
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+서브도메인 조회 인덱스 모듈 - 역순 레이블 기준 정렬 목록
+"""
+
+from bisect import bisect_left
+from typing import Iterable, Iterator
+
+# 역순 레이블 구분자 - 모든 레이블 문자보다 앞에 정렬되므로 상위 이름 바로 뒤에 하위 이름이 이어짐
+SEPARATOR = '\x00'
+
+def _key(name: str) -> str:
+    """www.dev.example.com → com\\x00example\\x00dev\\x00www"""
+    return SEPARATOR.join(reversed(name.split('.')))
+
+def _name(key: str) -> str:
+    """역순 레이블 키를 호스트명으로 복원"""
+    return '.'.join(reversed(key.split(SEPARATOR)))
+
+class SubdomainIndex:
+    """
+    수집된 서브도메인의 레이블 순 정렬 인덱스
+
+    수집 중에는 일반 set으로 중복을 제거하고, 출력/조회 시점에 한 번 만듭니다.
+    역순 레이블 키를 정렬해 두므로 같은 상위 도메인 아래 이름이 연속해서 놓이고,
+    특정 도메인 아래 이름 조회는 이진 탐색 두 번으로 범위를 찾습니다.
+    """
+
+    def __init__(self, names: Iterable[str]):
+        """
+        Args:
+            names (Iterable[str]): 정규화된 서브도메인 (중복 허용)
+        """
+        self._keys = sorted({_key(name) for name in names})
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def _has_key(self, key: str) -> bool:
+        index = bisect_left(self._keys, key)
+        return index < len(self._keys) and self._keys[index] == key
+
+    def __contains__(self, name: str) -> bool:
+        return self._has_key(_key(name))
+
+    def __iter__(self) -> Iterator[str]:
+        """레이블 순으로 순회 (example.com, a.example.com, x.a.example.com, b.example.com ...)"""
+        return map(_name, self._keys)
+
+    def under(self, domain: str, include_self: bool = False) -> Iterator[str]:
+        """
+        도메인 아래의 모든 이름
+
+        Args:
+            domain (str): 상위 도메인 (예: dev.example.com)
+            include_self (bool): 도메인 자신도 포함할지 여부
+
+        Returns:
+            Iterator[str]: 하위 이름 (레이블 순)
+        """
+        parent = _key(domain.lower().rstrip('.'))
+        start = bisect_left(self._keys, parent + SEPARATOR)
+        # SEPARATOR 다음 문자로 끝나는 접두사는 하위 이름 범위의 바로 뒤에 정렬됨
+        end = bisect_left(self._keys, parent + chr(ord(SEPARATOR) + 1), start)
+        if include_self and self._has_key(parent):
+            yield domain.lower().rstrip('.')
+        for index in range(start, end):
+            yield _name(self._keys[index])
@@ -6,15 +6,20 @@ SubSurfer 버전 체크 유틸리티 모듈
 """
 
 import asyncio
-import aiohttp
-import re
-import sys
+import json
+import os
+import time
 import importlib.metadata
-from bs4 import BeautifulSoup
-from rich.console import Console
 from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Tuple
 
-console = Console()
+from subsurfer.core.utils.paths import get_cache_dir
+
+# 최신 버전 확인 주기(초) - 이 기간 안에는 디스크에 저장된 결과 사용
+CHECK_INTERVAL = 24 * 3600
+
+# 같은 프로세스 안에서 여러 번 호출되어도 한 번만 확인
+_result: Optional[Tuple[bool, str, Optional[str]]] = None
 
 # 현재 버전 (subsurfer/__init__.py에서 가져올 수 있음)
 def get_current_version():
@@ -75,6 +80,10 @@ async def check_latest_version():
     if "dev" in current_version:
         return (True, current_version, current_version)
     
+    # 버전 확인에만 쓰이는 무거운 모듈은 실제로 확인할 때만 import
+    import aiohttp
+    from bs4 import BeautifulSoup
+    
     try:
         async with aiohttp.ClientSession() as session:
             async with session.get(
@@ -121,10 +130,57 @@ async def check_latest_version():
     
     return (is_latest, current_version, latest_version)
 
+def _cache_path() -> str:
+    """버전 확인 결과 저장 경로"""
+    return os.path.join(get_cache_dir(), 'version_check.json')
+
+def _load_cached_result(current_version: str) -> Optional[Tuple[bool, str, Optional[str]]]:
+    """CHECK_INTERVAL 이내에 같은 버전에서 확인한 결과 (없으면 None)"""
+    try:
+        with open(_cache_path(), 'r', encoding='utf-8') as f:
+            cached = json.load(f)
+        if cached.get('current') != current_version or time.time() - cached['checked'] > CHECK_INTERVAL:
+            return None
+        return (cached['is_latest'], current_version, cached.get('latest'))
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+def _save_result(result: Tuple[bool, str, Optional[str]]) -> None:
+    """확인 결과 저장 (실패해도 무시)"""
+    is_latest, current_version, latest_version = result
+    try:
+        os.makedirs(get_cache_dir(), exist_ok=True)
+        tmp_path = f"{_cache_path()}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'checked': time.time(), 'current': current_version,
+                       'latest': latest_version, 'is_latest': is_latest}, f)
+        os.replace(tmp_path, _cache_path())
+    except OSError:
+        pass
+
+def get_version_status() -> Tuple[bool, str, Optional[str]]:
+    """
+    최신 버전 여부 확인 (하루에 한 번만 네트워크 확인)
+    
+    확인 결과는 캐시 디렉토리에 저장되어 CHECK_INTERVAL 동안 재사용됩니다.
+    확인에 실패한 경우도 저장하므로 오프라인 환경에서 매 실행마다 대기하지 않습니다.
+    
+    Returns:
+        tuple: (최신 버전 여부, 현재 버전, 최신 버전)
+    """
+    global _result
+    if _result is None:
+        current_version = get_current_version()
+        _result = _load_cached_result(current_version)
+        if _result is None:
+            _result = run_async_check()
+            _save_result(_result)
+    return _result
+
 def get_version_notification():
     """버전 알림 메시지 생성"""
     try:
-        is_latest, current_version, latest_version = run_async_check()
+        is_latest, current_version, latest_version = get_version_status()
         
         if not is_latest and latest_version:
             return f"Version Notice: Your SubSurfer version ({current_version}) is not the latest ({latest_version})."
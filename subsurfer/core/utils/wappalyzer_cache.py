@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Wappalyzer 핑거프린트 디스크 캐시 모듈
+"""
+
+import os
+import pickle
+import re
+import tempfile
+import threading
+from typing import Optional
+
+from Wappalyzer import Wappalyzer
+
+from subsurfer.core.utils.paths import get_cache_dir
+
+# 캐시 형식이 바뀌면 올려서 기존 캐시를 무효화
+CACHE_FORMAT = 1
+CACHE_FILENAME = "wappalyzer.pickle"
+
+_instance: Optional[Wappalyzer] = None
+_lock = threading.Lock()
+
+class LazyPattern(str):
+    """
+    첫 검색 시점에 컴파일되는 정규식
+
+    패턴 문자열로만 피클링되므로 캐시 로드 시 수천 개의 정규식을 다시 컴파일하지
+    않고, 실제로 분석에 사용될 때 한 번만 컴파일합니다. str을 상속하므로
+    re.findall(pattern, value) 형태의 호출에도 그대로 사용할 수 있습니다.
+    """
+
+    def __reduce__(self):
+        return (LazyPattern, (str(self),))
+
+    def search(self, string: str):
+        """re.Pattern.search와 동일"""
+        compiled = self.__dict__.get('_compiled')
+        if compiled is None:
+            try:
+                compiled = re.compile(str(self))
+            except re.error:
+                # 컴파일할 수 없는 패턴은 절대 매칭되지 않도록 처리 (Wappalyzer와 동일)
+                compiled = re.compile(r'(?!x)x')
+            self.__dict__['_compiled'] = compiled
+        return compiled.search(string)
+
+class CachedWappalyzer(Wappalyzer):
+    """정규식을 지연 컴파일하고 디스크 캐시에서 로드할 수 있는 Wappalyzer"""
+
+    def _prepare_pattern(self, pattern):
+        """key:value 속성을 분리하고 정규식은 LazyPattern으로 보관"""
+        attrs = {}
+        for index, expression in enumerate(pattern.split('\\;')):
+            if index == 0:
+                attrs['string'] = expression
+                # Wappalyzer는 re.I로 컴파일하므로 인라인 플래그로 동일하게 처리
+                attrs['regex'] = LazyPattern(f"(?i){expression}")
+            else:
+                attr = expression.split(':')
+                if len(attr) > 1:
+                    key = attr.pop(0)
+                    attrs[str(key)] = ':'.join(attr)
+        return attrs
+
+    @classmethod
+    def from_ruleset(cls, categories, technologies) -> 'CachedWappalyzer':
+        """이미 전처리된 룰셋으로 인스턴스 생성 (전처리 생략)"""
+        instance = cls.__new__(cls)
+        instance.categories = categories
+        instance.technologies = technologies
+        instance.confidence_regexp = re.compile(r"(.+)\\;confidence:(\d+)")
+        return instance
+
+def _ruleset_version() -> str:
+    """설치된 technologies.json 기준 버전 문자열"""
+    import Wappalyzer as package
+    data_file = os.path.join(os.path.dirname(package.__file__), 'data', 'technologies.json')
+    try:
+        stat = os.stat(data_file)
+        return f"{CACHE_FORMAT}:{stat.st_size}:{stat.st_mtime_ns}"
+    except OSError:
+        return f"{CACHE_FORMAT}:unknown"
+
+def _read_cache(path: str, version: str) -> Optional[CachedWappalyzer]:
+    """버전이 일치하는 캐시만 로드"""
+    try:
+        with open(path, 'rb') as f:
+            cached = pickle.load(f)
+        if cached.get('version') != version:
+            return None
+        return CachedWappalyzer.from_ruleset(cached['categories'], cached['technologies'])
+    except Exception:
+        return None
+
+def _write_cache(path: str, version: str, wappalyzer: CachedWappalyzer) -> None:
+    """임시 파일에 쓴 뒤 교체하여 동시 실행 중에도 깨진 캐시가 남지 않도록 저장"""
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+        with os.fdopen(fd, 'wb') as f:
+            pickle.dump({
+                'version': version,
+                'categories': wappalyzer.categories,
+                'technologies': wappalyzer.technologies
+            }, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+    except Exception:
+        try:
+            os.unlink(tmp_path)
+        except Exception:
+            pass
+
+def load_wappalyzer(cache_dir: Optional[str] = None, use_cache: bool = True) -> Wappalyzer:
+    """
+    프로세스 전체에서 공유하는 Wappalyzer 인스턴스 로드
+
+    첫 호출 시 디스크 캐시(버전 일치 시)에서 전처리된 룰셋을 읽고, 없으면
+    technologies.json을 전처리해 캐시에 저장합니다. 이후 호출은 같은 인스턴스를
+    반환합니다.
+
+    Args:
+        cache_dir (str, optional): 캐시 디렉토리 (기본값: get_cache_dir())
+        use_cache (bool): 디스크 캐시 사용 여부
+
+    Returns:
+        Wappalyzer: 공유 Wappalyzer 인스턴스
+    """
+    global _instance
+    if _instance is not None:
+        return _instance
+
+    with _lock:
+        if _instance is not None:
+            return _instance
+
+        version = _ruleset_version()
+        path = os.path.join(cache_dir or get_cache_dir(), CACHE_FILENAME)
+        wappalyzer = _read_cache(path, version) if use_cache else None
+        if wappalyzer is None:
+            wappalyzer = CachedWappalyzer.latest()
+            if use_cache:
+                _write_cache(path, version, wappalyzer)
+        _instance = wappalyzer
+        return _instance
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+와일드카드 DNS 탐지 모듈
+"""
+
+import asyncio
+import random
+import string
+from typing import Dict, FrozenSet, Iterable
+
+# 무작위 레이블에 사용할 문자
+LABEL_CHARS = string.ascii_lowercase + string.digits
+
+class WildcardFilter:
+    """
+    와일드카드 DNS 응답과 같은 주소로만 해석되는 이름 필터
+
+    상위 도메인마다 존재하지 않을 무작위 레이블을 조회해 와일드카드 응답 주소를
+    캐시합니다. 이름의 주소가 모두 바로 위 상위 도메인의 와일드카드 응답에 포함되면
+    와일드카드로 해석된 이름으로 보고 웹 스캔에서 제외합니다.
+    (바로 위 상위 도메인의 무작위 이름은 DNS의 closest encloser 규칙에 따라
+    더 위쪽의 와일드카드까지 반영하므로 한 단계만 확인하면 됩니다.)
+    """
+
+    def __init__(self, resolver, domain: str, probes: int = 2, label_length: int = 12):
+        """
+        Args:
+            resolver (AsyncResolver): DNS 리졸버 (query()를 사용해 무작위 이름은 캐시에 남기지 않음)
+            domain (str): 대상 도메인 (이 도메인 아래의 이름만 검사)
+            probes (int): 상위 도메인마다 조회할 무작위 이름 수 (라운드로빈 응답 대비)
+            label_length (int): 무작위 레이블 길이
+        """
+        self.resolver = resolver
+        self.domain = domain.lower().rstrip('.')
+        self.probes = max(1, probes)
+        self.label_length = label_length
+        self.answers: Dict[str, FrozenSet[str]] = {}
+        self._pending: Dict[str, asyncio.Future] = {}
+
+    def _random_name(self, parent: str) -> str:
+        """존재하지 않을 무작위 이름 생성"""
+        label = ''.join(random.choices(LABEL_CHARS, k=self.label_length))
+        return f"{label}.{parent}"
+
+    async def _probe(self, parent: str) -> FrozenSet[str]:
+        """무작위 이름들의 A/AAAA 응답 주소 합집합"""
+        async def probe_one() -> Iterable[str]:
+            name = self._random_name(parent)
+            addresses = await self.resolver.query(name, 'A')
+            return addresses or await self.resolver.query(name, 'AAAA')
+
+        results = await asyncio.gather(*(probe_one() for _ in range(self.probes)))
+        return frozenset(address for addresses in results for address in addresses)
+
+    async def wildcard_answers(self, parent: str) -> FrozenSet[str]:
+        """
+        상위 도메인의 와일드카드 응답 주소 (캐시 사용)
+
+        Args:
+            parent (str): 상위 도메인 (예: dev.example.com)
+
+        Returns:
+            FrozenSet[str]: 와일드카드 응답 주소 (와일드카드가 없으면 빈 집합)
+        """
+        if parent in self.answers:
+            return self.answers[parent]
+        # 같은 상위 도메인에 대한 동시 확인은 하나의 조회를 공유
+        if parent in self._pending:
+            return await asyncio.shield(self._pending[parent])
+
+        future = asyncio.ensure_future(self._probe(parent))
+        self._pending[parent] = future
+        try:
+            answers = await asyncio.shield(future)
+        finally:
+            self._pending.pop(parent, None)
+        self.answers[parent] = answers
+        return answers
+
+    async def is_wildcard(self, name: str, addresses: Iterable[str]) -> bool:
+        """
+        이름이 와일드카드 응답으로만 해석되는지 여부
+
+        Args:
+            name (str): 서브도메인
+            addresses (Iterable[str]): 이름의 해석된 주소
+
+        Returns:
+            bool: 모든 주소가 상위 도메인의 와일드카드 응답에 포함되면 True
+        """
+        addresses = set(addresses)
+        if not addresses:
+            return False
+        parent = name.partition('.')[2]
+        if name == self.domain or not (parent == self.domain or parent.endswith(f".{self.domain}")):
+            return False
+        answers = await self.wildcard_answers(parent)
+        return bool(answers) and addresses <= answers
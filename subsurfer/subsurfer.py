@@ -5,13 +5,91 @@
 SubSurfer - Fast Web Bug Bounty Asset Identification Tool
 """
 
+import os
 import sys
 import json
+from typing import TYPE_CHECKING
 from subsurfer.core.cli.cli import print_banner, print_status, print_usage, console
 from subsurfer.core.cli.parser import parse_args
-from subsurfer.core.controller.controller import SubSurferController
+from subsurfer.core.cli.stream import StreamPrinter
+from subsurfer.core.handler.passive.registry import available_sources, parse_source_list, select_sources
 from subsurfer.core.utils.version_checker import get_version_notification
 
+# 스캔 관련 모듈(aiohttp, dnspython 등)은 스캔을 시작할 때 import
+if TYPE_CHECKING:
+    from subsurfer.core.controller.controller import SubSurferController
+
+async def scan_target(controller: 'SubSurferController', args, is_pipeline: bool) -> dict:
+    """타겟 하나에 대한 수집, 스캔, 저장 및 출력"""
+    if not is_pipeline:
+        print_status(f"Target Domain: {controller.target}", "info")
+    
+    # 포트 범위 설정
+    ports = None
+    if args.default_ports:
+        ports = controller.parse_ports()
+    elif args.fast_ports:
+        ports = controller.get_fast_ports()
+    elif args.port:
+        ports = controller.parse_ports(args.port)
+        
+    # 결과 출력 모드 설정
+    output_mode = None
+    if args.pipeweb:
+        output_mode = "web"
+    elif args.pipesub:
+        output_mode = "sub"
+    elif args.pipeact:
+        output_mode = "act"
+    elif args.pipewsub:
+        output_mode = "wsub"
+    elif args.pipejson:
+        output_mode = "json"
+        
+    # 스트리밍 출력 (파이프라인 모드에서 결과를 확인 즉시 출력)
+    printer = StreamPrinter(output_mode, controller.target) if args.stream and output_mode else None
+    
+    # 서브도메인 수집, 웹 서비스 스캔, Takeover 스캔(옵션)을 스트리밍 파이프라인으로 실행
+    results_dict = await controller.run_pipeline(ports, takeover=args.takeover, printer=printer)
+    vulnerable_domains = results_dict['vulnerable_takeover']
+    
+    # 결과 저장
+    output_path = controller.get_output_path(args.output) if args.output else controller.get_output_path()
+    controller.save_results(results_dict, output_path)
+    
+    # 스트리밍 모드에서는 이미 모든 결과를 출력함
+    if printer:
+        return results_dict
+        
+    # 증분 모드의 파이프라인 출력은 새로 발견되었거나 변경된 자산만 포함
+    pipe_results = controller.delta_view(results_dict) if is_pipeline else results_dict
+        
+    if args.pipejson:
+        json_results = {
+            'target': controller.target,
+            'subdomains': list(pipe_results['subdomains']),
+            'web_servers': list(pipe_results['web_servers']),
+            'enabled_services': list(pipe_results['enabled_services']),
+            'all_urls': {k: list(v) for k, v in pipe_results['all_urls'].items()},
+            'vulnerable_takeover': pipe_results.get('vulnerable_takeover', [])
+        }
+        if 'delta' in pipe_results:
+            json_results['delta'] = pipe_results['delta']
+        print(json.dumps(json_results, indent=None))
+    else:
+        # 기본 결과 출력 (takeover 옵션 여부와 관계없이 항상 출력)
+        controller.print_results(pipe_results, output_mode, output_path)
+        
+        # Takeover 취약점 추가 출력 (takeover 옵션이 활성화된 경우)
+        if args.takeover and not is_pipeline:
+            print()
+            print_status("Takeover Result:", "info")
+            if vulnerable_domains:
+                for vuln in vulnerable_domains:
+                    console.print(f"[cyan]{vuln['domain']}[/] -> [yellow]{vuln['service']}[/] (CNAME: [magenta]{vuln['cname']}[/])")
+    
+    return results_dict
+
 async def main():
     """메인 함수"""
     # 파싱된 인자 가져오기
@@ -20,6 +98,12 @@ async def main():
     # 파이프라인 모드 확인
     is_pipeline = any([args.pipeweb, args.pipesub, args.pipeact, args.pipewsub, args.pipejson])
     
+    # 사용 가능한 패시브 소스 목록 출력
+    if args.list_sources:
+        for name in available_sources():
+            print(name)
+        sys.exit(0)
+    
     # 배너 출력 (파이프라인 모드가 아닐 때)
     if not is_pipeline:
         print_banner()
@@ -40,8 +124,21 @@ async def main():
         
         sys.exit(1)
     
+    # 타겟 목록 구성 (-t 및 -l)
+    targets = []
+    if args.target:
+        targets.append(args.target)
+    if args.list:
+        from subsurfer.core.controller.batch import load_targets
+        try:
+            targets.extend(t for t in load_targets(args.list) if t not in targets)
+        except OSError as e:
+            if not is_pipeline:
+                print_status(f"Failed to read target list: {str(e)}", "error")
+            sys.exit(1)
+    
     # 타겟 도메인이 지정되지 않았을 때 오류 메시지 출력
-    if not args.target:
+    if not targets:
         if not is_pipeline:
             print_usage()
             print_status("Please specify the target domain.", "error")
@@ -54,86 +151,100 @@ async def main():
                 
         sys.exit(1)
         
-    if not is_pipeline:
-        print_status(f"Target Domain: {args.target}", "info")
-    
-    # 컨트롤러 초기화 및 실행
-    controller = SubSurferController(
-        target=args.target,
-        verbose=0 if is_pipeline else args.verbose,  # 파이프라인 모드에서는 verbose 비활성화
-        active=args.active,
-        silent=is_pipeline  # 파이프라인 모드에서는 silent 모드 활성화
-    )
-    
     if args.active and not is_pipeline:
         print_status("Active scan mode is enabled.", "warning")
     
-    # 서브도메인 수집
-    all_subdomains = await controller.collect_subdomains()
+    if args.wordlist:
+        if not os.path.isfile(args.wordlist):
+            if not is_pipeline:
+                print_status(f"Wordlist not found: {args.wordlist}", "error")
+            sys.exit(1)
+        if not args.active and not is_pipeline:
+            print_status("DNS brute force runs in active mode only, add -a to use the wordlist.", "warning")
     
-    # 포트 범위 설정
-    ports = None
-    if args.default_ports:
-        ports = controller.parse_ports()
-    elif args.fast_ports:
-        ports = controller.get_fast_ports()
-    elif args.port:
-        ports = controller.parse_ports(args.port)
-        
-    # 웹 서비스 스캔
-    web_services = await controller.scan_web_services(all_subdomains, ports)
+    for path in args.fingerprints or []:
+        if not os.path.isfile(path):
+            if not is_pipeline:
+                print_status(f"Fingerprint file not found: {path}", "error")
+            sys.exit(1)
+    if args.fingerprints and not args.takeover and not is_pipeline:
+        print_status("Fingerprint files are used by takeover detection only, add -to to use them.", "warning")
     
-    # Takeover 스캔 (옵션)
-    vulnerable_domains = []
-    if args.takeover:
-        vulnerable_domains = await controller.scan_takeover(all_subdomains)
+    # 패시브 소스 선택 확인 (잘못된 이름은 스캔 전에 오류 처리)
+    sources = parse_source_list(args.sources)
+    exclude_sources = parse_source_list(args.exclude_sources)
+    try:
+        selected_sources = select_sources(sources, exclude_sources)
+    except ValueError as e:
+        if not is_pipeline:
+            print_status(str(e), "error")
+        sys.exit(1)
+    if not selected_sources and not is_pipeline:
+        print_status("All passive sources are excluded.", "warning")
     
-    # 결과 저장
-    output_path = controller.get_output_path(args.output) if args.output else controller.get_output_path()
-    results_dict = {
-        'subdomains': all_subdomains,
-        'web_services': web_services.get('web_services', {}),
-        'web_servers': web_services.get('web_servers', set()),
-        'enabled_services': web_services.get('enabled_services', set()),
-        'all_urls': web_services.get('all_urls', {}),
-        'vulnerable_takeover': vulnerable_domains
+    # 캐시 디렉토리 지정 시 Wappalyzer 룰셋 캐시(분석 프로세스 포함)도 같은 위치 사용
+    if args.cache_dir:
+        os.environ['SUBSURFER_CACHE_DIR'] = args.cache_dir
+    # 상태 디렉토리 지정 시 WebArchive 페이지 체크포인트도 같은 위치 사용
+    if args.state_dir:
+        os.environ['SUBSURFER_STATE_DIR'] = args.state_dir
+    
+    # 스캔에 필요한 모듈은 인자 확인이 끝난 뒤에 로드 (--help, --list-sources 등은 가볍게 실행)
+    from subsurfer.core.controller.controller import SubSurferController
+    from subsurfer.core.controller.batch import BatchController
+    from subsurfer.core.utils.resolver import AsyncResolver, load_resolvers
+    from subsurfer.core.utils.result_cache import ResultCache
+    from subsurfer.core.utils.asset_store import AssetStore
+    from subsurfer.core.utils.rate_limit import RateLimiter
+    from subsurfer.core.utils.session import SessionManager
+    
+    controller_options = {
+        'source_concurrency': args.source_concurrency,
+        'source_timeout': args.source_timeout,
+        'deadline': args.deadline,
+        'analysis_workers': args.analysis_workers,
+        'result_cache': None if args.no_cache else ResultCache(args.cache_dir),
+        'asset_store': AssetStore(args.state_dir, probe_ttl=args.probe_ttl * 3600) if args.incremental else None,
+        'filter_wildcards': not args.no_wildcard_filter,
+        'wordlist': args.wordlist,
+        'sources': sources,
+        'exclude_sources': exclude_sources,
+        'fingerprint_files': args.fingerprints,
+        # 모든 타겟이 하나의 리졸버(조회 캐시, 동시 조회 제한)를 공유
+        'resolver': AsyncResolver(load_resolvers(args.resolvers) if args.resolvers else None,
+                                  concurrency=args.dns_concurrency)
     }
     
-    controller.save_results(results_dict, output_path)
+    # 패시브 소스 요청 속도 제한 (배치 모드에서는 모든 타겟이 공유)
+    session_manager = SessionManager(rate_limiter=RateLimiter(rate=args.rate_limit))
     
-    # 결과 출력 모드 설정
-    output_mode = None
-    if args.pipeweb:
-        output_mode = "web"
-    elif args.pipesub:
-        output_mode = "sub"
-    elif args.pipeact:
-        output_mode = "act"
-    elif args.pipewsub:
-        output_mode = "wsub"
-    elif args.pipejson:
-        output_mode = "json"
-        
-    if args.pipejson:
-        json_results = {
-            'subdomains': list(results_dict['subdomains']),
-            'web_servers': list(results_dict['web_servers']),
-            'enabled_services': list(results_dict['enabled_services']),
-            'all_urls': {k: list(v) for k, v in results_dict['all_urls'].items()},
-            'vulnerable_takeover': results_dict.get('vulnerable_takeover', [])
-        }
-        print(json.dumps(json_results, indent=None))
+    if len(targets) == 1 and not args.list:
+        # 단일 타겟 스캔
+        controller = SubSurferController(
+            target=targets[0],
+            verbose=0 if is_pipeline else args.verbose,  # 파이프라인 모드에서는 verbose 비활성화
+            active=args.active,
+            silent=is_pipeline,  # 파이프라인 모드에서는 silent 모드 활성화
+            session_manager=session_manager,
+            **controller_options
+        )
+        await scan_target(controller, args, is_pipeline)
     else:
-        # 기본 결과 출력 (takeover 옵션 여부와 관계없이 항상 출력)
-        controller.print_results(results_dict, output_mode, output_path)
-        
-        # Takeover 취약점 추가 출력 (takeover 옵션이 활성화된 경우)
-        if args.takeover and not is_pipeline:
-            print()
-            print_status("Takeover Result:", "info")
-            if vulnerable_domains:
-                for vuln in vulnerable_domains:
-                    console.print(f"[cyan]{vuln['domain']}[/] -> [yellow]{vuln['service']}[/] (CNAME: [magenta]{vuln['cname']}[/])")
+        # 배치 스캔 - 여러 타겟이 공유 워커 풀 사용
+        if not is_pipeline:
+            print_status(f"Batch mode: {len(targets)} targets", "info")
+        if args.output:
+            os.makedirs(args.output, exist_ok=True)
+        batch = BatchController(
+            targets,
+            verbose=0 if is_pipeline else args.verbose,
+            active=args.active,
+            silent=is_pipeline,
+            concurrency=args.batch_concurrency,
+            session_manager=session_manager,
+            **controller_options
+        )
+        await batch.run(lambda controller: scan_target(controller, args, is_pipeline))
     
     # 스캔 완료 후 버전 알림 출력 (파이프라인 모드가 아닐 때만)
     if not is_pipeline:
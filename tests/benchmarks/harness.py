@@ -0,0 +1,205 @@
+"""
+오프라인 엔드투엔드 벤치마크
+
+로컬 대체 서비스(패시브 API, DNS, HTTP 포트 팜)를 띄운 뒤 SubSurferController의
+스트리밍 파이프라인 전체를 실행하고 처리량, 단계별 지연 시간, 최대 RSS를 측정합니다.
+
+    python -m tests.benchmarks.harness --names 20000 --ports 16 --output bench.json
+    python -m tests.benchmarks.harness --baseline bench.json   # 기준 대비 성능 저하 시 종료 코드 1
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import resource
+import sys
+import tempfile
+import time
+from dataclasses import asdict, dataclass, fields
+from typing import Any, Dict, List, Optional
+
+from subsurfer.core.controller.controller import SubSurferController
+from subsurfer.core.utils.rate_limit import RateLimiter
+from subsurfer.core.utils.resolver import AsyncResolver
+from subsurfer.core.utils.session import SessionManager
+from tests.benchmarks.mocks import HttpFarm, MockSources, StubDNSServer
+
+# 값이 클수록 나쁜 지표 / 작을수록 나쁜 지표
+LOWER_IS_BETTER = ('total_seconds', 'passive_seconds', 'web_seconds', 'peak_rss_mb')
+HIGHER_IS_BETTER = ('names_per_second',)
+
+@dataclass
+class BenchmarkConfig:
+    """벤치마크 규모와 대체 서비스 지연 설정"""
+    names: int = 2000               # 패시브 소스가 반환하는 전체 서브도메인 수
+    live_ratio: float = 0.1         # DNS에서 해석되는 비율 (해석되는 이름만 포트/HTTP 검사)
+    ports: int = 4                  # HTTP 팜 포트 수 (모든 포트를 검사 대상으로 지정)
+    source_latency: float = 0.05    # 패시브 API 응답 지연(초)
+    dns_latency: float = 0.0        # DNS 응답 지연(초)
+    http_latency: float = 0.0       # HTTP 응답 지연(초)
+    page_size: int = 4096           # HTTP 응답 크기(바이트)
+    cdx_pages: int = 4              # WebArchive CDX 페이지 수
+    analysis_workers: int = 1       # 핑거프린트 분석 프로세스 수 (0이면 현재 프로세스)
+    domain: str = "bench.test"
+
+class _PhaseRecorder:
+    """StreamPrinter 대신 결과 확인 시각을 기록"""
+
+    def __init__(self, start: float):
+        self.start = start
+        self.first: Dict[str, float] = {}
+        self.last: Dict[str, float] = {}
+
+    def _record(self, kind: str) -> None:
+        elapsed = time.perf_counter() - self.start
+        self.first.setdefault(kind, elapsed)
+        self.last[kind] = elapsed
+
+    def subdomain(self, subdomain: str) -> None:
+        self._record('subdomain')
+
+    def web_server(self, subdomain: str) -> None:
+        self._record('web_server')
+
+    def url(self, url: str, port: int) -> None:
+        self._record('url')
+
+    def enabled_service(self, subdomain: str) -> None:
+        self._record('enabled_service')
+
+    def takeover(self, vuln: Dict) -> None:
+        self._record('takeover')
+
+def _peak_rss_mb(who: int) -> float:
+    """최대 RSS(MB) - Linux는 KB, macOS는 바이트 단위"""
+    value = resource.getrusage(who).ru_maxrss
+    return round(value / (1024 * 1024 if sys.platform == 'darwin' else 1024), 1)
+
+async def run_benchmark(config: BenchmarkConfig) -> Dict[str, Any]:
+    """
+    대체 서비스를 띄우고 파이프라인을 한 번 실행한 뒤 측정값 반환
+
+    Returns:
+        Dict[str, Any]: 처리량, 단계별 시간, 결과 개수, 최대 RSS 등
+    """
+    names = [f"host{i}.{config.domain}" for i in range(config.names)]
+    step = max(1, round(1 / config.live_ratio)) if config.live_ratio > 0 else 0
+    live = set(names[::step]) if step else set()
+
+    sources = MockSources(names, latency=config.source_latency, cdx_pages=config.cdx_pages)
+    dns_server = StubDNSServer(live, latency=config.dns_latency)
+    farm = HttpFarm(ports=config.ports, latency=config.http_latency, page_size=config.page_size)
+    state_dir = tempfile.TemporaryDirectory()
+    previous_state_dir = os.environ.get('SUBSURFER_STATE_DIR')
+    # WebArchive 체크포인트가 사용자 상태 디렉토리에 남지 않도록 분리
+    os.environ['SUBSURFER_STATE_DIR'] = state_dir.name
+
+    try:
+        await sources.start()
+        address = await dns_server.start()
+        ports = await farm.start()
+
+        controller = SubSurferController(
+            config.domain,
+            silent=True,
+            session_manager=SessionManager(rate_limiter=RateLimiter(rate=10000, burst=10000)),
+            resolver=AsyncResolver([address], timeout=1.0),
+            analysis_workers=config.analysis_workers,
+        )
+        handler = controller.passive_handler
+        handler.scanners = sources.attach(handler.scanners)
+
+        phases: Dict[str, float] = {}
+        collect = handler.collect
+
+        async def timed_collect(queue=None):
+            """패시브 수집 단계 시간 측정"""
+            started = time.perf_counter()
+            try:
+                return await collect(queue)
+            finally:
+                phases['passive_seconds'] = time.perf_counter() - started
+
+        handler.collect = timed_collect
+
+        start = time.perf_counter()
+        recorder = _PhaseRecorder(start)
+        results = await controller.run_pipeline(ports=ports, printer=recorder)
+        total = time.perf_counter() - start
+    finally:
+        await farm.close()
+        await dns_server.close()
+        await sources.close()
+        if previous_state_dir is None:
+            os.environ.pop('SUBSURFER_STATE_DIR', None)
+        else:
+            os.environ['SUBSURFER_STATE_DIR'] = previous_state_dir
+        state_dir.cleanup()
+
+    first_result = min(recorder.first.get('web_server', total), recorder.first.get('url', total))
+    return {
+        'config': asdict(config),
+        'subdomains': len(results['subdomains']),
+        'web_servers': len(results['web_servers']),
+        'urls': sum(len(urls) for urls in results['all_urls'].values()),
+        'total_seconds': round(total, 3),
+        'passive_seconds': round(phases.get('passive_seconds', 0.0), 3),
+        'first_web_result_seconds': round(first_result, 3),
+        'web_seconds': round(recorder.last.get('url', total) - first_result, 3),
+        'names_per_second': round(len(results['subdomains']) / total, 1) if total else 0.0,
+        'dns_queries': dns_server.queries,
+        'http_requests': farm.requests,
+        'source_requests': dict(sources.requests),
+        'peak_rss_mb': _peak_rss_mb(resource.RUSAGE_SELF),
+        'peak_child_rss_mb': _peak_rss_mb(resource.RUSAGE_CHILDREN),
+    }
+
+def compare(result: Dict[str, Any], baseline: Dict[str, Any], tolerance: float = 0.2) -> List[str]:
+    """
+    기준 결과 대비 tolerance 이상 나빠진 지표 목록
+
+    Args:
+        result (Dict[str, Any]): 이번 측정값
+        baseline (Dict[str, Any]): 기준 측정값 (같은 설정으로 측정한 값)
+        tolerance (float): 허용 비율 (0.2 = 20%)
+    """
+    regressions = []
+    for key in LOWER_IS_BETTER:
+        if baseline.get(key) and result.get(key, 0) > baseline[key] * (1 + tolerance):
+            regressions.append(f"{key}: {baseline[key]} -> {result[key]}")
+    for key in HIGHER_IS_BETTER:
+        if baseline.get(key) and result.get(key, 0) < baseline[key] * (1 - tolerance):
+            regressions.append(f"{key}: {baseline[key]} -> {result[key]}")
+    return regressions
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """명령행 실행 - 결과를 JSON으로 출력하고 기준 대비 성능 저하 시 1 반환"""
+    parser = argparse.ArgumentParser(description='SubSurfer offline benchmark')
+    for field in fields(BenchmarkConfig):
+        parser.add_argument(f"--{field.name.replace('_', '-')}", dest=field.name,
+                            type=type(field.default), default=field.default)
+    parser.add_argument('--output', help='Write the result JSON to this file')
+    parser.add_argument('--baseline', help='Compare against a previous result JSON')
+    parser.add_argument('--tolerance', type=float, default=0.2,
+                        help='Allowed regression ratio against the baseline (default: 0.2)')
+    args = parser.parse_args(argv)
+
+    config = BenchmarkConfig(**{field.name: getattr(args, field.name) for field in fields(BenchmarkConfig)})
+    result = asyncio.run(run_benchmark(config))
+    print(json.dumps(result, indent=2))
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(result, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            regressions = compare(result, json.load(f), args.tolerance)
+        for regression in regressions:
+            print(f"[regression] {regression}", file=sys.stderr)
+        return 1 if regressions else 0
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,208 @@
+"""
+벤치마크용 로컬 대체 서비스
+
+- MockSources: crt.sh / AlienVault / WebArchive CDX 형식으로 응답하는 HTTP 서버
+- StubDNSServer: 지정한 이름만 127.0.0.1로 해석하는 UDP DNS 서버
+- HttpFarm: 여러 포트에서 같은 페이지를 응답하는 HTTP 서버
+"""
+
+import asyncio
+import json
+from typing import Dict, Iterable, List, Optional, Sequence
+
+import dns.exception
+import dns.message
+import dns.rcode
+import dns.rdatatype
+import dns.rrset
+from aiohttp import web
+
+async def _start_app(app: web.Application, ports: Sequence[int] = (0,)):
+    """앱을 127.0.0.1의 지정 포트(0이면 임의 포트)에서 실행하고 (runner, 실제 포트 목록) 반환"""
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    bound = []
+    for port in ports:
+        site = web.TCPSite(runner, "127.0.0.1", port)
+        await site.start()
+        bound.append(site._server.sockets[0].getsockname()[1])
+    return runner, bound
+
+class MockSources:
+    """
+    패시브 소스 API 대체 서버
+
+    names를 소스마다 나눠(겹치는 부분 포함) 실제 API와 같은 형식으로 돌려줍니다.
+    latency는 응답 시작 전 지연, chunk_size는 스트리밍 응답의 청크 크기입니다.
+    """
+
+    def __init__(self, names: Sequence[str], latency: float = 0.0, cdx_pages: int = 4,
+                 chunk_size: int = 16 * 1024):
+        self.names = list(names)
+        self.latency = latency
+        self.cdx_pages = max(1, cdx_pages)
+        self.chunk_size = chunk_size
+        self.requests: Dict[str, int] = {}
+        self.runner = None
+        self.base_url = None
+
+    def share(self, index: int, total: int) -> List[str]:
+        """소스별 결과 - 인접한 소스와 절반씩 겹치도록 나눔"""
+        size = len(self.names)
+        start = size * index // total
+        end = min(size, size * (index + 2) // total)
+        return self.names[start:end]
+
+    async def _stream(self, request: web.Request, body: bytes) -> web.StreamResponse:
+        """지연 후 본문을 청크 단위로 전송"""
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        response = web.StreamResponse()
+        await response.prepare(request)
+        for i in range(0, len(body), self.chunk_size):
+            await response.write(body[i:i + self.chunk_size])
+        await response.write_eof()
+        return response
+
+    def _count(self, source: str) -> None:
+        self.requests[source] = self.requests.get(source, 0) + 1
+
+    async def crtsh(self, request: web.Request) -> web.StreamResponse:
+        self._count('crt.sh')
+        names = self.share(0, 3)
+        # 실제 crt.sh처럼 인증서 하나에 SAN 여러 개(줄바꿈 구분)와 와일드카드 포함
+        entries = [
+            {"id": i, "name_value": "\n".join(names[i:i + 3]), "common_name": f"*.{names[i]}"}
+            for i in range(0, len(names), 3)
+        ]
+        return await self._stream(request, json.dumps(entries).encode())
+
+    async def alienvault(self, request: web.Request) -> web.StreamResponse:
+        self._count('AlienVault')
+        entries = [{"hostname": name, "address": "127.0.0.1"} for name in self.share(1, 3)]
+        return await self._stream(request, json.dumps({"passive_dns": entries}).encode())
+
+    async def cdx(self, request: web.Request) -> web.StreamResponse:
+        self._count('WebArchive')
+        if request.query.get('showNumPages') == 'true':
+            return await self._stream(request, f"{self.cdx_pages}\n".encode())
+        names = self.share(2, 3)
+        page = int(request.query.get('page', 0))
+        lines = [f"http://{name}:80/index.html" for name in names[page::self.cdx_pages]]
+        return await self._stream(request, ("\n".join(lines) + "\n").encode())
+
+    async def start(self) -> str:
+        app = web.Application()
+        app.router.add_get("/crtsh/", self.crtsh)
+        app.router.add_get("/otx/{domain}/passive_dns", self.alienvault)
+        app.router.add_get("/cdx", self.cdx)
+        self.runner, ports = await _start_app(app)
+        self.base_url = f"http://127.0.0.1:{ports[0]}"
+        return self.base_url
+
+    def attach(self, scanners: Iterable) -> list:
+        """(이름, 스캐너) 목록 중 대체 가능한 소스만 골라 이 서버를 보도록 설정"""
+        urls = {
+            'crt.sh': f"{self.base_url}/crtsh",
+            'AlienVault': f"{self.base_url}/otx",
+            'WebArchive': f"{self.base_url}/cdx",
+        }
+        attached = []
+        for name, scanner in scanners:
+            if name in urls:
+                scanner.base_url = urls[name]
+                attached.append((name, scanner))
+        return attached
+
+    async def close(self) -> None:
+        if self.runner:
+            await self.runner.cleanup()
+
+class _StubDNSProtocol(asyncio.DatagramProtocol):
+    """live에 있는 이름은 127.0.0.1, 나머지는 NXDOMAIN으로 응답"""
+
+    def __init__(self, live: Iterable[str], latency: float):
+        self.live = set(live)
+        self.latency = latency
+        self.queries = 0
+        self.transport = None
+
+    def connection_made(self, transport):
+        self.transport = transport
+
+    def datagram_received(self, data, addr):
+        self.queries += 1
+        try:
+            request = dns.message.from_wire(data)
+        except dns.exception.DNSException:
+            return
+        question = request.question[0]
+        name = question.name.to_text().rstrip('.').lower()
+        response = dns.message.make_response(request)
+        if name not in self.live:
+            response.set_rcode(dns.rcode.NXDOMAIN)
+        elif question.rdtype == dns.rdatatype.A:
+            response.answer.append(dns.rrset.from_text(question.name, 60, 'IN', 'A', '127.0.0.1'))
+        wire = response.to_wire()
+        if self.latency:
+            asyncio.get_event_loop().call_later(self.latency, self.transport.sendto, wire, addr)
+        else:
+            self.transport.sendto(wire, addr)
+
+class StubDNSServer:
+    """로컬 UDP DNS 서버"""
+
+    def __init__(self, live: Iterable[str], latency: float = 0.0):
+        self.protocol = _StubDNSProtocol(live, latency)
+        self.transport = None
+        self.address: Optional[str] = None
+
+    @property
+    def queries(self) -> int:
+        return self.protocol.queries
+
+    async def start(self) -> str:
+        loop = asyncio.get_event_loop()
+        self.transport, _ = await loop.create_datagram_endpoint(
+            lambda: self.protocol, local_addr=("127.0.0.1", 0)
+        )
+        self.address = f"127.0.0.1:{self.transport.get_extra_info('sockname')[1]}"
+        return self.address
+
+    async def close(self) -> None:
+        if self.transport:
+            self.transport.close()
+
+class HttpFarm:
+    """여러 포트에서 응답하는 HTTP 서버 (Host 헤더와 무관하게 같은 페이지)"""
+
+    def __init__(self, ports: int = 8, latency: float = 0.0, page_size: int = 4096):
+        self.port_count = max(1, ports)
+        self.latency = latency
+        self.page = self._build_page(page_size)
+        self.requests = 0
+        self.runner = None
+        self.ports: List[int] = []
+
+    @staticmethod
+    def _build_page(size: int) -> str:
+        """Wappalyzer가 인식하는 스크립트가 포함된 size 바이트 내외의 HTML"""
+        head = '<html><head><script src="/js/jquery-3.5.1.min.js"></script></head><body>'
+        filler = '<p>subsurfer benchmark</p>' * max(0, (size - len(head)) // 26)
+        return head + filler + '</body></html>'
+
+    async def handler(self, request: web.Request) -> web.Response:
+        self.requests += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        return web.Response(text=self.page, content_type='text/html', headers={'Server': 'nginx'})
+
+    async def start(self) -> List[int]:
+        app = web.Application()
+        app.router.add_get("/{tail:.*}", self.handler)
+        self.runner, self.ports = await _start_app(app, [0] * self.port_count)
+        return self.ports
+
+    async def close(self) -> None:
+        if self.runner:
+            await self.runner.cleanup()
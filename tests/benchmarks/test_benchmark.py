@@ -0,0 +1,41 @@
+import json
+import os
+import pytest
+from tests.benchmarks.harness import BenchmarkConfig, compare, run_benchmark
+
+@pytest.mark.asyncio
+async def test_offline_pipeline_smoke():
+    """대체 서비스만으로 전체 파이프라인이 끝까지 실행되는지 Test"""
+    config = BenchmarkConfig(names=300, live_ratio=0.1, ports=2, source_latency=0.0,
+                             cdx_pages=2, analysis_workers=0)
+    result = await run_benchmark(config)
+
+    assert result['subdomains'] == 300
+    assert result['web_servers'] == 30
+    assert result['urls'] == 30 * 2
+    assert result['http_requests'] >= result['urls']
+    assert set(result['source_requests']) == {'crt.sh', 'AlienVault', 'WebArchive'}
+    assert result['names_per_second'] > 0
+    assert result['peak_rss_mb'] > 0
+
+def test_compare_flags_regressions():
+    """기준 대비 허용 범위를 넘은 지표만 보고하는지 Test"""
+    baseline = {'total_seconds': 10.0, 'names_per_second': 100.0, 'peak_rss_mb': 100.0}
+    assert compare({'total_seconds': 11.0, 'names_per_second': 90.0, 'peak_rss_mb': 100.0}, baseline) == []
+
+    regressions = compare({'total_seconds': 13.0, 'names_per_second': 70.0, 'peak_rss_mb': 100.0}, baseline)
+    assert len(regressions) == 2
+    assert regressions[0].startswith('total_seconds')
+    assert regressions[1].startswith('names_per_second')
+
+@pytest.mark.asyncio
+@pytest.mark.skipif(not os.environ.get('SUBSURFER_BENCHMARK'), reason="set SUBSURFER_BENCHMARK=1 to run")
+async def test_benchmark_against_baseline():
+    """대규모 벤치마크 (SUBSURFER_BENCHMARK_BASELINE 지정 시 기준 결과와 비교)"""
+    result = await run_benchmark(BenchmarkConfig(names=20000, ports=8))
+    print(json.dumps(result, indent=2))
+
+    baseline_path = os.environ.get('SUBSURFER_BENCHMARK_BASELINE')
+    if baseline_path:
+        with open(baseline_path, 'r', encoding='utf-8') as f:
+            assert compare(result, json.load(f)) == []
@@ -0,0 +1,77 @@
+import json
+import subprocess
+import sys
+import time
+from subsurfer.core.utils import version_checker
+
+# CLI 모듈 import 시간 예산 (마이크로초) - 스캔 모듈을 미리 import하던 이전 구조는 약 280ms
+IMPORT_BUDGET_US = 150_000
+
+# CLI 시작 시 로드되면 안 되는 모듈 (스캔을 시작할 때 로드)
+DEFERRED_MODULES = (
+    'aiohttp', 'dns', 'bs4', 'yaml', 'requests', 'Wappalyzer',
+    'subsurfer.core.controller.controller',
+)
+
+def _import_profile(module: str):
+    """python -X importtime 결과에서 (모듈별 누적 시간 딕셔너리) 반환"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True, text=True, check=True
+    )
+    profile = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if cumulative.strip().isdigit():
+            profile[name.strip()] = int(cumulative)
+    return profile
+
+def test_cli_import_budget():
+    """CLI 모듈이 스캔 모듈 없이 예산 안에서 import되는지 Test"""
+    # 측정 편차를 줄이기 위해 여러 번 중 가장 빠른 값 사용
+    profiles = [_import_profile("subsurfer.subsurfer") for _ in range(3)]
+
+    loaded = set(profiles[0])
+    for module in DEFERRED_MODULES:
+        assert not any(name == module or name.startswith(f"{module}.") for name in loaded), module
+
+    elapsed = min(profile["subsurfer.subsurfer"] for profile in profiles)
+    assert elapsed < IMPORT_BUDGET_US, f"subsurfer.subsurfer import took {elapsed}us"
+
+def test_controller_defers_optional_handlers():
+    """패시브 스캔에 필요 없는 핸들러와 Wappalyzer를 컨트롤러 import 시 로드하지 않는지 Test"""
+    loaded = set(_import_profile("subsurfer.core.controller.controller"))
+    for module in ('Wappalyzer', 'bs4', 'subsurfer.core.handler.active_handler',
+                   'subsurfer.core.handler.takeover.takeover_handler',
+                   'subsurfer.core.handler.web.web_scanner', 'subsurfer.core.handler.passive.crtsh'):
+        assert module not in loaded, module
+
+def test_version_check_cached_on_disk(tmp_path, monkeypatch):
+    """버전 확인 결과를 디스크에 저장해 CHECK_INTERVAL 동안 재사용하는지 Test"""
+    monkeypatch.setenv("SUBSURFER_CACHE_DIR", str(tmp_path))
+    monkeypatch.setattr(version_checker, "get_current_version", lambda: "1.0.0")
+    calls = []
+
+    def fake_check():
+        calls.append(1)
+        return (False, "1.0.0", "1.1.0")
+
+    monkeypatch.setattr(version_checker, "run_async_check", fake_check)
+
+    monkeypatch.setattr(version_checker, "_result", None)
+    assert "1.1.0" in version_checker.get_version_notification()
+    # 새 프로세스처럼 메모리 결과를 비워도 디스크 결과 사용
+    monkeypatch.setattr(version_checker, "_result", None)
+    assert "1.1.0" in version_checker.get_version_notification()
+    assert len(calls) == 1
+
+    # 확인 주기가 지나면 다시 확인
+    path = tmp_path / "version_check.json"
+    cached = json.loads(path.read_text())
+    cached["checked"] = time.time() - version_checker.CHECK_INTERVAL - 1
+    path.write_text(json.dumps(cached))
+    monkeypatch.setattr(version_checker, "_result", None)
+    version_checker.get_version_notification()
+    assert len(calls) == 2
@@ -0,0 +1,41 @@
+import io
+import json
+from subsurfer.core.cli.stream import StreamPrinter
+
+def test_stream_printer_modes():
+    """StreamPrinter 모드별 출력 Test"""
+    out = io.StringIO()
+    printer = StreamPrinter("sub", stream=out)
+    printer.subdomain("a.example.com")
+    printer.web_server("a.example.com")  # sub 모드에서는 출력하지 않음
+    printer.subdomain("b.example.com")
+    
+    assert out.getvalue().splitlines() == ["a.example.com", "b.example.com"]
+
+def test_stream_printer_keeps_no_state():
+    """같은 값도 호출할 때마다 출력하고 출력한 값에 따라 늘어나는 상태가 없는지 Test"""
+    out = io.StringIO()
+    printer = StreamPrinter("json", target="example.com", stream=out)
+    state = dict(vars(printer))
+    printer.subdomain("a.example.com")
+    printer.subdomain("a.example.com")
+    for i in range(1000):
+        printer.subdomain(f"host{i}.example.com")
+    
+    values = [json.loads(line)['value'] for line in out.getvalue().splitlines()]
+    assert values[:2] == ["a.example.com", "a.example.com"]
+    assert len(values) == 1002
+    assert vars(printer) == state
+
+def test_stream_printer_json_lines():
+    """StreamPrinter JSON Lines 출력 Test"""
+    out = io.StringIO()
+    printer = StreamPrinter("json", target="example.com", stream=out)
+    printer.subdomain("a.example.com")
+    printer.url("https://a.example.com", 443)
+    
+    records = [json.loads(line) for line in out.getvalue().splitlines()]
+    assert records == [
+        {'type': 'subdomain', 'target': 'example.com', 'value': 'a.example.com'},
+        {'type': 'url', 'target': 'example.com', 'value': 'https://a.example.com:443', 'port': 443},
+    ]
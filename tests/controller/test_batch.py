@@ -0,0 +1,36 @@
+import pytest
+import asyncio
+from subsurfer.core.controller.batch import BatchController, load_targets
+
+def test_load_targets(tmp_path):
+    """타겟 목록 파일 로드 Test"""
+    target_file = tmp_path / "targets.txt"
+    target_file.write_text("Example.com\n\n# comment\nexample.org.\nexample.com\n")
+    
+    assert load_targets(str(target_file)) == ["example.com", "example.org"]
+
+@pytest.mark.asyncio
+async def test_batch_controller_concurrency():
+    """BatchController 동시 실행 제한 및 공유 자원 Test"""
+    targets = [f"target{i}.com" for i in range(6)]
+    batch = BatchController(targets, silent=True, concurrency=2)
+    
+    running = 0
+    peak = 0
+    sessions = set()
+    
+    async def scan_target(controller):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        sessions.add(id(controller.session_manager))
+        await asyncio.sleep(0.05)
+        running -= 1
+        return controller.target
+    
+    results = await batch.run(scan_target)
+    
+    assert results == {target: target for target in targets}
+    assert peak == 2
+    # 모든 타겟이 하나의 세션 관리자를 공유
+    assert len(sessions) == 1
@@ -0,0 +1,114 @@
+import pytest
+import asyncio
+from subsurfer.core.controller.controller import SubSurferController
+from subsurfer.core.handler.web.web_scanner import WebScanner
+
+TEST_DOMAIN = "example.com"
+
+class _FakeResolver:
+    """모든 이름을 해석된 것으로 처리하는 테스트용 리졸버"""
+    
+    concurrency = 4
+    
+    async def resolve(self, name):
+        return ["127.0.0.1"]
+        
+    async def query(self, name, rdtype='A'):
+        # 무작위 이름은 해석되지 않음 (와일드카드 없음)
+        return []
+
+class _FakeScanner:
+    """지연 후 결과를 반환하는 테스트용 스캐너"""
+    
+    def __init__(self, names, delay: float):
+        self.names = set(names)
+        self.delay = delay
+        self.subdomains = set()
+        
+    async def scan(self):
+        await asyncio.sleep(self.delay)
+        self.subdomains.update(self.names)
+        return self.subdomains
+
+@pytest.mark.asyncio
+async def test_run_pipeline_streams_into_web_scan(monkeypatch):
+    """수집이 끝나기 전에 웹 스캔이 시작되는지 Test"""
+    loop = asyncio.get_event_loop()
+    scanned = {}
+    
+    async def fake_scan_subdomain(self, subdomain, addresses=None):
+        scanned[subdomain] = loop.time()
+        return {}
+    
+    monkeypatch.setattr(WebScanner, "scan_subdomain", fake_scan_subdomain)
+    
+    controller = SubSurferController(TEST_DOMAIN, silent=True, wappalyzer=object(), resolver=_FakeResolver())
+    controller.passive_handler.scanners = [
+        ('fast', _FakeScanner(["a.example.com", "b.example.com"], 0.01)),
+        ('slow', _FakeScanner(["b.example.com", "c.example.com"], 0.3)),
+    ]
+    
+    start = loop.time()
+    results = await controller.run_pipeline()
+    
+    assert results['subdomains'] == {"a.example.com", "b.example.com", "c.example.com"}
+    # 중복 제거 후 한 번씩만 스캔
+    assert set(scanned) == results['subdomains']
+    # 빠른 소스의 결과는 느린 소스가 끝나기 전에 스캔
+    assert scanned["a.example.com"] - start < 0.2
+    assert results['vulnerable_takeover'] == []
+
+@pytest.mark.asyncio
+async def test_run_pipeline_incremental(monkeypatch, tmp_path):
+    """증분 모드에서 새 자산만 검사하고 여러 실행에 걸쳐 차이를 계산하는지 Test"""
+    from subsurfer.core.utils.asset_store import AssetStore
+    
+    probed = []
+    web_hosts = {"a.example.com"}
+    
+    async def fake_scan_subdomain(self, subdomain, addresses=None):
+        probed.append(subdomain)
+        if subdomain in web_hosts:
+            self.web_servers.add(subdomain)
+            self.all_urls[subdomain] = [(f"https://{subdomain}", 443)]
+            return {f"https://{subdomain}": {}}
+        return {}
+    
+    monkeypatch.setattr(WebScanner, "scan_subdomain", fake_scan_subdomain)
+    store = AssetStore(str(tmp_path))
+    
+    async def run(names):
+        controller = SubSurferController(TEST_DOMAIN, silent=True, wappalyzer=object(),
+                                         resolver=_FakeResolver(), asset_store=store)
+        controller.passive_handler.scanners = [('fake', _FakeScanner(names, 0))]
+        probed.clear()
+        return await controller.run_pipeline()
+    
+    results = await run(["a.example.com", "b.example.com"])
+    assert sorted(probed) == ["a.example.com", "b.example.com"]
+    assert results['delta']['new'] == ["a.example.com", "b.example.com"]
+    
+    # 두 번째 실행 - 새 서브도메인만 검사, 저장된 웹 서버 결과 유지
+    results = await run(["a.example.com", "c.example.com"])
+    assert probed == ["c.example.com"]
+    assert results['web_servers'] == {"a.example.com"}
+    assert results['all_urls']["a.example.com"] == [("https://a.example.com", 443)]
+    assert results['delta'] == {'new': ["c.example.com"], 'changed': [], 'removed': ["b.example.com"]}
+    
+    # 검사 결과 만료 - 모두 다시 검사하고 바뀐 자산 보고
+    store.probe_ttl = 0
+    web_hosts.add("c.example.com")
+    results = await run(["a.example.com", "c.example.com"])
+    assert sorted(probed) == ["a.example.com", "c.example.com"]
+    assert results['delta']['changed'] == ["c.example.com"]
+    # 이전 실행에서 이미 사라진 자산은 다시 보고하지 않음
+    assert results['delta']['removed'] == []
+    
+    controller = SubSurferController(TEST_DOMAIN, silent=True, wappalyzer=object(), resolver=_FakeResolver())
+    assert controller.delta_view(results)['web_servers'] == {"c.example.com"}
+    
+    # 이전 실행에서 발견된 자산이 사라지면 한 번만 보고
+    results = await run(["a.example.com"])
+    assert results['delta']['removed'] == ["c.example.com"]
+    results = await run(["a.example.com"])
+    assert results['delta']['removed'] == []
@@ -75,3 +75,147 @@ async def test_active_handler_concurrent_scans(active_handler):
     
     # 모든 결과가 동일해야 함
     assert len(set(map(frozenset, results))) == 1
+
+class _DelayedResolver:
+    """지연 후 고정 응답을 반환하는 테스트용 리졸버"""
+    
+    def __init__(self, records, delay: float):
+        self.records = records
+        self.delay = delay
+        
+    async def query(self, name, rdtype='A'):
+        await asyncio.sleep(self.delay)
+        return self.records.get((name, rdtype), [])
+
+@pytest.mark.asyncio
+async def test_srv_scanner_queries_concurrently():
+    """SRV 레코드 동시 조회 Test"""
+    resolver = _DelayedResolver({
+        (f"_sip._tcp.{TEST_DOMAIN}", 'SRV'): [f"10 5 5060 sip.{TEST_DOMAIN}"],
+        (f"_ldap._tcp.{TEST_DOMAIN}", 'SRV'): ["0 0 389 ldap.other.com"],
+    }, delay=0.1)
+    scanner = SRVScanner(TEST_DOMAIN, silent=True, resolver=resolver)
+    
+    loop = asyncio.get_event_loop()
+    start = loop.time()
+    results = await scanner.scan()
+    elapsed = loop.time() - start
+    
+    assert results == {f"sip.{TEST_DOMAIN}"}
+    # 30개 레이블을 순차 조회했다면 3초 이상 소요
+    assert elapsed < 1.0
+
+@pytest.mark.asyncio
+async def test_sweep_scanner_reverse_lookup():
+    """리버스 DNS 결과 수집 Test"""
+    resolver = _DelayedResolver({
+        (TEST_DOMAIN, 'A'): ["192.0.2.1"],
+        ("1.2.0.192.in-addr.arpa.", 'PTR'): [f"www.{TEST_DOMAIN}"],
+    }, delay=0)
+    scanner = SweepScanner(TEST_DOMAIN, silent=True, resolver=resolver)
+    assert await scanner.scan() == {f"www.{TEST_DOMAIN}"}
+
+class _StubDNSProtocol(asyncio.DatagramProtocol):
+    """로컬 테스트용 UDP DNS 서버 (지연 응답, 첫 질의 무시, 와일드카드 지원)"""
+    
+    def __init__(self, records, wildcard=None, drop_first=(), delay: float = 0.01):
+        self.records = records
+        self.wildcard = wildcard
+        self.drop_first = set(drop_first)
+        self.delay = delay
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.queries = 0
+        
+    def connection_made(self, transport):
+        self.transport = transport
+        
+    def datagram_received(self, data, addr):
+        import dns.message
+        import dns.rcode
+        import dns.rdatatype
+        import dns.rrset
+        
+        request = dns.message.from_wire(data)
+        question = request.question[0]
+        name = question.name.to_text().rstrip('.')
+        self.queries += 1
+        if name in self.drop_first:
+            # 첫 질의는 응답하지 않아 재시도 유도
+            self.drop_first.discard(name)
+            return
+            
+        response = dns.message.make_response(request)
+        address = self.records.get(name)
+        if address is None and self.wildcard and name.endswith(f".{TEST_DOMAIN}"):
+            address = self.wildcard
+        if address is None:
+            response.set_rcode(dns.rcode.NXDOMAIN)
+        elif question.rdtype == dns.rdatatype.A:
+            response.answer.append(dns.rrset.from_text(question.name, 60, 'IN', 'A', address))
+            
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        
+        def reply():
+            self.in_flight -= 1
+            self.transport.sendto(response.to_wire(), addr)
+        asyncio.get_event_loop().call_later(self.delay, reply)
+
+async def _start_stub_dns(**kwargs):
+    loop = asyncio.get_event_loop()
+    transport, protocol = await loop.create_datagram_endpoint(
+        lambda: _StubDNSProtocol(**kwargs), local_addr=("127.0.0.1", 0)
+    )
+    port = transport.get_extra_info('sockname')[1]
+    return transport, protocol, f"127.0.0.1:{port}"
+
+@pytest.mark.asyncio
+async def test_bruteforce_scanner_with_stub_dns(tmp_path):
+    """로컬 DNS 서버 대상 브루트포스 (와일드카드 제외, 타임아웃 재시도) Test"""
+    from subsurfer.core.handler.active.bruteforce import BruteForceScanner
+    from subsurfer.core.utils.resolver import AsyncResolver
+    
+    wordlist = tmp_path / "words.txt"
+    wordlist.write_text("www\nmail\n# comment\n\nnope\nbad word\nstaging\n")
+    transport, protocol, address = await _start_stub_dns(
+        records={f"www.{TEST_DOMAIN}": "10.0.0.1", f"mail.{TEST_DOMAIN}": "10.0.0.2"},
+        wildcard="10.0.0.9",
+        drop_first={f"mail.{TEST_DOMAIN}"},
+    )
+    try:
+        resolver = AsyncResolver([address], timeout=0.3, retries=2)
+        scanner = BruteForceScanner(TEST_DOMAIN, silent=True, resolver=resolver, wordlist=str(wordlist))
+        results = await scanner.scan()
+    finally:
+        transport.close()
+        
+    assert results == {f"www.{TEST_DOMAIN}", f"mail.{TEST_DOMAIN}"}
+    assert scanner.attempted == 4
+    assert scanner.wildcard_skipped == 2
+    # 발견된 이름은 웹 스캔 단계에서 다시 조회하지 않음 (DNS 서버를 닫은 뒤에도 해석됨)
+    assert await resolver.resolve(f"mail.{TEST_DOMAIN}") == ["10.0.0.2"]
+
+@pytest.mark.asyncio
+async def test_bruteforce_scanner_bounded_window(tmp_path):
+    """진행 중인 질의 수가 window를 넘지 않는지 Test"""
+    from subsurfer.core.handler.active.bruteforce import BruteForceScanner
+    from subsurfer.core.utils.resolver import AsyncResolver
+    
+    wordlist = tmp_path / "words.txt"
+    wordlist.write_text("\n".join(f"host{i}" for i in range(400)))
+    records = {f"host{i}.{TEST_DOMAIN}": "10.0.1.1" for i in range(0, 400, 50)}
+    transport, protocol, address = await _start_stub_dns(records=records, delay=0.005)
+    try:
+        resolver = AsyncResolver([address], timeout=1.0, concurrency=500)
+        scanner = BruteForceScanner(TEST_DOMAIN, silent=True, resolver=resolver,
+                                    wordlist=str(wordlist), window=32)
+        queue = asyncio.Queue()
+        scanner.queue = queue
+        results = await scanner.scan()
+    finally:
+        transport.close()
+        
+    assert results == set(records)
+    assert queue.qsize() == len(records)
+    assert protocol.max_in_flight <= 32
@@ -1,6 +1,8 @@
 import pytest
 import asyncio
+import json
 from typing import Set
+from aiohttp import web
 from subsurfer.core.handler.passive_handler import PassiveHandler
 from subsurfer.core.handler.passive.crtsh import CrtshScanner
 from subsurfer.core.handler.passive.abuseipdb import AbuseIPDBScanner
@@ -247,3 +249,218 @@ async def test_dnsarchive_scanner_connection_error():
     results = await scanner.scan()
     assert isinstance(results, set)
     assert len(results) == 0  # 오류 발생 시 빈 set 반환
+
+class _DelayedScanner:
+    """지연 시간을 갖는 테스트용 스캐너"""
+    
+    def __init__(self, names, delay: float):
+        self.names = names
+        self.delay = delay
+        self.subdomains = set()
+        
+    async def scan(self) -> Set[str]:
+        self.subdomains.update(self.names[:1])  # 일부 결과를 먼저 수집
+        await asyncio.sleep(self.delay)
+        self.subdomains.update(self.names)
+        return self.subdomains
+
+@pytest.mark.asyncio
+async def test_passive_handler_runs_sources_concurrently():
+    """PassiveHandler 동시 실행 및 제한 시간 Test"""
+    handler = PassiveHandler(TEST_DOMAIN, silent=True, source_timeout=0.5, deadline=2.0)
+    handler.scanners = [
+        ('fast-1', _DelayedScanner(["a.example.com"], 0.2)),
+        ('fast-2', _DelayedScanner(["b.example.com"], 0.2)),
+        ('slow', _DelayedScanner(["c.example.com", "d.example.com"], 5)),
+    ]
+    
+    start_time = asyncio.get_event_loop().time()
+    results = await handler.collect()
+    elapsed = asyncio.get_event_loop().time() - start_time
+    
+    # 순차 실행이었다면 0.4초 + 타임아웃 0.5초 이상 소요
+    assert elapsed < 0.8
+    # 시간 초과된 소스의 부분 결과도 포함
+    assert results == {"a.example.com", "b.example.com", "c.example.com"}
+
+@pytest.mark.asyncio
+async def test_passive_handler_deadline():
+    """PassiveHandler 전체 제한 시간 Test"""
+    handler = PassiveHandler(TEST_DOMAIN, silent=True, source_timeout=10, deadline=0.3)
+    handler.scanners = [
+        ('fast', _DelayedScanner(["a.example.com"], 0.05)),
+        ('slow', _DelayedScanner(["b.example.com", "c.example.com"], 5)),
+    ]
+    
+    results = await handler.collect()
+    assert results == {"a.example.com", "b.example.com"}
+
+class _SessionRecordingScanner:
+    """주입된 세션을 기록하는 테스트용 스캐너"""
+    
+    def __init__(self):
+        self.session = None
+        self.subdomains = set()
+        self.seen = None
+        
+    async def scan(self) -> Set[str]:
+        self.seen = self.session
+        return self.subdomains
+
+@pytest.mark.asyncio
+async def test_passive_handler_shared_session():
+    """PassiveHandler 공유 세션 주입 Test"""
+    handler = PassiveHandler(TEST_DOMAIN, silent=True)
+    handler.scanners = [('one', _SessionRecordingScanner()), ('two', _SessionRecordingScanner())]
+    
+    await handler.collect()
+    
+    sessions = [scanner.seen for _, scanner in handler.scanners]
+    assert sessions[0] is not None
+    assert sessions[0] is sessions[1]
+    # 수집 종료 후 세션 정리
+    assert sessions[0].closed
+
+class _CountingScanner:
+    """호출 횟수를 기록하는 테스트용 스캐너"""
+    
+    def __init__(self, names):
+        self.names = set(names)
+        self.calls = 0
+        self.subdomains = set()
+        
+    async def scan(self):
+        self.calls += 1
+        self.subdomains.update(self.names)
+        return self.subdomains
+
+@pytest.mark.asyncio
+async def test_passive_handler_result_cache(tmp_path):
+    """소스 결과 캐시 및 stale 결과 백그라운드 갱신 Test"""
+    from subsurfer.core.utils.result_cache import ResultCache
+    
+    cache = ResultCache(str(tmp_path), default_ttl=3600)
+    scanner = _CountingScanner([f"www.{TEST_DOMAIN}"])
+    handler = PassiveHandler(TEST_DOMAIN, silent=True, cache=cache)
+    handler.scanners = [('fake', scanner)]
+    assert await handler.collect() == {f"www.{TEST_DOMAIN}"}
+    assert scanner.calls == 1
+    
+    # TTL 이내 - 소스를 다시 조회하지 않음
+    handler = PassiveHandler(TEST_DOMAIN, silent=True, cache=cache)
+    handler.scanners = [('fake', scanner)]
+    assert await handler.collect() == {f"www.{TEST_DOMAIN}"}
+    assert scanner.calls == 1
+    
+    # TTL 경과 - 기존 결과를 반환하고 백그라운드에서 갱신
+    cache.default_ttl = 0
+    scanner.names.add(f"api.{TEST_DOMAIN}")
+    handler = PassiveHandler(TEST_DOMAIN, silent=True, cache=cache)
+    handler.scanners = [('fake', scanner)]
+    assert await handler.collect() == {f"www.{TEST_DOMAIN}"}
+    await handler.wait_refresh()
+    assert scanner.calls == 2
+    assert cache.get('fake', TEST_DOMAIN)[0] == {f"www.{TEST_DOMAIN}", f"api.{TEST_DOMAIN}"}
+
+class _FailingScanner:
+    """비정상 응답 시 빈 집합을 반환하는 스캐너 (alienvault/myssl 등과 같은 동작)"""
+    
+    def __init__(self):
+        self.calls = 0
+        self.subdomains = set()
+        
+    async def scan(self):
+        self.calls += 1
+        return set()
+
+@pytest.mark.asyncio
+async def test_passive_handler_does_not_cache_failures(tmp_path):
+    """실패(빈 결과)한 소스는 캐시에 남지 않고 다음 실행에서 다시 조회하는지 Test"""
+    from subsurfer.core.utils.result_cache import ResultCache
+    
+    cache = ResultCache(str(tmp_path), default_ttl=3600)
+    scanner = _FailingScanner()
+    handler = PassiveHandler(TEST_DOMAIN, silent=True, cache=cache)
+    handler.scanners = [('AlienVault', scanner)]
+    assert await handler.collect() == set()
+    assert cache.get('AlienVault', TEST_DOMAIN) is None
+    
+    # 이전에 저장된 빈 결과도 사용하지 않고 다시 조회
+    cache.put('AlienVault', TEST_DOMAIN, set())
+    handler = PassiveHandler(TEST_DOMAIN, silent=True, cache=cache)
+    handler.scanners = [('AlienVault', scanner)]
+    await handler.collect()
+    assert scanner.calls == 2
+    
+    # 실패한 갱신이 기존 결과를 덮어쓰지 않음
+    cache.put('AlienVault', TEST_DOMAIN, {f"www.{TEST_DOMAIN}"})
+    cache.default_ttl = 0
+    handler = PassiveHandler(TEST_DOMAIN, silent=True, cache=cache)
+    handler.scanners = [('AlienVault', scanner)]
+    assert await handler.collect() == {f"www.{TEST_DOMAIN}"}
+    await handler.wait_refresh()
+    assert scanner.calls == 3
+    assert cache.get('AlienVault', TEST_DOMAIN)[0] == {f"www.{TEST_DOMAIN}"}
+
+@pytest.mark.asyncio
+async def test_passive_handler_skips_open_circuit():
+    """서킷이 열린 소스 건너뛰기 Test"""
+    scanner = _CountingScanner([f"www.{TEST_DOMAIN}"])
+    handler = PassiveHandler(TEST_DOMAIN, silent=True)
+    handler.scanners = [('dead', scanner)]
+    breaker = handler.session_manager.rate_limiter.breaker('dead')
+    for _ in range(breaker.threshold):
+        breaker.record_failure()
+    
+    assert await handler.collect() == set()
+    assert scanner.calls == 0
+
+async def _start_server(path, body: bytes):
+    """body를 그대로 응답하는 로컬 HTTP 서버"""
+    async def handler(request):
+        return web.Response(body=body)
+    
+    app = web.Application()
+    app.router.add_get(path, handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    return runner, f"http://127.0.0.1:{port}"
+
+@pytest.mark.asyncio
+async def test_crtsh_scanner_mixed_case_domain():
+    """대소문자가 섞인 대상 도메인에서도 crt.sh 결과를 버리지 않는지 Test"""
+    entries = [{"name_value": f"www.{TEST_DOMAIN}\nMail.{TEST_DOMAIN.upper()}"}]
+    runner, url = await _start_server("/", json.dumps(entries).encode())
+    try:
+        scanner = CrtshScanner(TEST_DOMAIN.title(), silent=True)
+        scanner.base_url = url
+        results = await scanner.scan()
+    finally:
+        await runner.cleanup()
+    assert results == {f"www.{TEST_DOMAIN}", f"mail.{TEST_DOMAIN}"}
+
+@pytest.mark.asyncio
+async def test_webarchive_scanner_mixed_case_domain(tmp_path):
+    """대소문자가 섞인 대상 도메인에서도 WebArchive 결과를 버리지 않는지 Test"""
+    body = f"http://www.{TEST_DOMAIN}/\nhttps://Shop.{TEST_DOMAIN.upper()}/cart\n".encode()
+    runner, url = await _start_server("/cdx", body)
+    try:
+        scanner = WebArchiveScanner(f"{TEST_DOMAIN.title()}.", silent=True, checkpoint_dir=str(tmp_path))
+        scanner.base_url = f"{url}/cdx"
+        results = await scanner.scan()
+    finally:
+        await runner.cleanup()
+    assert results == {f"www.{TEST_DOMAIN}", f"shop.{TEST_DOMAIN}"}
+
+@pytest.mark.asyncio
+async def test_passive_handler_normalizes_target():
+    """대상 도메인을 한 번 정규화해 모든 소스에 전달하는지 Test"""
+    scanner = _CountingScanner([f"www.{TEST_DOMAIN}", f"API.{TEST_DOMAIN.upper()}"])
+    handler = PassiveHandler(f"{TEST_DOMAIN.upper()}.", silent=True, sources=['webarchive'])
+    assert handler.target == TEST_DOMAIN
+    assert handler.scanners[0][1].domain == TEST_DOMAIN
+    handler.scanners = [('fake', scanner)]
+    assert await handler.collect() == {f"www.{TEST_DOMAIN}", f"api.{TEST_DOMAIN}"}
@@ -0,0 +1,59 @@
+import subprocess
+import sys
+import pytest
+from subsurfer.core.handler.passive import registry
+from subsurfer.core.handler.passive_handler import PassiveHandler
+
+TEST_DOMAIN = "example.com"
+
+def test_select_sources_by_alias():
+    """대소문자/구두점과 무관하게 소스를 선택하고 레지스트리 순서를 유지하는지 Test"""
+    assert registry.select_sources(['webarchive', 'CRTSH', 'dns-archive']) == ['crt.sh', 'WebArchive', 'DNS Archive']
+
+    selected = registry.select_sources(exclude=['crt.sh', 'MerkleMap'])
+    assert 'crt.sh' not in selected and 'MerkleMap' not in selected
+    assert len(selected) == len(registry.SOURCES) - 2
+
+def test_select_sources_rejects_unknown():
+    """알 수 없는 소스 이름은 오류로 처리하는지 Test"""
+    with pytest.raises(ValueError, match="nosuchsource"):
+        registry.select_sources(['crtsh', 'nosuchsource'])
+
+def test_parse_source_list():
+    """쉼표 구분 목록 파싱 Test"""
+    assert registry.parse_source_list(" crtsh, WebArchive ,,") == ['crtsh', 'WebArchive']
+    assert registry.parse_source_list(None) == []
+
+def test_entry_point_sources(monkeypatch):
+    """entry point로 등록된 외부 소스를 사용할 수 있는지 Test"""
+    monkeypatch.setattr(registry, '_available', None)
+    monkeypatch.setattr(registry, '_entry_point_sources', lambda: {
+        'Custom': 'tests.handlers.test_source_registry:_CustomScanner',
+        'crtsh': 'tests.handlers.test_source_registry:_CustomScanner',  # 내장 소스와 같은 이름은 무시
+    })
+
+    assert registry.select_sources(['custom']) == ['Custom']
+    assert registry.available_sources()['crt.sh'] == registry.SOURCES['crt.sh']
+
+    handler = PassiveHandler(TEST_DOMAIN, silent=True, sources=['custom'])
+    name, scanner = handler.scanners[0]
+    assert name == 'Custom' and isinstance(scanner, _CustomScanner)
+    monkeypatch.setattr(registry, '_available', None)
+
+def test_only_selected_sources_are_imported():
+    """선택된 소스 모듈만 import되는지 Test"""
+    code = (
+        "import sys\n"
+        "from subsurfer.core.handler.passive_handler import PassiveHandler\n"
+        "handler = PassiveHandler('example.com', silent=True, sources=['crtsh'])\n"
+        "assert not any(m.startswith('subsurfer.core.handler.passive.') and not m.endswith('registry') for m in sys.modules)\n"
+        "assert [name for name, _ in handler.scanners] == ['crt.sh']\n"
+        "loaded = sorted(m for m in sys.modules if m.startswith('subsurfer.core.handler.passive.'))\n"
+        "assert loaded == ['subsurfer.core.handler.passive.crtsh', 'subsurfer.core.handler.passive.registry'], loaded\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+class _CustomScanner:
+    def __init__(self, domain, silent=False):
+        self.domain = domain
+        self.subdomains = set()
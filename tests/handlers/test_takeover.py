@@ -0,0 +1,138 @@
+import json
+import pytest
+import asyncio
+from aiohttp import web
+from subsurfer.core.handler.takeover.takeover_handler import TakeoverHandler
+
+TEST_DOMAIN = "example.com"
+GITHUB_404 = "<h1>404</h1><p>There isn't a GitHub Pages site here.</p>"
+
+class _CNAMEResolver:
+    """pages-* 이름은 GitHub Pages, 나머지는 CNAME 없음으로 응답하는 테스트용 리졸버"""
+
+    def __init__(self):
+        self.queries = []
+
+    async def query(self, name, rdtype='A'):
+        self.queries.append((name, rdtype))
+        if rdtype == 'CNAME' and name.startswith("pages-"):
+            return ["Octocat.GitHub.io"]
+        return []
+
+    async def resolve(self, name):
+        return ["127.0.0.1"]
+
+@pytest.mark.asyncio
+async def test_takeover_bounded_workers_and_shared_session():
+    """워커 수만큼만 동시에 검사하고 하나의 세션을 공유하는지 Test"""
+    resolver = _CNAMEResolver()
+    handler = TakeoverHandler(TEST_DOMAIN, silent=True, resolver=resolver, concurrency=8)
+    in_flight = 0
+    peak = 0
+    sessions = set()
+    checked = []
+
+    async def fake_http(domain):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        sessions.add(id(handler.session))
+        checked.append(domain)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return 404, GITHUB_404
+
+    handler.check_http_response = fake_http
+    names = {f"pages-{i}.{TEST_DOMAIN}" for i in range(100)} | {f"plain-{i}.{TEST_DOMAIN}" for i in range(100)}
+    results = await handler.scan(names)
+
+    assert len(results) == 100
+    assert {r['service'] for r in results} == {"GitHub Pages"}
+    assert results[0]['cname'] == "octocat.github.io"
+    # CNAME이 알려진 서비스를 가리키지 않는 이름은 HTTP 요청 없음
+    assert all(name.startswith("pages-") for name in checked)
+    assert peak <= 8
+    assert len(sessions) == 1 and handler.session is None
+    assert len(resolver.queries) == 200
+
+@pytest.mark.asyncio
+async def test_takeover_stream_host_timeout():
+    """응답하지 않는 호스트는 호스트별 제한 시간 후 건너뛰는지 Test"""
+    handler = TakeoverHandler(TEST_DOMAIN, silent=True, resolver=_CNAMEResolver(), concurrency=4, timeout=0.2)
+
+    async def hanging_http(domain):
+        await asyncio.sleep(30)
+
+    handler.check_http_response = hanging_http
+    queue = asyncio.Queue()
+    for i in range(6):
+        queue.put_nowait(f"pages-{i}.{TEST_DOMAIN}")
+    queue.put_nowait(None)
+
+    results = await asyncio.wait_for(handler.scan_stream(queue), timeout=5)
+    assert results == []
+
+@pytest.mark.asyncio
+async def test_takeover_http_check_local_server():
+    """공유 세션으로 로컬 서버 응답을 확인하고 fingerprint가 일치하는지 Test"""
+    async def not_found(request):
+        return web.Response(status=404, text=GITHUB_404)
+
+    app = web.Application()
+    app.router.add_get("/", not_found)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+
+    try:
+        handler = TakeoverHandler(TEST_DOMAIN, silent=True, resolver=_CNAMEResolver())
+        # https 시도는 실패하고 http 응답 사용
+        status, body = await handler.check_http_response(f"127.0.0.1:{port}")
+    finally:
+        await runner.cleanup()
+
+    assert status == 404
+    assert handler.match_fingerprint("octocat.github.io", status, body)['service'] == "GitHub Pages"
+
+def test_fingerprint_matcher_checks_candidate_patterns():
+    """CNAME 후보의 모든 패턴을 확인하고 다른 서비스의 패턴은 무시하는지 Test"""
+    from subsurfer.core.handler.takeover.matcher import FingerprintMatcher, normalize_fingerprint
+
+    matcher = FingerprintMatcher([
+        normalize_fingerprint({"service": "A", "cname": ["a.net"], "fingerprint": ["first", "second"], "http_status": [404]}),
+        normalize_fingerprint({"service": "B", "cname": ["b.net"], "fingerprint": ["other"], "http_status": [404]}),
+    ])
+    assert matcher.match("x.a.net", 404, "...second...")['service'] == "A"
+    assert matcher.match("x.a.net", 404, "other") is None
+    assert matcher.match("x.a.net", 200, "first") is None
+
+def test_fingerprint_matcher_suffix_index(tmp_path):
+    """CNAME 접미사 인덱스와 사용자 fingerprint 파일 (커뮤니티 형식 포함) Test"""
+    custom = tmp_path / "custom.json"
+    custom.write_text(json.dumps([
+        {"service": "Example Host", "cname": ["pages.example-host.net."], "fingerprint": "Site not found",
+         "http_status": None, "vulnerable": True},
+        {"service": "Not vulnerable", "cname": ["safe.net"], "fingerprint": "x", "vulnerable": False},
+        {"service": "Dangling only", "cname": ["gone.net"], "fingerprint": "NXDOMAIN"},
+    ]))
+    handler = TakeoverHandler(TEST_DOMAIN, silent=True, resolver=_CNAMEResolver(),
+                              fingerprint_files=[str(custom)])
+
+    assert [fp['service'] for fp in handler.candidate_fingerprints("a.b.pages.example-host.net")] == ["Example Host"]
+    # 레이블 경계 단위로만 일치
+    assert handler.candidate_fingerprints("notgithub.io") == []
+    assert handler.candidate_fingerprints("safe.net") == []
+    assert handler.candidate_fingerprints("gone.net") == []
+
+    # http_status가 없으면 모든 상태 코드와 일치
+    assert handler.match_fingerprint("x.pages.example-host.net", 200, "<p>Site not found</p>")['service'] == "Example Host"
+    assert handler.match_fingerprint("x.pages.example-host.net", 200, "<p>Welcome</p>") is None
+    # 상태 코드가 다르면 본문이 일치해도 제외
+    assert handler.match_fingerprint("octocat.github.io", 200, GITHUB_404) is None
+
+    # 같은 파일 목록은 한 번만 컴파일
+    other = TakeoverHandler(TEST_DOMAIN, silent=True, resolver=_CNAMEResolver(), fingerprint_files=[str(custom)])
+    assert other.matcher is handler.matcher
+    assert TakeoverHandler(TEST_DOMAIN, silent=True, resolver=_CNAMEResolver()).matcher is not handler.matcher
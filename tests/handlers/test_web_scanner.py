@@ -0,0 +1,171 @@
+import pytest
+import asyncio
+from aiohttp import web
+from subsurfer.core.handler.web.web_scanner import WebScanner
+
+class _FakeWappalyzer:
+    """분석 결과를 고정으로 반환하는 테스트용 Wappalyzer"""
+    
+    def analyze_with_versions_and_categories(self, webpage):
+        return {}
+
+async def _start_servers(count: int, delay: float):
+    """지연 응답하는 로컬 HTTP 서버 여러 개 실행"""
+    async def handler(request):
+        await asyncio.sleep(delay)
+        return web.Response(text="<html></html>", content_type="text/html")
+    
+    app = web.Application()
+    app.router.add_get("/", handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    
+    ports = []
+    for _ in range(count):
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        ports.append(site._server.sockets[0].getsockname()[1])
+    return runner, ports
+
+@pytest.mark.asyncio
+async def test_web_scanner_probes_ports_concurrently():
+    """WebScanner 포트 동시 검사 Test"""
+    runner, ports = await _start_servers(6, delay=0.3)
+    try:
+        printed = []
+        printer = type("Printer", (), {
+            "url": lambda self, url, port: printed.append(("url", port)),
+            "web_server": lambda self, subdomain: printed.append(("web_server", subdomain)),
+            "enabled_service": lambda self, subdomain: printed.append(("enabled_service", subdomain)),
+        })()
+        scanner = WebScanner("localhost", ports=sorted(ports), silent=True, wappalyzer=_FakeWappalyzer(),
+                             printer=printer)
+        async with scanner:
+            loop = asyncio.get_event_loop()
+            start = loop.time()
+            results = await scanner.scan({"127.0.0.1"})
+            elapsed = loop.time() - start
+    finally:
+        await runner.cleanup()
+    
+    assert results['web_servers'] == {"127.0.0.1"}
+    # 모든 포트가 http로 확인되고 포트 순서대로 정렬
+    assert results['all_urls']["127.0.0.1"] == [(f"http://127.0.0.1:{port}", port) for port in sorted(ports)]
+    # 웹 서버는 포트 수와 관계없이 한 번만 출력
+    assert printed.count(("web_server", "127.0.0.1")) == 1
+    assert sorted(port for kind, port in printed if kind == "url") == sorted(ports)
+    # 순차 검사였다면 6 x 0.3초 이상 소요
+    assert elapsed < 1.2
+
+@pytest.mark.asyncio
+async def test_port_scanner_filters_closed_ports():
+    """PortScanner 열린 포트 필터링 Test"""
+    from subsurfer.core.handler.web.port_scanner import PortScanner
+    
+    runner, ports = await _start_servers(2, delay=0)
+    await runner.cleanup()  # 포트를 닫아 closed 상태로 만듦
+    closed_ports = ports
+    
+    runner, open_ports = await _start_servers(2, delay=0)
+    try:
+        scanner = PortScanner(timeout=1.0)
+        results = await scanner.scan("localhost", closed_ports + open_ports, address="127.0.0.1")
+    finally:
+        await runner.cleanup()
+    
+    assert results == open_ports
+
+class _StaticResolver:
+    """지정한 이름만 해석하는 테스트용 리졸버"""
+    
+    concurrency = 4
+    
+    def __init__(self, records, wildcards=None):
+        self.records = records
+        self.wildcards = wildcards or {}  # 상위 도메인 -> 와일드카드 응답
+        self.queried = []
+        
+    async def resolve(self, name):
+        self.queried.append(name)
+        return self.records.get(name, [])
+        
+    async def is_alive(self, name):
+        return bool(await self.resolve(name))
+        
+    async def query(self, name, rdtype='A'):
+        if rdtype != 'A':
+            return []
+        for pattern, addresses in self.wildcards.items():
+            if name.endswith(f".{pattern}") and name.count('.') == pattern.count('.') + 1:
+                return addresses
+        return self.records.get(name, [])
+
+@pytest.mark.asyncio
+async def test_web_scanner_skips_unresolved_names(monkeypatch):
+    """해석되지 않는 이름은 HTTP 검사 전에 제외하는지 Test"""
+    probed = []
+    
+    async def fake_scan(self, host, ports, address=None):
+        probed.append((host, address))
+        return []
+    
+    from subsurfer.core.handler.web.port_scanner import PortScanner
+    monkeypatch.setattr(PortScanner, "scan", fake_scan)
+    
+    resolver = _StaticResolver({"live.example.com": ["127.0.0.1"]})
+    scanner = WebScanner("example.com", silent=True, wappalyzer=_FakeWappalyzer(), resolver=resolver)
+    async with scanner:
+        results = await scanner.scan({"live.example.com", "dead.example.com"})
+    
+    assert probed == [("live.example.com", "127.0.0.1")]
+    assert results['enabled_services'] == {"live.example.com"}
+
+@pytest.mark.asyncio
+async def test_web_scanner_skips_wildcard_names(monkeypatch):
+    """와일드카드 DNS 응답으로만 해석되는 이름은 HTTP 검사 전에 제외하는지 Test"""
+    probed = []
+    
+    async def fake_scan(self, host, ports, address=None):
+        probed.append(host)
+        return []
+    
+    from subsurfer.core.handler.web.port_scanner import PortScanner
+    monkeypatch.setattr(PortScanner, "scan", fake_scan)
+    
+    resolver = _StaticResolver({
+        "www.example.com": ["10.0.0.5"],
+        "junk.example.com": ["10.0.0.9"],
+        "old.dev.example.com": ["10.0.0.9"],
+    }, wildcards={"example.com": ["10.0.0.9"], "dev.example.com": ["10.0.0.9"]})
+    scanner = WebScanner("example.com", silent=True, wappalyzer=_FakeWappalyzer(), resolver=resolver)
+    async with scanner:
+        await scanner.scan({"www.example.com", "junk.example.com", "old.dev.example.com"})
+    
+    assert probed == ["www.example.com"]
+    assert scanner.wildcard_skipped == 2
+    
+    probed.clear()
+    scanner = WebScanner("example.com", silent=True, wappalyzer=_FakeWappalyzer(), resolver=resolver,
+                         filter_wildcards=False)
+    async with scanner:
+        await scanner.scan({"www.example.com", "junk.example.com"})
+    assert sorted(probed) == ["junk.example.com", "www.example.com"]
+
+@pytest.mark.asyncio
+async def test_fingerprint_analyzer_process_pool():
+    """프로세스 풀 핑거프린트 분석 Test"""
+    from subsurfer.core.handler.web.analyzer import FingerprintAnalyzer
+    
+    html = '<html><script src="/js/jquery-3.5.1.min.js"></script></html>'
+    analyzer = FingerprintAnalyzer(workers=2, max_pending=4)
+    # 스레드가 동작 중인 프로세스를 fork하지 않음
+    assert analyzer.mp_context.get_start_method() in ('forkserver', 'spawn')
+    try:
+        results = await asyncio.gather(*(
+            analyzer.analyze(f"http://127.0.0.1/{i}", html, [("Server", "nginx")]) for i in range(8)
+        ))
+    finally:
+        analyzer.close()
+    
+    assert all(result['jQuery']['versions'] == ['3.5.1'] for result in results)
+    assert all('Nginx' in result for result in results)
@@ -0,0 +1,75 @@
+import pytest
+import os
+from aiohttp import web
+from subsurfer.core.handler.passive.webarchive import WebArchiveScanner
+
+TEST_DOMAIN = "example.com"
+
+PAGES = {
+    0: [f"http://a.{TEST_DOMAIN}/", f"http://b.{TEST_DOMAIN}:8080/x"],
+    1: [f"https://c.{TEST_DOMAIN}/", f"http://a.{TEST_DOMAIN}/y"],
+    2: [f"http://d.{TEST_DOMAIN}/", "http://other.org/"],
+}
+
+async def _start_cdx_server(failing=()):
+    """페이지 단위로 응답하는 CDX 서버 (failing 페이지는 404)"""
+    requested = []
+    
+    async def handler(request):
+        if request.query.get('showNumPages') == 'true':
+            return web.Response(text=f"{len(PAGES)}\n")
+        page = int(request.query['page'])
+        requested.append(page)
+        if page in failing:
+            return web.Response(status=404)
+        return web.Response(text="\n".join(PAGES[page]) + "\n")
+    
+    app = web.Application()
+    app.router.add_get("/cdx", handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    return runner, f"http://127.0.0.1:{port}/cdx", requested
+
+async def _scan(url, checkpoint_dir):
+    scanner = WebArchiveScanner(TEST_DOMAIN, silent=True, checkpoint_dir=str(checkpoint_dir))
+    scanner.base_url = url
+    return scanner, await scanner.scan()
+
+@pytest.mark.asyncio
+async def test_webarchive_paginated_scan(tmp_path):
+    """CDX 페이지 단위 수집 Test"""
+    runner, url, requested = await _start_cdx_server()
+    try:
+        scanner, results = await _scan(url, tmp_path)
+    finally:
+        await runner.cleanup()
+    assert results == {f"{name}.{TEST_DOMAIN}" for name in "abcd"}
+    assert sorted(requested) == [0, 1, 2]
+    assert scanner.complete
+    # 수집이 끝나면 체크포인트 삭제
+    assert not os.path.exists(scanner.checkpoint_path)
+
+@pytest.mark.asyncio
+async def test_webarchive_resumes_from_checkpoint(tmp_path):
+    """실패한 페이지만 다음 실행에서 다시 수집 Test"""
+    runner, url, requested = await _start_cdx_server(failing={1})
+    try:
+        scanner, results = await _scan(url, tmp_path)
+    finally:
+        await runner.cleanup()
+    assert not scanner.complete
+    assert f"c.{TEST_DOMAIN}" not in results
+    assert os.path.exists(scanner.checkpoint_path)
+    
+    runner, url, requested = await _start_cdx_server()
+    try:
+        scanner, results = await _scan(url, tmp_path)
+    finally:
+        await runner.cleanup()
+    assert requested == [1]
+    assert scanner.complete
+    assert results == {f"{name}.{TEST_DOMAIN}" for name in "abcd"}
+    assert not os.path.exists(scanner.checkpoint_path)
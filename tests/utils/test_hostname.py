@@ -0,0 +1,33 @@
+import pytest
+from subsurfer.core.utils.hostname import normalize_hostname, normalize_hostnames
+
+TEST_DOMAIN = "example.com"
+
+@pytest.mark.parametrize("name, expected", [
+    ("WWW.Example.COM", "www.example.com"),
+    ("*.dev.example.com", "dev.example.com"),
+    ("api.example.com.", "api.example.com"),
+    ("  .mail.example.com ", "mail.example.com"),
+    ("_dmarc.example.com", "_dmarc.example.com"),
+    ("bücher.example.com", "xn--bcher-kva.example.com"),
+    ("example.com", "example.com"),
+    ("notexample.com", None),
+    ("www.example.com.evil.org", None),
+    ("a..example.com", None),
+    ("foo.*.example.com", None),
+    ("-bad.example.com", None),
+    ("bad host.example.com", None),
+    (("a" * 64) + ".example.com", None),
+    ("", None),
+])
+def test_normalize_hostname(name, expected):
+    """호스트명 정규화 Test"""
+    assert normalize_hostname(name, TEST_DOMAIN) == expected
+
+def test_normalize_hostnames_splits_and_interns():
+    """여러 이름이 든 값 분리, 중복 제거 및 intern Test"""
+    results = normalize_hostnames(["a.example.com\n*.a.example.com", "A.EXAMPLE.COM.", None, "b.example.com c.org"], TEST_DOMAIN)
+    assert results == {"a.example.com", "b.example.com"}
+    first = normalize_hostnames(["X.example.com"], TEST_DOMAIN).pop()
+    second = normalize_hostnames(["x.example.com."], TEST_DOMAIN).pop()
+    assert first is second
@@ -0,0 +1,69 @@
+import pytest
+import asyncio
+from aiohttp import web
+from subsurfer.core.utils.rate_limit import RateLimiter, TokenBucket, CircuitOpenError, current_source
+from subsurfer.core.utils.session import SessionManager
+
+async def _start_server(statuses):
+    """지정한 상태 코드를 차례로 응답하는 로컬 HTTP 서버 (마지막 값 반복)"""
+    hits = []
+    
+    async def handler(request):
+        status = statuses[min(len(hits), len(statuses) - 1)]
+        hits.append(status)
+        return web.Response(status=status, text="ok", headers={'Retry-After': '0'} if status == 429 else {})
+    
+    app = web.Application()
+    app.router.add_get("/", handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    return runner, f"http://127.0.0.1:{port}/", hits
+
+@pytest.mark.asyncio
+async def test_token_bucket_limits_rate():
+    """토큰 버킷 속도 제한 Test"""
+    bucket = TokenBucket(rate=20, burst=1)
+    loop = asyncio.get_event_loop()
+    start = loop.time()
+    for _ in range(5):
+        await bucket.acquire()
+    assert loop.time() - start >= 0.19
+
+@pytest.mark.asyncio
+async def test_rate_limiter_retries_429():
+    """429 응답 시 Retry-After 후 재시도 Test"""
+    runner, url, hits = await _start_server([429, 429, 200])
+    manager = SessionManager(rate_limiter=RateLimiter(rate=100, burst=10, backoff_base=0.01))
+    try:
+        async with manager as session:
+            async with session.get(url) as response:
+                assert response.status == 200
+    finally:
+        await runner.cleanup()
+    assert hits == [429, 429, 200]
+
+@pytest.mark.asyncio
+async def test_rate_limiter_opens_circuit_per_source():
+    """연속 실패 시 소스 서킷 브레이커 Test"""
+    runner, url, hits = await _start_server([503])
+    limiter = RateLimiter(rate=100, burst=10, retries=1, backoff_base=0.01, failure_threshold=2)
+    manager = SessionManager(rate_limiter=limiter)
+    token = current_source.set('flaky')
+    try:
+        async with manager as session:
+            for _ in range(2):
+                async with session.get(url) as response:
+                    assert response.status == 503
+            with pytest.raises(CircuitOpenError):
+                await session.get(url)
+    finally:
+        current_source.reset(token)
+        await runner.cleanup()
+    
+    # 재시도 포함 요청 2건 x 2회 시도 후 차단
+    assert len(hits) == 4
+    assert limiter.is_open('flaky')
+    assert not limiter.is_open('127.0.0.1')
@@ -0,0 +1,25 @@
+import pytest
+from subsurfer.core.utils.resolver import AsyncResolver, load_resolvers
+
+def test_load_resolvers(tmp_path):
+    """리졸버 목록 파싱 Test"""
+    assert load_resolvers("1.1.1.1, 8.8.8.8:5353") == ["1.1.1.1", "8.8.8.8:5353"]
+    
+    path = tmp_path / "resolvers.txt"
+    path.write_text("# public\n1.1.1.1\n\n9.9.9.9:53\n")
+    assert load_resolvers(str(path)) == ["1.1.1.1", "9.9.9.9:53"]
+
+def test_resolver_nameserver_ports():
+    """ip:port 형식 리졸버 설정 Test"""
+    resolver = AsyncResolver(["127.0.0.1:5353", "[::1]:5300", "8.8.8.8"])
+    assert resolver.resolver.nameserver_ports == {"127.0.0.1": 5353, "::1": 5300, "8.8.8.8": 53}
+    assert resolver.resolver.rotate
+
+@pytest.mark.asyncio
+async def test_resolver_ip_literal_and_cache():
+    """IP 주소 즉시 반환 및 조회 결과 캐시 Test"""
+    resolver = AsyncResolver(["127.0.0.1:9"], timeout=0.2, retries=0)
+    assert await resolver.resolve("127.0.0.1") == ["127.0.0.1"]
+    
+    resolver.remember("cached.example.com", ["10.0.0.1"])
+    assert await resolver.resolve("cached.example.com") == ["10.0.0.1"]
@@ -0,0 +1,122 @@
+import pytest
+import json
+from aiohttp import web
+from subsurfer.core.utils.stream_parse import iter_json_array, iter_lines
+from subsurfer.core.handler.passive.crtsh import CrtshScanner
+from subsurfer.core.handler.passive.webarchive import WebArchiveScanner
+
+TEST_DOMAIN = "example.com"
+
+async def _chunks(data: bytes, size: int):
+    """data를 size 바이트씩 나눠 반환"""
+    for i in range(0, len(data), size):
+        yield data[i:i + size]
+
+async def _start_server(path, body: bytes, chunk_size: int = 7):
+    """body를 작은 청크로 나눠 스트리밍하는 로컬 HTTP 서버"""
+    async def handler(request):
+        response = web.StreamResponse()
+        await response.prepare(request)
+        for i in range(0, len(body), chunk_size):
+            await response.write(body[i:i + chunk_size])
+        await response.write_eof()
+        return response
+    
+    app = web.Application()
+    app.router.add_get(path, handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    return runner, f"http://127.0.0.1:{port}"
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("size", [1, 5, 64, 1 << 20])
+async def test_iter_json_array_chunk_boundaries(size):
+    """청크 경계와 무관한 JSON 배열 요소 파싱 Test"""
+    items = [{"id": i, "name_value": f"a{i}.{TEST_DOMAIN}", "note": "한글 ],[ \"q\""} for i in range(30)]
+    data = json.dumps(items).encode()
+    assert [item async for item in iter_json_array(_chunks(data, size))] == items
+
+@pytest.mark.asyncio
+async def test_iter_json_array_truncated_and_non_array():
+    """잘린 배열과 배열이 아닌 응답 처리 Test"""
+    assert [item async for item in iter_json_array(_chunks(b'[{"a": 1}, {"b"', 3))] == [{"a": 1}]
+    assert [item async for item in iter_json_array(_chunks(b'{"error": "x"}', 4))] == [{"error": "x"}]
+    assert [item async for item in iter_json_array(_chunks(b'', 4))] == []
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("size", [1, 2, 3, 7])
+async def test_iter_json_array_scalars_and_escapes(size):
+    """청크 경계에서 잘린 숫자/리터럴과 이스케이프된 문자열 처리 Test"""
+    items = [12345, -1.5e10, True, None, "a\\\"],[{", {"k": ["x", {"y": "\\"}]}, [], 0]
+    data = json.dumps(items).encode()
+    assert [item async for item in iter_json_array(_chunks(data, size))] == items
+    # 숫자 중간에서 청크가 나뉘어도 완성된 값만 반환
+    assert [item async for item in iter_json_array(_chunks(b"[123" + b"45]", 4))] == [12345]
+    assert [item async for item in iter_json_array(_chunks(b"12345", 2))] == [12345]
+    # 닫히지 않은 배열은 본문 끝에서 완전한 마지막 값만 반환
+    assert [item async for item in iter_json_array(_chunks(b'[1, "ab', 2))] == [1]
+    assert [item async for item in iter_json_array(_chunks(b'[1, 2', 2))] == [1, 2]
+
+@pytest.mark.asyncio
+async def test_iter_json_array_large_element_scanned_once(monkeypatch):
+    """여러 청크에 걸친 큰 요소를 청크마다 처음부터 다시 파싱하지 않는지 Test"""
+    parsed = []
+    raw_decode = json.JSONDecoder.raw_decode
+    
+    # json.loads도 내부적으로 raw_decode 사용
+    def counting_raw_decode(self, text, idx=0):
+        parsed.append(len(text) - idx)
+        return raw_decode(self, text, idx)
+    
+    monkeypatch.setattr(json.JSONDecoder, "raw_decode", counting_raw_decode)
+    items = [{"name_value": "x" * 100_000}, {"name_value": "y"}]
+    data = json.dumps(items).encode()
+    assert [item async for item in iter_json_array(_chunks(data, 1024))] == items
+    # 청크마다 처음부터 다시 파싱하면 본문 크기의 수십 배를 파싱함
+    assert sum(parsed) < 3 * len(data)
+
+@pytest.mark.asyncio
+async def test_iter_lines():
+    """청크 경계에서 잘린 줄 처리 Test"""
+    lines = [line async for line in iter_lines(_chunks(b"a\r\nbb\n\nccc", 2))]
+    assert lines == ["a", "bb", "", "ccc"]
+
+@pytest.mark.asyncio
+async def test_crtsh_scanner_streams_response():
+    """crt.sh 응답 스트리밍 파싱 Test"""
+    entries = [
+        {"name_value": f"www.{TEST_DOMAIN}"},
+        {"name_value": f"*.{TEST_DOMAIN}"},
+        {"name_value": f"API.{TEST_DOMAIN}"},
+        {"name_value": f"mail.{TEST_DOMAIN}\n*.dev.{TEST_DOMAIN}\n{TEST_DOMAIN}"},
+        {"name_value": "other.org"},
+    ]
+    runner, base_url = await _start_server("/", json.dumps(entries).encode())
+    try:
+        scanner = CrtshScanner(TEST_DOMAIN, silent=True)
+        scanner.base_url = base_url
+        results = await scanner.scan()
+    finally:
+        await runner.cleanup()
+    assert results == {f"www.{TEST_DOMAIN}", f"api.{TEST_DOMAIN}", f"mail.{TEST_DOMAIN}", f"dev.{TEST_DOMAIN}"}
+
+@pytest.mark.asyncio
+async def test_webarchive_scanner_streams_cdx_lines():
+    """WebArchive 텍스트 CDX 스트리밍 파싱 Test"""
+    body = "\n".join([
+        f"http://www.{TEST_DOMAIN}:80/",
+        f"https://Shop.{TEST_DOMAIN}/cart?id=1",
+        f"http://{TEST_DOMAIN}/",
+        "",
+    ]).encode()
+    runner, base_url = await _start_server("/cdx", body)
+    try:
+        scanner = WebArchiveScanner(TEST_DOMAIN, silent=True)
+        scanner.base_url = f"{base_url}/cdx"
+        results = await scanner.scan()
+    finally:
+        await runner.cleanup()
+    assert results == {f"www.{TEST_DOMAIN}", f"shop.{TEST_DOMAIN}"}
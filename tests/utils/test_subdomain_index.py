@@ -0,0 +1,28 @@
+from subsurfer.core.utils.subdomain_index import SubdomainIndex
+
+NAMES = [
+    "example.com", "b.example.com", "a.example.com", "a-b.example.com",
+    "x.a.example.com", "y.x.a.example.com", "dev.example.com", "api.dev.example.com",
+    "devx.example.com", "a.example.com",
+]
+
+def test_subdomain_index_label_order():
+    """상위 이름 바로 뒤에 하위 이름이 오는 레이블 순 순회 Test"""
+    index = SubdomainIndex(NAMES)
+    assert len(index) == 9
+    assert list(index) == [
+        "example.com", "a.example.com", "x.a.example.com", "y.x.a.example.com",
+        "a-b.example.com", "b.example.com", "dev.example.com", "api.dev.example.com",
+        "devx.example.com",
+    ]
+    assert "x.a.example.com" in index
+    assert "z.example.com" not in index
+
+def test_subdomain_index_under():
+    """도메인 아래 이름 조회 Test (이름이 비슷한 형제 도메인은 제외)"""
+    index = SubdomainIndex(NAMES)
+    assert list(index.under("dev.example.com")) == ["api.dev.example.com"]
+    assert list(index.under("Dev.Example.com.", include_self=True)) == ["dev.example.com", "api.dev.example.com"]
+    assert list(index.under("a.example.com")) == ["x.a.example.com", "y.x.a.example.com"]
+    assert list(index.under("missing.example.com", include_self=True)) == []
+    assert len(list(index.under("example.com"))) == 8
@@ -0,0 +1,43 @@
+import os
+import pickle
+import pytest
+from Wappalyzer import Wappalyzer, WebPage
+from subsurfer.core.utils import wappalyzer_cache
+from subsurfer.core.utils.wappalyzer_cache import LazyPattern, load_wappalyzer
+
+HTML = '<html><script src="jquery-3.5.1.min.js"></script><meta name="generator" content="WordPress 6.1"></html>'
+
+@pytest.fixture(autouse=True)
+def reset_instance(monkeypatch):
+    monkeypatch.setattr(wappalyzer_cache, "_instance", None)
+
+def test_lazy_pattern_pickles_as_string():
+    """LazyPattern 피클링 및 지연 컴파일 Test"""
+    pattern = LazyPattern("(?i)jquery-([\\d.]+)")
+    assert pattern.search("JQUERY-3.5").group(1) == "3.5"
+    restored = pickle.loads(pickle.dumps(pattern))
+    assert '_compiled' not in restored.__dict__
+    assert restored.search("jquery-1.0")
+
+def test_load_wappalyzer_uses_disk_cache(tmp_path):
+    """룰셋 캐시 저장/로드 및 분석 결과 동일성 Test"""
+    first = load_wappalyzer(cache_dir=str(tmp_path))
+    assert os.path.exists(tmp_path / wappalyzer_cache.CACHE_FILENAME)
+    # 같은 프로세스에서는 같은 인스턴스 공유
+    assert load_wappalyzer(cache_dir=str(tmp_path)) is first
+    
+    wappalyzer_cache._instance = None
+    cached = load_wappalyzer(cache_dir=str(tmp_path))
+    assert cached is not first
+    
+    page = WebPage("https://example.com", HTML, {})
+    expected = Wappalyzer.latest().analyze_with_versions_and_categories(page)
+    assert cached.analyze_with_versions_and_categories(page) == expected
+    assert expected['jQuery']['versions'] == ['3.5.1']
+
+def test_load_wappalyzer_ignores_stale_cache(tmp_path):
+    """버전이 다른 캐시 무시 Test"""
+    path = tmp_path / wappalyzer_cache.CACHE_FILENAME
+    path.write_bytes(pickle.dumps({'version': 'old', 'categories': {}, 'technologies': {}}))
+    wappalyzer = load_wappalyzer(cache_dir=str(tmp_path))
+    assert wappalyzer.technologies
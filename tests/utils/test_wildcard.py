@@ -0,0 +1,45 @@
+import pytest
+import asyncio
+from subsurfer.core.utils.wildcard import WildcardFilter
+
+class _WildcardResolver:
+    """*.example.com 와일드카드가 있는 테스트용 리졸버"""
+    
+    def __init__(self):
+        self.queries = []
+        
+    async def query(self, name, rdtype='A'):
+        self.queries.append((name, rdtype))
+        await asyncio.sleep(0.01)
+        parent = name.partition('.')[2]
+        if rdtype == 'A' and parent in ("example.com", "dev.example.com"):
+            return ["10.0.0.9"]
+        return []
+
+@pytest.mark.asyncio
+async def test_wildcard_filter_matches_wildcard_answers():
+    """와일드카드 응답과 같은 주소로만 해석되는 이름 판별 Test"""
+    wildcard = WildcardFilter(_WildcardResolver(), "example.com")
+    assert await wildcard.is_wildcard("junk.example.com", ["10.0.0.9"])
+    assert await wildcard.is_wildcard("a.dev.example.com", ["10.0.0.9"])
+    assert not await wildcard.is_wildcard("www.example.com", ["10.0.0.5"])
+    assert not await wildcard.is_wildcard("www.example.com", ["10.0.0.5", "10.0.0.9"])
+    assert not await wildcard.is_wildcard("x.api.example.com", ["10.0.0.9"])
+    # 대상 도메인 자체와 범위 밖 이름은 검사하지 않음
+    assert not await wildcard.is_wildcard("example.com", ["10.0.0.9"])
+    assert not await wildcard.is_wildcard("www.other.org", ["10.0.0.9"])
+    assert not await wildcard.is_wildcard("junk.example.com", [])
+
+@pytest.mark.asyncio
+async def test_wildcard_filter_caches_per_parent():
+    """상위 도메인별 와일드카드 응답 캐시 및 동시 조회 공유 Test"""
+    resolver = _WildcardResolver()
+    wildcard = WildcardFilter(resolver, "example.com", probes=2)
+    results = await asyncio.gather(*(
+        wildcard.is_wildcard(f"n{i}.example.com", ["10.0.0.9"]) for i in range(20)
+    ))
+    assert all(results)
+    assert len(resolver.queries) == 2
+    assert wildcard.answers == {"example.com": frozenset({"10.0.0.9"})}
+    # 무작위 이름은 매번 다름
+    assert len({name for name, _ in resolver.queries}) == 2